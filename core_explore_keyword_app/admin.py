@@ -5,12 +5,24 @@ from django.contrib.admin.views.decorators import staff_member_required
 from django.urls import re_path
 
 from core_main_app.admin import core_admin_site
+from core_explore_keyword_app.components.keyword_term.admin_site import (
+    CustomKeywordTermAdmin,
+)
+from core_explore_keyword_app.components.keyword_term.models import (
+    KeywordTerm,
+)
 from core_explore_keyword_app.components.persistent_query_keyword.admin_site import (
     CustomPersistentQueryKeywordAdmin,
 )
 from core_explore_keyword_app.components.persistent_query_keyword.models import (
     PersistentQueryKeyword,
 )
+from core_explore_keyword_app.components.query_access.admin_site import (
+    CustomQueryAccessAdmin,
+)
+from core_explore_keyword_app.components.query_access.models import (
+    QueryAccess,
+)
 from core_explore_keyword_app.components.search_operator.admin_site import (
     CustomSearchOperatorAdmin,
 )
@@ -44,5 +56,7 @@ admin_urls = [
 
 admin.site.register(SearchOperator, CustomSearchOperatorAdmin)
 admin.site.register(PersistentQueryKeyword, CustomPersistentQueryKeywordAdmin)
+admin.site.register(KeywordTerm, CustomKeywordTermAdmin)
+admin.site.register(QueryAccess, CustomQueryAccessAdmin)
 urls = core_admin_site.get_urls()
 core_admin_site.get_urls = lambda: admin_urls + urls
@@ -21,3 +21,11 @@ class ExploreKeywordAppConfig(AppConfig):
         """
         if "migrate" not in sys.argv:
             discover.init_permissions(self.apps)
+
+            from core_explore_keyword_app.discover import (
+                init_periodic_tasks,
+                init_signals,
+            )
+
+            init_signals()
+            init_periodic_tasks()
@@ -0,0 +1,2 @@
+""" Keyword Term Component
+"""
@@ -0,0 +1,14 @@
+""" Custom admin site for the Keyword Term model
+"""
+from django.contrib import admin
+
+
+class CustomKeywordTermAdmin(admin.ModelAdmin):
+    """CustomKeywordTermAdmin"""
+
+    list_display = ["term", "template", "document_frequency"]
+    readonly_fields = ["term", "template", "document_frequency"]
+
+    def has_add_permission(self, request, obj=None):
+        """Prevent from manually adding Keyword Terms"""
+        return False
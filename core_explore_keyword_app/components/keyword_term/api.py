@@ -0,0 +1,122 @@
+""" Keyword Term API
+"""
+import logging
+from collections import Counter
+
+from django.db import transaction
+
+from core_main_app.components.data.models import Data
+from core_explore_keyword_app.components.keyword_term.models import (
+    KeywordTerm,
+)
+from core_explore_keyword_app.components.search_operator import (
+    api as search_operator_api,
+)
+from core_explore_keyword_app.utils.cache import bump_generation
+from core_explore_keyword_app.utils.suggestions import (
+    invalidate_suggestion_cache,
+)
+from core_explore_keyword_app.utils.term_dictionary import (
+    TERM_DICTIONARY_GENERATION,
+    get_document_terms,
+    get_path_values,
+)
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+
+def get_all():
+    """Return all the Keyword Terms.
+
+    Returns:
+    """
+    return KeywordTerm.get_all()
+
+
+def get_all_entries():
+    """Return all the Keyword Terms as (term, template id, frequency) tuples.
+
+    Returns:
+    """
+    return KeywordTerm.get_all_entries()
+
+
+def get_all_search_operator_entries():
+    """Return all the search operator values as (search operator id, value,
+    template id, frequency) tuples.
+
+    Returns:
+    """
+    return KeywordTerm.get_all_search_operator_entries()
+
+
+def get_indexed_data():
+    """Return the data used to build the term dictionary.
+
+    Only data from public workspaces is indexed, so suggestions never
+    disclose the content of private documents.
+
+    Returns:
+    """
+    return Data.objects.filter(workspace__is_public=True).order_by("pk")
+
+
+def rebuild():
+    """Rebuild the term dictionary and the search operator values from the
+    indexed data.
+
+    Returns:
+        int: number of keyword terms created
+    """
+    search_operators = [
+        (search_operator.id, search_operator.dot_notation_list)
+        for search_operator in search_operator_api.get_all()
+    ]
+    # (template id, search operator id) -> Counter
+    frequencies = dict()
+    for data in get_indexed_data().iterator(chunk_size=BATCH_SIZE):
+        try:
+            dict_content = data.get_dict_content()
+            data_terms = {None: get_document_terms(dict_content)}
+            for search_operator_id, dot_notation_list in search_operators:
+                data_terms[search_operator_id] = set().union(
+                    *(
+                        get_path_values(dict_content, dot_notation)
+                        for dot_notation in dot_notation_list
+                    )
+                )
+        except Exception as exception:
+            logger.warning(
+                "Unable to extract terms from data %s: %s",
+                str(data.id),
+                str(exception),
+            )
+            continue
+        for search_operator_id, terms in data_terms.items():
+            frequencies.setdefault(
+                (data.template_id, search_operator_id), Counter()
+            ).update(terms)
+
+    keyword_term_list = [
+        KeywordTerm(
+            term=term,
+            template_id=template_id,
+            search_operator_id=search_operator_id,
+            document_frequency=document_frequency,
+        )
+        for (
+            template_id,
+            search_operator_id,
+        ), template_frequencies in frequencies.items()
+        for term, document_frequency in template_frequencies.items()
+    ]
+    with transaction.atomic():
+        KeywordTerm.delete_all()
+        KeywordTerm.bulk_insert(keyword_term_list, batch_size=BATCH_SIZE)
+
+    # notify all processes that the dictionary changed
+    bump_generation(TERM_DICTIONARY_GENERATION)
+    invalidate_suggestion_cache()
+    return len(keyword_term_list)
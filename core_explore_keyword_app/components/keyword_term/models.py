@@ -0,0 +1,93 @@
+""" Keyword Term model
+"""
+from django.db import models
+
+from core_main_app.components.template.models import Template
+from core_explore_keyword_app.components.search_operator.models import (
+    SearchOperator,
+)
+
+
+class KeywordTerm(models.Model):
+    """Keyword Term model: document frequency of a term for a template
+
+    Terms linked to a search operator are the values found at the paths of
+    the operator, other terms are words found anywhere in the documents.
+    """
+
+    term = models.CharField(blank=False, max_length=200)
+    template = models.ForeignKey(
+        Template, blank=False, on_delete=models.CASCADE
+    )
+    search_operator = models.ForeignKey(
+        SearchOperator, blank=True, null=True, on_delete=models.CASCADE
+    )
+    document_frequency = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        """Meta"""
+
+        verbose_name = "Keyword Term"
+        verbose_name_plural = "Keyword Terms"
+        unique_together = ("term", "template", "search_operator")
+
+    @staticmethod
+    def get_all():
+        """Retrieve all keyword terms.
+
+        Returns:
+        """
+        return KeywordTerm.objects.all()
+
+    @staticmethod
+    def get_all_entries():
+        """Retrieve all keyword terms as (term, template id, frequency) tuples.
+
+        Returns:
+        """
+        return KeywordTerm.objects.filter(
+            search_operator__isnull=True
+        ).values_list("term", "template_id", "document_frequency")
+
+    @staticmethod
+    def get_all_search_operator_entries():
+        """Retrieve all search operator values as (search operator id, value,
+        template id, frequency) tuples.
+
+        Returns:
+        """
+        return KeywordTerm.objects.filter(
+            search_operator__isnull=False
+        ).values_list(
+            "search_operator_id", "term", "template_id", "document_frequency"
+        )
+
+    @staticmethod
+    def delete_all():
+        """Delete all keyword terms.
+
+        Returns:
+        """
+        KeywordTerm.objects.all().delete()
+
+    @staticmethod
+    def bulk_insert(keyword_term_list, batch_size=None):
+        """Insert a list of keyword terms.
+
+        Args:
+            keyword_term_list:
+            batch_size:
+
+        Returns:
+        """
+        return KeywordTerm.objects.bulk_create(
+            keyword_term_list, batch_size=batch_size
+        )
+
+    def __str__(self):
+        """Keyword Term object as string
+
+        Returns:
+
+        """
+        return self.term
@@ -0,0 +1,41 @@
+""" Persistent Query Keyword Access Control
+"""
+from django.contrib.auth.models import AnonymousUser, User
+
+from core_main_app.access_control.exceptions import AccessControlError
+
+
+def can_write_persistent_query_list(func, *args, **kwargs):
+    """Can user write all the persistent queries of a queryset.
+
+    Checks the owner of all the persistent queries with a single query.
+
+    Args:
+        func:
+        *args:
+        **kwargs:
+
+    Returns:
+
+    """
+    user = next(
+        (arg for arg in args if isinstance(arg, (User, AnonymousUser))),
+        None,
+    )
+    # Anonymous can not write existing queries
+    if user is None or user.is_anonymous:
+        raise AccessControlError(
+            "The user doesn't have enough rights to access these queries."
+        )
+
+    # Superuser can write any query
+    if user.is_superuser:
+        return func(*args, **kwargs)
+
+    # Owner can only write own queries
+    persistent_query_list = args[0]
+    if persistent_query_list.exclude(user_id=str(user.id)).exists():
+        raise AccessControlError(
+            "The user doesn't have enough rights to access these queries."
+        )
+    return func(*args, **kwargs)
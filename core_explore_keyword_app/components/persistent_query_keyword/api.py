@@ -1,5 +1,6 @@
 """ Persistent Query Keyword API
 """
+from django.utils import timezone
 
 from core_main_app.access_control.api import has_perm_administration
 from core_main_app.access_control.decorators import access_control
@@ -7,9 +8,15 @@ from core_explore_common_app.access_control.api import (
     can_read_persistent_query,
     can_write_persistent_query,
 )
+from core_explore_keyword_app.components.persistent_query_keyword.access_control import (
+    can_write_persistent_query_list,
+)
 from core_explore_keyword_app.components.persistent_query_keyword.models import (
     PersistentQueryKeyword,
 )
+from core_explore_keyword_app.components.query_access.api import (
+    LAST_ACCESS_DATE_RESOLUTION,
+)
 
 
 @access_control(can_write_persistent_query)
@@ -53,6 +60,27 @@ def get_by_name(persistent_query_keyword_name, user):
     return PersistentQueryKeyword.get_by_name(persistent_query_keyword_name)
 
 
+def record_access(persistent_query_keyword):
+    """Record an access to the Persistent Query Keyword
+
+    Named persistent queries are never cleaned up, their accesses are not
+    recorded.
+
+    Args:
+        persistent_query_keyword:
+
+    Returns:
+
+    """
+    if persistent_query_keyword.name is not None:
+        return
+    PersistentQueryKeyword.set_last_access_date(
+        persistent_query_keyword.id,
+        timezone.now(),
+        resolution=LAST_ACCESS_DATE_RESOLUTION,
+    )
+
+
 @access_control(can_write_persistent_query)
 def delete(persistent_query_keyword, user):
     """Deletes the Persistent Query Keyword
@@ -64,6 +92,21 @@ def delete(persistent_query_keyword, user):
     persistent_query_keyword.delete()
 
 
+@access_control(can_write_persistent_query_list)
+def delete_list(persistent_query_keyword_list, user):
+    """Deletes all the Persistent Query Keyword of a queryset
+
+    Args:
+        persistent_query_keyword_list:
+        user:
+
+    Returns:
+        int: number of deleted Persistent Query Keyword
+    """
+    _, deleted_counts = persistent_query_keyword_list.delete()
+    return deleted_counts.get(PersistentQueryKeyword._meta.label, 0)
+
+
 @access_control(can_write_persistent_query)
 def set_name(persistent_query_keyword, name, user):
     """Set name to Persistent Query Keyword
@@ -87,6 +130,21 @@ def get_all(user):
     return PersistentQueryKeyword.get_all()
 
 
+@access_control(can_read_persistent_query)
+def get_all_by_filters(user, ids=None, user_id=None, created_before=None):
+    """get Persistent Query Keyword matching all the given filters
+
+    Args:
+        user:
+        ids:
+        user_id:
+        created_before:
+    """
+    return PersistentQueryKeyword.get_all_by_filters(
+        ids=ids, user_id=user_id, created_before=created_before
+    )
+
+
 @access_control(can_read_persistent_query)
 def get_all_by_user(user):
     """get persistent Query Keyword by user
@@ -1,6 +1,12 @@
 """ Persistent Query Keyword model
 """
+import hashlib
+import json
+
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import models
+from django.db.models import Q
+from django.db.models.functions import Coalesce
 
 from core_explore_common_app.components.abstract_persistent_query.models import (
     AbstractPersistentQuery,
@@ -8,14 +14,113 @@ from core_explore_common_app.components.abstract_persistent_query.models import
 from core_main_app.commons import exceptions
 
 
+def load_content(content):
+    """Parse the JSON content of a query.
+
+    Args:
+        content:
+
+    Returns:
+        dict, or None if content is not valid JSON
+    """
+    if content is None:
+        return None
+    try:
+        return json.loads(content)
+    except (TypeError, ValueError):
+        return None
+
+
+def get_content_hash(content_json):
+    """Return the hash of the parsed content of a query.
+
+    Args:
+        content_json:
+
+    Returns:
+        str, or None if there is no parsed content
+    """
+    if content_json is None:
+        return None
+    return hashlib.sha256(
+        json.dumps(content_json, sort_keys=True, separators=(",", ":")).encode(
+            "utf-8"
+        )
+    ).hexdigest()
+
+
 class PersistentQueryKeyword(AbstractPersistentQuery):
     """Persistent Query Keyword"""
 
+    # parsed copy of content, kept in sync on save
+    content_json = models.JSONField(blank=True, null=True, editable=False)
+    # hash of content_json, indexed to find the same query
+    content_hash = models.CharField(
+        max_length=64, blank=True, null=True, editable=False
+    )
+    # last time the persistent query was opened, None if never opened
+    last_access_date = models.DateTimeField(
+        blank=True, null=True, editable=False
+    )
+
     class Meta:
         """Meta"""
 
         verbose_name = "Persistent Query by Keyword"
         verbose_name_plural = "Persistent Queries by Keyword"
+        indexes = [
+            # user lookups, and user listings ordered by creation date
+            models.Index(
+                fields=["user_id", "creation_date"],
+                name="persistent_kw_user_date_idx",
+            ),
+            # lookups by query content
+            models.Index(
+                fields=["content_hash"],
+                name="persistent_kw_content_hash_idx",
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        """Save the persistent query, and the parsed copy of its content.
+
+        Args:
+            *args:
+            **kwargs:
+
+        Returns:
+
+        """
+        self.set_content_json()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "content" in update_fields:
+            kwargs["update_fields"] = set(update_fields) | {
+                "content_json",
+                "content_hash",
+            }
+        super().save(*args, **kwargs)
+
+    def set_content_json(self):
+        """Set the parsed copy of the content, and its hash.
+
+        Returns:
+
+        """
+        self.content_json = load_content(self.content)
+        self.content_hash = get_content_hash(self.content_json)
+
+    def get_content_json(self):
+        """Return the parsed content of the persistent query.
+
+        Persistent queries saved before content_json was added are parsed
+        from their text content.
+
+        Returns:
+
+        """
+        if self.content_json is None:
+            return load_content(self.content)
+        return self.content_json
 
     @staticmethod
     def get_by_id(query_id):
@@ -51,6 +156,32 @@ class PersistentQueryKeyword(AbstractPersistentQuery):
         except Exception as exception:
             raise exceptions.ModelError(str(exception))
 
+    @staticmethod
+    def get_unnamed_by_content(user_id, content_json, template_ids):
+        """Return an unnamed persistent query Keyword of a user, with the
+        given parsed content and templates.
+
+        Args:
+            user_id:
+            content_json:
+            template_ids:
+
+        Returns:
+            PersistentQueryKeyword, or None if there is none
+        """
+        template_ids = set(template_ids)
+        for persistent_query in PersistentQueryKeyword.objects.filter(
+            user_id=str(user_id),
+            name__isnull=True,
+            content_hash=get_content_hash(content_json),
+            content_json=content_json,
+        ).prefetch_related("templates"):
+            if {
+                template.id for template in persistent_query.templates.all()
+            } == template_ids:
+                return persistent_query
+        return None
+
     @staticmethod
     def get_all():
         """Return all persistent query Keyword.
@@ -72,6 +203,68 @@ class PersistentQueryKeyword(AbstractPersistentQuery):
         """
         return PersistentQueryKeyword.objects.filter(user_id=str(user_id))
 
+    @staticmethod
+    def get_all_by_filters(ids=None, user_id=None, created_before=None):
+        """Return the persistent query Keyword matching all the given filters.
+
+        Args:
+            ids: list of ids
+            user_id:
+            created_before: datetime
+
+        Returns:
+
+        """
+        queryset = PersistentQueryKeyword.objects.all()
+        if ids is not None:
+            queryset = queryset.filter(pk__in=ids)
+        if user_id is not None:
+            queryset = queryset.filter(user_id=str(user_id))
+        if created_before is not None:
+            queryset = queryset.filter(creation_date__lt=created_before)
+        return queryset
+
+    @staticmethod
+    def get_all_unused_since(date):
+        """Return the persistent query Keyword not opened since a date.
+
+        Persistent queries never opened are unused since their creation.
+
+        Args:
+            date: datetime
+
+        Returns:
+
+        """
+        return PersistentQueryKeyword.objects.alias(
+            last_use_date=Coalesce("last_access_date", "creation_date")
+        ).filter(last_use_date__lt=date)
+
+    @staticmethod
+    def set_last_access_date(
+        persistent_query_id, last_access_date, resolution=None
+    ):
+        """Set the last access date of a persistent query Keyword.
+
+        Args:
+            persistent_query_id:
+            last_access_date:
+            resolution: timedelta, keep a last access date more recent than
+                last_access_date - resolution
+
+        Returns:
+
+        """
+        queryset = PersistentQueryKeyword.objects.filter(
+            pk=persistent_query_id
+        )
+        if resolution is not None:
+            queryset = queryset.filter(
+                Q(last_access_date__isnull=True)
+                | Q(last_access_date__lt=last_access_date - resolution)
+            )
+        queryset.update(last_access_date=last_access_date)
+
     @staticmethod
     def get_none():
         """Return None object, used by data.
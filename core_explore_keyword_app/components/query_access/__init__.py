@@ -0,0 +1,2 @@
+""" Query Access Component
+"""
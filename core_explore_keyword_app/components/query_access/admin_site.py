@@ -0,0 +1,14 @@
+""" Custom admin site for the Query Access model
+"""
+from django.contrib import admin
+
+
+class CustomQueryAccessAdmin(admin.ModelAdmin):
+    """CustomQueryAccessAdmin"""
+
+    list_display = ["query", "last_access_date"]
+    readonly_fields = ["query", "last_access_date"]
+
+    def has_add_permission(self, request, obj=None):
+        """Prevent from manually adding Query Accesses"""
+        return False
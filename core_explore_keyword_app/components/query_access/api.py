@@ -0,0 +1,29 @@
+""" Query Access API
+"""
+from datetime import timedelta
+
+from django.utils import timezone
+
+from core_explore_keyword_app.components.query_access.models import (
+    QueryAccess,
+)
+
+# retention periods are counted in days, one write a day per query is enough
+LAST_ACCESS_DATE_RESOLUTION = timedelta(days=1)
+
+
+def record_access(query):
+    """Record an access to a query of the keyword search.
+
+    Args:
+        query:
+
+    Returns:
+    """
+    now = timezone.now()
+    last_access_date = QueryAccess.get_last_access_date(query.id)
+    if (
+        last_access_date is None
+        or last_access_date < now - LAST_ACCESS_DATE_RESOLUTION
+    ):
+        QueryAccess.set_last_access_date(query.id, now)
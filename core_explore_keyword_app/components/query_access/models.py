@@ -0,0 +1,64 @@
+""" Query Access model
+"""
+from django.db import models
+from django.utils import timezone
+
+from core_explore_common_app.components.query.models import Query
+
+
+class QueryAccess(models.Model):
+    """Query Access model: last access to a query of the keyword search
+
+    Only the queries of the keyword search have a query access, the cleanup
+    leaves the queries of the other explore apps alone.
+    """
+
+    query = models.OneToOneField(
+        Query,
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="keyword_query_access",
+    )
+    last_access_date = models.DateTimeField(
+        default=timezone.now, db_index=True
+    )
+
+    class Meta:
+        """Meta"""
+
+        verbose_name = "Query Access"
+        verbose_name_plural = "Query Accesses"
+
+    @staticmethod
+    def get_last_access_date(query_id):
+        """Return the last access date of a query.
+
+        Args:
+            query_id:
+
+        Returns:
+            datetime, or None if the query was never accessed
+        """
+        return (
+            QueryAccess.objects.filter(query_id=query_id)
+            .values_list("last_access_date", flat=True)
+            .first()
+        )
+
+    @staticmethod
+    def set_last_access_date(query_id, last_access_date):
+        """Set the last access date of a query.
+
+        Args:
+            query_id:
+            last_access_date:
+
+        Returns:
+        """
+        if not QueryAccess.objects.filter(query_id=query_id).update(
+            last_access_date=last_access_date
+        ):
+            QueryAccess.objects.get_or_create(
+                query_id=query_id,
+                defaults={"last_access_date": last_access_date},
+            )
@@ -0,0 +1,112 @@
+""" Auto discovery of explore keyword app.
+"""
+import logging
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models.signals import post_save, post_delete
+from django_celery_beat.models import CrontabSchedule, PeriodicTask
+
+from core_explore_keyword_app.components.search_operator.models import (
+    SearchOperator,
+)
+from core_explore_keyword_app.settings import (
+    EXPLORE_KEYWORD_QUERY_RETENTION_DAYS,
+    EXPLORE_KEYWORD_TERM_DICTIONARY_ENABLED,
+)
+from core_explore_keyword_app.tasks import (
+    cleanup_queries,
+    rebuild_keyword_terms,
+)
+from core_explore_keyword_app.utils.query_cleanup import (
+    get_persistent_query_retention_days,
+)
+from core_explore_keyword_app.utils.search_operator_registry import (
+    invalidate_search_operator_registry,
+)
+from core_explore_keyword_app.utils.suggestions import (
+    invalidate_suggestion_cache,
+)
+from core_explore_keyword_app.utils.template_catalogue import (
+    invalidate_template_catalogue,
+)
+from core_main_app.components.data.models import Data
+from core_main_app.components.template.models import Template
+from core_main_app.components.template_version_manager.models import (
+    TemplateVersionManager,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _init_periodic_task(task, hour, minute=0):
+    """Create a periodic task and add it to a crontab schedule
+
+    Args:
+        task:
+        hour:
+        minute:
+
+    Returns:
+    """
+    try:
+        schedule, _ = CrontabSchedule.objects.get_or_create(
+            hour=hour,
+            minute=minute,
+        )
+        PeriodicTask.objects.get(name=task.__name__)
+    except ObjectDoesNotExist:
+        PeriodicTask.objects.create(
+            crontab=schedule,
+            name=task.__name__,
+            task="core_explore_keyword_app.tasks.%s" % task.__name__,
+        )
+    except Exception as exception:
+        logger.error(str(exception))
+
+
+def init_periodic_tasks():
+    """Create periodic tasks for the app and add them to a crontab schedule"""
+    if EXPLORE_KEYWORD_TERM_DICTIONARY_ENABLED:
+        _init_periodic_task(rebuild_keyword_terms, hour=1)
+    if (
+        EXPLORE_KEYWORD_QUERY_RETENTION_DAYS is not None
+        or get_persistent_query_retention_days() is not None
+    ):
+        _init_periodic_task(cleanup_queries, hour=2)
+
+
+def init_signals():
+    """Connect the caches of the app to the signals of the models they depend on"""
+    post_save.connect(
+        invalidate_suggestion_cache,
+        sender=Data,
+        dispatch_uid="core_explore_keyword_app_data_saved",
+    )
+    post_delete.connect(
+        invalidate_suggestion_cache,
+        sender=Data,
+        dispatch_uid="core_explore_keyword_app_data_deleted",
+    )
+    post_save.connect(
+        invalidate_search_operator_registry,
+        sender=SearchOperator,
+        dispatch_uid="core_explore_keyword_app_search_operator_saved",
+    )
+    post_delete.connect(
+        invalidate_search_operator_registry,
+        sender=SearchOperator,
+        dispatch_uid="core_explore_keyword_app_search_operator_deleted",
+    )
+    for sender in (TemplateVersionManager, Template):
+        post_save.connect(
+            invalidate_template_catalogue,
+            sender=sender,
+            dispatch_uid="core_explore_keyword_app_%s_saved"
+            % sender.__name__.lower(),
+        )
+        post_delete.connect(
+            invalidate_template_catalogue,
+            sender=sender,
+            dispatch_uid="core_explore_keyword_app_%s_deleted"
+            % sender.__name__.lower(),
+        )
@@ -3,10 +3,10 @@
 from django import forms
 from django.core.exceptions import ValidationError
 
-from core_main_app.commons.exceptions import QueryError
-from core_main_app.components.template_version_manager import (
-    api as template_version_manager_api,
+from core_explore_keyword_app.utils.template_catalogue import (
+    get_template_choices,
 )
+from core_main_app.commons.exceptions import QueryError
 from core_main_app.utils.query.mongo.prepare import sanitize_value
 
 
@@ -16,7 +16,7 @@ class KeywordForm(forms.Form):
     """
 
     keywords = forms.CharField(widget=forms.TextInput(), required=False)
-    query_id = forms.CharField(widget=forms.HiddenInput())
+    query_id = forms.CharField(widget=forms.HiddenInput(), required=False)
     user_id = forms.CharField(widget=forms.HiddenInput())
     global_templates = forms.MultipleChoiceField(
         widget=forms.CheckboxSelectMultiple(), required=False
@@ -27,6 +27,8 @@ class KeywordForm(forms.Form):
     order_by_field = forms.CharField(
         required=False, widget=forms.HiddenInput()
     )
+    # set by the search bar embedded in other pages
+    embedded = forms.BooleanField(required=False, widget=forms.HiddenInput())
 
     def __init__(self, *args, **kwargs):
         """Init Keyword form"""
@@ -34,18 +36,7 @@ class KeywordForm(forms.Form):
         super().__init__(*args, **kwargs)
 
         # initialize template filters
-        global_templates = [
-            (template_version_manager.id, template_version_manager.title)
-            for template_version_manager in template_version_manager_api.get_active_global_version_manager(
-                request=request
-            )
-        ]
-        user_templates = [
-            (template_version_manager.id, template_version_manager.title)
-            for template_version_manager in template_version_manager_api.get_active_version_manager_by_user_id(
-                request=request
-            )
-        ]
+        global_templates, user_templates = get_template_choices(request)
         self.fields["global_templates"].choices = global_templates
         self.fields["user_templates"].choices = user_templates
 
@@ -0,0 +1,75 @@
+""" Delete the expired queries
+"""
+from django.core.management.base import BaseCommand
+
+from core_explore_keyword_app.settings import (
+    EXPLORE_KEYWORD_CLEANUP_BATCH_SIZE,
+    EXPLORE_KEYWORD_QUERY_RETENTION_DAYS,
+)
+from core_explore_keyword_app.utils import query_cleanup
+
+
+class Command(BaseCommand):
+    """Delete the expired queries and the stale persistent queries"""
+
+    help = (
+        "Delete the unreferenced queries and the unnamed persistent queries "
+        "by keyword not used for the retention periods."
+    )
+
+    def add_arguments(self, parser):
+        """Add the arguments of the command
+
+        Args:
+            parser:
+
+        Returns:
+
+        """
+        parser.add_argument(
+            "--query-retention-days",
+            type=int,
+            default=EXPLORE_KEYWORD_QUERY_RETENTION_DAYS,
+            help="Delete the queries not accessed for this number of days.",
+        )
+        parser.add_argument(
+            "--persistent-query-retention-days",
+            type=int,
+            default=query_cleanup.get_persistent_query_retention_days(),
+            help="Delete the unnamed persistent queries not used for this "
+            "number of days (shared links stop working).",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=EXPLORE_KEYWORD_CLEANUP_BATCH_SIZE,
+            help="Maximum number of rows deleted per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        """Run the command
+
+        Args:
+            *args:
+            **options:
+
+        Returns:
+
+        """
+        report = query_cleanup.cleanup_queries(
+            query_retention_days=options["query_retention_days"],
+            persistent_query_retention_days=options[
+                "persistent_query_retention_days"
+            ],
+            batch_size=options["batch_size"],
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                "%d queries and %d persistent queries deleted in %.2fs."
+                % (
+                    report["queries"],
+                    report["persistent_queries"],
+                    report["elapsed"],
+                )
+            )
+        )
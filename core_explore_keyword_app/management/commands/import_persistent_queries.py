@@ -0,0 +1,98 @@
+""" Import persistent queries by keyword
+"""
+import gzip
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core_explore_keyword_app.settings import (
+    EXPLORE_KEYWORD_PERSISTENT_QUERY_IMPORT_BATCH_SIZE,
+)
+from core_explore_keyword_app.utils.persistent_query_import import (
+    import_persistent_queries,
+)
+
+
+def iter_ndjson_file(file):
+    """Iterate over the items of a newline delimited JSON file.
+
+    Blank lines are skipped, lines that are not valid JSON are returned as
+    None so that they are reported as invalid rows.
+
+    Args:
+        file:
+
+    Returns:
+    """
+    for line in file:
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield None
+
+
+class Command(BaseCommand):
+    """Import persistent queries by keyword from an export file"""
+
+    help = (
+        "Import persistent queries by keyword from a newline delimited JSON "
+        "file, as produced by the export, optionally gzipped."
+    )
+
+    def add_arguments(self, parser):
+        """Add the arguments of the command
+
+        Args:
+            parser:
+
+        Returns:
+
+        """
+        parser.add_argument(
+            "path",
+            help="Path of the .ndjson or .ndjson.gz file to import.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=EXPLORE_KEYWORD_PERSISTENT_QUERY_IMPORT_BATCH_SIZE,
+            help="Number of persistent queries inserted per transaction.",
+        )
+
+    def handle(self, *args, **options):
+        """Run the command
+
+        Args:
+            *args:
+            **options:
+
+        Returns:
+
+        """
+        path = options["path"]
+        open_file = gzip.open if path.endswith(".gz") else open
+        try:
+            with open_file(path, "rt", encoding="utf-8") as file:
+                report = import_persistent_queries(
+                    iter_ndjson_file(file), batch_size=options["batch_size"]
+                )
+        except OSError as exception:
+            raise CommandError(str(exception))
+
+        for error in report["errors"]:
+            self.stderr.write(
+                "Row %d: %s"
+                % (error["index"] + 1, json.dumps(error["errors"]))
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                "%d persistent queries imported, %d rows rejected in %.2fs."
+                % (
+                    report["created"],
+                    len(report["errors"]),
+                    report["elapsed"],
+                )
+            )
+        )
@@ -0,0 +1,28 @@
+""" Rebuild the keyword term dictionary
+"""
+from django.core.management.base import BaseCommand
+
+from core_explore_keyword_app.components.keyword_term import (
+    api as keyword_term_api,
+)
+
+
+class Command(BaseCommand):
+    """Rebuild the keyword term dictionary from the indexed data"""
+
+    help = "Rebuild the term dictionary used by the keyword suggestions."
+
+    def handle(self, *args, **options):
+        """Run the command
+
+        Args:
+            *args:
+            **options:
+
+        Returns:
+
+        """
+        count = keyword_term_api.rebuild()
+        self.stdout.write(
+            self.style.SUCCESS("%d keyword terms indexed." % count)
+        )
@@ -0,0 +1,46 @@
+""" Migrations
+ """
+# Generated by Django 4.2.30 on 2026-10-18 06:35
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    """Migration"""
+
+    dependencies = [
+        ("core_main_app", "0009_template_formats"),
+        ("core_explore_keyword_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="KeywordTerm",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("term", models.CharField(max_length=200)),
+                ("document_frequency", models.PositiveIntegerField(default=0)),
+                (
+                    "template",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="core_main_app.template",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Keyword Term",
+                "verbose_name_plural": "Keyword Terms",
+                "unique_together": {("term", "template")},
+            },
+        ),
+    ]
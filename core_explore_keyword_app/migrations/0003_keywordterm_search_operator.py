@@ -0,0 +1,36 @@
+""" Migrations
+ """
+# Generated by Django 4.2.30 on 2026-10-18 06:44
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+    """Migration"""
+
+    dependencies = [
+        ("core_main_app", "0009_template_formats"),
+        ("core_explore_keyword_app", "0002_keywordterm"),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name="keywordterm",
+            unique_together=set(),
+        ),
+        migrations.AddField(
+            model_name="keywordterm",
+            name="search_operator",
+            field=models.ForeignKey(
+                blank=True,
+                null=True,
+                on_delete=django.db.models.deletion.CASCADE,
+                to="core_explore_keyword_app.searchoperator",
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="keywordterm",
+            unique_together={("term", "template", "search_operator")},
+        ),
+    ]
@@ -0,0 +1,61 @@
+""" Migrations
+ """
+# Generated by Django 4.2.30 on 2026-10-18 06:49
+import json
+
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def fill_content_json(apps, schema_editor):
+    """Parse the content of the existing persistent queries
+
+    Args:
+        apps:
+        schema_editor:
+
+    Returns:
+
+    """
+    persistent_query_keyword_model = apps.get_model(
+        "core_explore_keyword_app", "PersistentQueryKeyword"
+    )
+    persistent_query_list = []
+    for persistent_query in (
+        persistent_query_keyword_model.objects.filter(content__isnull=False)
+        .only("id", "content")
+        .iterator(chunk_size=BATCH_SIZE)
+    ):
+        try:
+            persistent_query.content_json = json.loads(
+                persistent_query.content
+            )
+        except ValueError:
+            continue
+        persistent_query_list.append(persistent_query)
+        if len(persistent_query_list) >= BATCH_SIZE:
+            persistent_query_keyword_model.objects.bulk_update(
+                persistent_query_list, ["content_json"]
+            )
+            persistent_query_list = []
+    persistent_query_keyword_model.objects.bulk_update(
+        persistent_query_list, ["content_json"]
+    )
+
+
+class Migration(migrations.Migration):
+    """Migration"""
+
+    dependencies = [
+        ("core_explore_keyword_app", "0003_keywordterm_search_operator"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="persistentquerykeyword",
+            name="content_json",
+            field=models.JSONField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunPython(fill_content_json, migrations.RunPython.noop),
+    ]
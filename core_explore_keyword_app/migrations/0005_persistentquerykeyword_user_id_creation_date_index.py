@@ -0,0 +1,26 @@
+""" Migrations
+ """
+# Generated by Django 4.2.30 on 2026-10-18 06:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    """Migration"""
+
+    dependencies = [
+        (
+            "core_explore_keyword_app",
+            "0004_persistentquerykeyword_content_json",
+        ),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="persistentquerykeyword",
+            index=models.Index(
+                fields=["user_id", "creation_date"],
+                name="persistent_kw_user_date_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,52 @@
+""" Migrations
+ """
+# Generated by Django 4.2.30 on 2026-10-18 07:25
+
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+    """Migration"""
+
+    dependencies = [
+        ("core_explore_common_app", "0003_rename_xml_content_result_content"),
+        (
+            "core_explore_keyword_app",
+            "0005_persistentquerykeyword_user_id_creation_date_index",
+        ),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QueryAccess",
+            fields=[
+                (
+                    "query",
+                    models.OneToOneField(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        primary_key=True,
+                        related_name="keyword_query_access",
+                        serialize=False,
+                        to="core_explore_common_app.query",
+                    ),
+                ),
+                (
+                    "last_access_date",
+                    models.DateTimeField(
+                        db_index=True, default=django.utils.timezone.now
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Query Access",
+                "verbose_name_plural": "Query Accesses",
+            },
+        ),
+        migrations.AddField(
+            model_name="persistentquerykeyword",
+            name="last_access_date",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,74 @@
+""" Migrations
+ """
+# Generated by Django 4.2.30 on 2026-10-18 07:38
+import hashlib
+import json
+
+from django.db import migrations, models
+
+BATCH_SIZE = 1000
+
+
+def fill_content_hash(apps, schema_editor):
+    """Hash the parsed content of the existing persistent queries
+
+    Args:
+        apps:
+        schema_editor:
+
+    Returns:
+
+    """
+    persistent_query_keyword_model = apps.get_model(
+        "core_explore_keyword_app", "PersistentQueryKeyword"
+    )
+    persistent_query_list = []
+    for persistent_query in (
+        persistent_query_keyword_model.objects.filter(
+            content_json__isnull=False
+        )
+        .only("id", "content_json")
+        .iterator(chunk_size=BATCH_SIZE)
+    ):
+        persistent_query.content_hash = hashlib.sha256(
+            json.dumps(
+                persistent_query.content_json,
+                sort_keys=True,
+                separators=(",", ":"),
+            ).encode("utf-8")
+        ).hexdigest()
+        persistent_query_list.append(persistent_query)
+        if len(persistent_query_list) >= BATCH_SIZE:
+            persistent_query_keyword_model.objects.bulk_update(
+                persistent_query_list, ["content_hash"]
+            )
+            persistent_query_list = []
+    persistent_query_keyword_model.objects.bulk_update(
+        persistent_query_list, ["content_hash"]
+    )
+
+
+class Migration(migrations.Migration):
+    """Migration"""
+
+    dependencies = [
+        ("core_explore_keyword_app", "0006_query_access_last_access_date"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="persistentquerykeyword",
+            name="content_hash",
+            field=models.CharField(
+                blank=True, editable=False, max_length=64, null=True
+            ),
+        ),
+        migrations.RunPython(fill_content_hash, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="persistentquerykeyword",
+            index=models.Index(
+                fields=["content_hash"],
+                name="persistent_kw_content_hash_idx",
+            ),
+        ),
+    ]
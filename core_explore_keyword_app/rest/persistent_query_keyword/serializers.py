@@ -1,6 +1,17 @@
 """ Serializers used for the persistent query keyword REST API.
 """
-from rest_framework.serializers import ModelSerializer
+from collections import defaultdict
+from itertools import islice
+
+from rest_framework.serializers import (
+    CharField,
+    DateTimeField,
+    IntegerField,
+    ListField,
+    ModelSerializer,
+    Serializer,
+    ValidationError,
+)
 
 from core_explore_keyword_app.components.persistent_query_keyword import (
     api as persistent_query_keyword_api,
@@ -9,6 +20,90 @@ from core_explore_keyword_app.components.persistent_query_keyword.models import
     PersistentQueryKeyword,
 )
 
+# fields of the list representation, templates excluded
+LIST_FIELDS = ("id", "user_id", "content", "name")
+# number of ids per templates query
+TEMPLATES_BATCH_SIZE = 500
+
+
+def _get_templates_by_persistent_query(persistent_query_ids):
+    """Return the template ids of each persistent query keyword.
+
+    Args:
+        persistent_query_ids:
+
+    Returns:
+        dict: persistent query keyword id -> list of template ids
+    """
+    templates = defaultdict(list)
+    through_model = PersistentQueryKeyword.templates.through
+    for index in range(0, len(persistent_query_ids), TEMPLATES_BATCH_SIZE):
+        for persistent_query_id, template_id in (
+            through_model.objects.filter(
+                persistentquerykeyword_id__in=persistent_query_ids[
+                    index : index + TEMPLATES_BATCH_SIZE
+                ]
+            )
+            .order_by("id")
+            .values_list("persistentquerykeyword_id", "template_id")
+        ):
+            templates[persistent_query_id].append(template_id)
+    return templates
+
+
+def serialize_persistent_query_keyword_list(rows):
+    """Serialize a list of persistent query keyword, read-only.
+
+    Builds the same representation as the model serializers from values()
+    rows, with one query per batch of persistent queries for the templates
+    instead of one query per persistent query.
+
+    Args:
+        rows: queryset, or list of dicts with the LIST_FIELDS keys
+
+    Returns:
+        list
+    """
+    if hasattr(rows, "values"):
+        rows = rows.values(*LIST_FIELDS)
+    rows = list(rows)
+    templates = _get_templates_by_persistent_query([row["id"] for row in rows])
+    return [
+        {
+            "id": row["id"],
+            "user_id": row["user_id"],
+            "content": row["content"],
+            "templates": templates.get(row["id"], []),
+            "name": row["name"],
+        }
+        for row in rows
+    ]
+
+
+def iter_persistent_query_keyword_list(queryset, chunk_size):
+    """Serialize a queryset of persistent query keyword, chunk by chunk.
+
+    Only one chunk of rows is held in memory at a time. Items also contain
+    the creation date of the persistent queries.
+
+    Args:
+        queryset:
+        chunk_size:
+
+    Returns:
+    """
+    rows = queryset.values(*LIST_FIELDS, "creation_date").iterator(
+        chunk_size=chunk_size
+    )
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            return
+        creation_dates = {row["id"]: row["creation_date"] for row in chunk}
+        for item in serialize_persistent_query_keyword_list(chunk):
+            item["creation_date"] = creation_dates[item["id"]]
+            yield item
+
 
 class PersistentQueryKeywordSerializer(ModelSerializer):
     """persistent query keyword serializer"""
@@ -82,3 +177,25 @@ class PersistentQueryKeywordAdminSerializer(ModelSerializer):
         if "templates" in validated_data:
             persistent_query_keyword.templates.set(validated_data["templates"])
         return persistent_query_keyword
+
+
+class PersistentQueryKeywordDeleteListSerializer(Serializer):
+    """Filters of the persistent query keyword to delete"""
+
+    ids = ListField(child=IntegerField(), required=False)
+    user_id = CharField(required=False)
+    older_than = DateTimeField(required=False)
+
+    def validate(self, attrs):
+        """Require at least one filter, to never delete everything by mistake.
+
+        Args:
+            attrs:
+
+        Returns:
+        """
+        if not attrs:
+            raise ValidationError(
+                "At least one of ids, user_id or older_than is required."
+            )
+        return attrs
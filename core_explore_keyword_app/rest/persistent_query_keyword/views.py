@@ -1,6 +1,7 @@
 """ REST views for the persistent query keyword.
 """
 from django.db import IntegrityError
+from django.http import StreamingHttpResponse
 from rest_framework import status
 from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAdminUser, IsAuthenticated
@@ -12,9 +13,50 @@ from core_main_app.commons import exceptions
 
 import core_explore_keyword_app.components.persistent_query_keyword.api as persistent_query_keyword_api
 from core_explore_keyword_app.rest.persistent_query_keyword.serializers import (
+    LIST_FIELDS,
     PersistentQueryKeywordSerializer,
     PersistentQueryKeywordAdminSerializer,
+    PersistentQueryKeywordDeleteListSerializer,
+    iter_persistent_query_keyword_list,
+    serialize_persistent_query_keyword_list,
 )
+from core_explore_keyword_app.settings import (
+    EXPLORE_KEYWORD_PERSISTENT_QUERY_EXPORT_CHUNK_SIZE,
+    EXPLORE_KEYWORD_PERSISTENT_QUERY_IMPORT_BATCH_SIZE,
+)
+from core_explore_keyword_app.utils.pagination import (
+    KeysetPagination,
+    is_pagination_disabled,
+)
+from core_explore_keyword_app.utils.persistent_query_import import (
+    import_persistent_queries,
+)
+from core_explore_keyword_app.utils.streaming import iter_gzip, iter_ndjson
+
+
+def get_list_response(request, object_list):
+    """Serialize a list of persistent query keyword, one page at a time
+    unless the request disables the pagination
+
+    Args:
+        request:
+        object_list:
+
+    Returns:
+    """
+    if is_pagination_disabled(request):
+        return Response(
+            serialize_persistent_query_keyword_list(object_list),
+            status=status.HTTP_200_OK,
+        )
+
+    paginator = KeysetPagination()
+    page = paginator.paginate_queryset(
+        object_list.values(*LIST_FIELDS, "creation_date"), request
+    )
+    return paginator.get_paginated_response(
+        serialize_persistent_query_keyword_list(page)
+    )
 
 
 class AdminPersistentQueryKeywordList(APIView):
@@ -26,6 +68,11 @@ class AdminPersistentQueryKeywordList(APIView):
     def get(self, request):
         """Get all user persistent query keyword
 
+        Parameters:
+
+            ?cursor=<cursor>&page_size=<page_size>
+            ?paginate=false to get all persistent query keyword at once
+
         Args:
 
             request: HTTP request
@@ -33,7 +80,10 @@ class AdminPersistentQueryKeywordList(APIView):
         Returns:
 
             - code: 200
-              content: List of persistent query keyword
+              content: Page of persistent query keyword, with the url of the
+              next page
+            - code: 400
+              content: Validation error
             - code: 403
               content: Forbidden
             - code: 500
@@ -46,11 +96,11 @@ class AdminPersistentQueryKeywordList(APIView):
             # Get object
             object_list = persistent_query_keyword_api.get_all(request.user)
 
-            # Serialize object
-            serializer = self.serializer(object_list, many=True)
-
-            # Return response
-            return Response(serializer.data, status=status.HTTP_200_OK)
+            # Serialize object and return response
+            return get_list_response(request, object_list)
+        except ValidationError as validation_exception:
+            content = {"message": validation_exception.detail}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
         except Exception as api_exception:
             content = {"message": str(api_exception)}
             return Response(
@@ -110,6 +160,127 @@ class AdminPersistentQueryKeywordList(APIView):
             )
 
 
+class AdminPersistentQueryKeywordExport(APIView):
+    """Export all persistent query keyword"""
+
+    permission_classes = (IsAdminUser,)
+
+    def get(self, request):
+        """Stream all persistent query keyword as newline delimited JSON
+
+        Parameters:
+
+            ?gzip=true to compress the export
+
+        Args:
+
+            request: HTTP request
+
+        Returns:
+
+            - code: 200
+              content: One persistent query keyword per line
+            - code: 403
+              content: Forbidden
+            - code: 500
+              content: Internal server error
+        """
+        if not request.user.is_superuser:
+            return Response(status=status.HTTP_403_FORBIDDEN)
+
+        try:
+            # Get object
+            object_list = persistent_query_keyword_api.get_all(request.user)
+
+            # Stream serialized objects
+            content = iter_ndjson(
+                iter_persistent_query_keyword_list(
+                    object_list.order_by("id"),
+                    EXPLORE_KEYWORD_PERSISTENT_QUERY_EXPORT_CHUNK_SIZE,
+                )
+            )
+            if request.query_params.get("gzip", "").lower() == "true":
+                response = StreamingHttpResponse(
+                    iter_gzip(content), content_type="application/gzip"
+                )
+                filename = "persistent_query_keyword.ndjson.gz"
+            else:
+                response = StreamingHttpResponse(
+                    content, content_type="application/x-ndjson"
+                )
+                filename = "persistent_query_keyword.ndjson"
+            response["Content-Disposition"] = (
+                'attachment; filename="%s"' % filename
+            )
+            return response
+        except Exception as api_exception:
+            content = {"message": str(api_exception)}
+            return Response(
+                content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
+class AdminPersistentQueryKeywordImport(APIView):
+    """Import persistent query keyword in bulk"""
+
+    permission_classes = (IsAdminUser,)
+
+    def post(self, request):
+        """Import a list of persistent query keyword, in the export format
+
+        Invalid items are skipped and reported with their index in the list.
+
+        Parameters:
+
+            [
+                {
+                    "content": "{}",
+                    "templates": [1],
+                    "name": "persistent_query_keyword",
+                    "user_id": "0",
+                    "creation_date": "2024-01-01T00:00:00Z"
+                }
+            ]
+
+        Args:
+
+            request: HTTP request
+
+        Returns:
+
+            - code: 200
+              content: Number of created persistent query keyword, and
+              errors of the invalid items
+            - code: 400
+              content: Validation error
+            - code: 403
+              content: Forbidden
+            - code: 500
+              content: Internal server error
+        """
+        if not request.user.is_superuser:
+            return Response(status=status.HTTP_403_FORBIDDEN)
+
+        if not isinstance(request.data, list):
+            content = {"message": "Expected a list of items."}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            report = import_persistent_queries(
+                request.data,
+                batch_size=EXPLORE_KEYWORD_PERSISTENT_QUERY_IMPORT_BATCH_SIZE,
+            )
+            return Response(
+                {"created": report["created"], "errors": report["errors"]},
+                status=status.HTTP_200_OK,
+            )
+        except Exception as api_exception:
+            content = {"message": str(api_exception)}
+            return Response(
+                content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
 class PersistentQueryKeywordList(APIView):
     """List all persistent queries keyword or Create  one"""
 
@@ -119,6 +290,11 @@ class PersistentQueryKeywordList(APIView):
     def get(self, request):
         """Get user persistent query keyword
 
+        Parameters:
+
+            ?cursor=<cursor>&page_size=<page_size>
+            ?paginate=false to get all persistent query keyword at once
+
         Args:
 
             request: HTTP request
@@ -126,7 +302,10 @@ class PersistentQueryKeywordList(APIView):
         Returns:
 
             - code: 200
-              content: List of Persistent query keyword
+              content: Page of Persistent query keyword, with the url of the
+              next page
+            - code: 400
+              content: Validation error
             - code: 500
               content: Internal server error
         """
@@ -137,12 +316,11 @@ class PersistentQueryKeywordList(APIView):
                 request.user
             )
 
-            # Serialize object
-            serializer = self.serializer(object_list, many=True)
-
-            # Return response
-            return Response(serializer.data, status=status.HTTP_200_OK)
-
+            # Serialize object and return response
+            return get_list_response(request, object_list)
+        except ValidationError as validation_exception:
+            content = {"message": validation_exception.detail}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
         except Exception as api_exception:
             content = {"message": str(api_exception)}
             return Response(
@@ -197,6 +375,86 @@ class PersistentQueryKeywordList(APIView):
             )
 
 
+class PersistentQueryKeywordDeleteList(APIView):
+    """Delete persistent query keyword in bulk"""
+
+    permission_classes = (IsAuthenticated,)
+    serializer = PersistentQueryKeywordDeleteListSerializer
+
+    def post(self, request):
+        """Delete all the persistent query keyword matching the filters
+
+        Filters are combined, at least one is required. Users other than
+        superusers can only delete their own persistent query keyword: the
+        other filters only match these, and ids of others are forbidden.
+
+        Parameters:
+
+            {
+                "ids": [1, 2],
+                "user_id": "1",
+                "older_than": "2024-01-01T00:00:00Z"
+            }
+
+        Args:
+
+            request: HTTP request
+
+        Returns:
+
+            - code: 200
+              content: Number of deleted persistent query keyword
+            - code: 400
+              content: Validation error
+            - code: 403
+              content: Forbidden
+            - code: 500
+              content: Internal server error
+        """
+        try:
+            # Validate filters
+            serializer = self.serializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
+            ids = serializer.validated_data.get("ids")
+            user_id = serializer.validated_data.get("user_id")
+            # filters without ids only match the queries of the user
+            if (
+                ids is None
+                and user_id is None
+                and not request.user.is_superuser
+            ):
+                user_id = str(request.user.id)
+
+            # Get objects
+            persistent_query_keyword_list = (
+                persistent_query_keyword_api.get_all_by_filters(
+                    request.user,
+                    ids=ids,
+                    user_id=user_id,
+                    created_before=serializer.validated_data.get("older_than"),
+                )
+            )
+
+            # Delete objects
+            deleted = persistent_query_keyword_api.delete_list(
+                persistent_query_keyword_list, request.user
+            )
+
+            # Return response
+            return Response({"deleted": deleted}, status=status.HTTP_200_OK)
+        except ValidationError as validation_exception:
+            content = {"message": validation_exception.detail}
+            return Response(content, status=status.HTTP_400_BAD_REQUEST)
+        except AccessControlError as exception:
+            content = {"message": str(exception)}
+            return Response(content, status=status.HTTP_403_FORBIDDEN)
+        except Exception as api_exception:
+            content = {"message": str(api_exception)}
+            return Response(
+                content, status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+
+
 class PersistentQueryKeywordDetail(APIView):
     """Persistent query keyword detail"""
 
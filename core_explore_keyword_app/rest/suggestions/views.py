@@ -0,0 +1,48 @@
+""" REST views for the keyword suggestions.
+"""
+from django.utils.decorators import method_decorator
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from core_main_app.utils.decorators import api_staff_member_required
+from core_explore_keyword_app.utils.suggestions import suggestion_cache
+
+
+class SuggestionCacheStats(APIView):
+    """Statistics of the suggestion cache of the current process"""
+
+    @method_decorator(api_staff_member_required())
+    def get(self, request):
+        """Get the size and hit/miss counters of the suggestion cache
+
+        Args:
+            request: HTTP request
+
+        Returns:
+
+            - code: 200
+              content: Suggestion cache statistics
+            - code: 403
+              content: Forbidden
+        """
+        return Response(
+            suggestion_cache.get_stats(), status=status.HTTP_200_OK
+        )
+
+    @method_decorator(api_staff_member_required())
+    def delete(self, request):
+        """Clear the suggestion cache of the current process
+
+        Args:
+            request: HTTP request
+
+        Returns:
+
+            - code: 204
+              content: Cache cleared
+            - code: 403
+              content: Forbidden
+        """
+        suggestion_cache.clear()
+        return Response(status=status.HTTP_204_NO_CONTENT)
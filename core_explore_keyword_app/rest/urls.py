@@ -9,6 +9,9 @@ from core_explore_keyword_app.rest.persistent_query_keyword import (
 from core_explore_keyword_app.rest.search_operators import (
     views as search_operator_views,
 )
+from core_explore_keyword_app.rest.suggestions import (
+    views as suggestion_views,
+)
 
 urlpatterns = [
     re_path(
@@ -26,11 +29,26 @@ urlpatterns = [
         persistent_query_keyword_views.AdminPersistentQueryKeywordList.as_view(),
         name="core_explore_keyword_app_rest_persistent_query_keyword_admin_list",
     ),
+    re_path(
+        r"^admin/persistent_query_keyword/export/$",
+        persistent_query_keyword_views.AdminPersistentQueryKeywordExport.as_view(),
+        name="core_explore_keyword_app_rest_persistent_query_keyword_admin_export",
+    ),
+    re_path(
+        r"^admin/persistent_query_keyword/import/$",
+        persistent_query_keyword_views.AdminPersistentQueryKeywordImport.as_view(),
+        name="core_explore_keyword_app_rest_persistent_query_keyword_admin_import",
+    ),
     re_path(
         r"^persistent_query_keyword/$",
         persistent_query_keyword_views.PersistentQueryKeywordList.as_view(),
         name="core_explore_keyword_app_rest_persistent_query_keyword_list",
     ),
+    re_path(
+        r"^persistent_query_keyword/delete/$",
+        persistent_query_keyword_views.PersistentQueryKeywordDeleteList.as_view(),
+        name="core_explore_keyword_app_rest_persistent_query_keyword_delete_list",
+    ),
     re_path(
         r"^persistent_query_keyword/(?P<pk>\w+)/$",
         persistent_query_keyword_views.PersistentQueryKeywordDetail.as_view(),
@@ -41,6 +59,11 @@ urlpatterns = [
         persistent_query_keyword_views.PersistentQueryKeywordByName.as_view(),
         name="core_explore_keyword_app_rest_persistent_query_keyword_name",
     ),
+    re_path(
+        r"^admin/suggestions/cache/$",
+        suggestion_views.SuggestionCacheStats.as_view(),
+        name="core_explore_keyword_app_rest_suggestion_cache_stats",
+    ),
 ]
 
 urlpatterns = format_suffix_patterns(urlpatterns)
@@ -17,3 +17,115 @@ EXPLORE_MENU_NAME = getattr(settings, "EXPLORE_MENU_NAME", "Query by Keyword")
 EXPLORE_KEYWORD_APP_EXTRAS = getattr(
     settings, "EXPLORE_KEYWORD_APP_EXTRAS", []
 )
+
+# SUGGESTIONS
+EXPLORE_KEYWORD_TERM_DICTIONARY_ENABLED = getattr(
+    settings, "EXPLORE_KEYWORD_TERM_DICTIONARY_ENABLED", False
+)
+""" :py:class:`bool`: Answer suggestions from the term dictionary instead of
+running a full text query.
+"""
+
+EXPLORE_KEYWORD_SUGGESTIONS_LIMIT = getattr(
+    settings, "EXPLORE_KEYWORD_SUGGESTIONS_LIMIT", 10
+)
+""" :py:class:`int`: Maximum number of suggestions returned, ranked by
+frequency (None to return all suggestions).
+"""
+
+EXPLORE_KEYWORD_SUGGESTIONS_FUZZY_DISTANCE = getattr(
+    settings, "EXPLORE_KEYWORD_SUGGESTIONS_FUZZY_DISTANCE", 0
+)
+""" :py:class:`int`: Maximum edit distance of the typo tolerant suggestions
+added after the prefix matches, when the term dictionary is enabled (0 to
+disable).
+"""
+
+EXPLORE_KEYWORD_SUGGESTIONS_CACHE_SIZE = getattr(
+    settings, "EXPLORE_KEYWORD_SUGGESTIONS_CACHE_SIZE", 1024
+)
+""" :py:class:`int`: Maximum number of suggestion lists cached per process
+(0 to disable the cache).
+"""
+
+EXPLORE_KEYWORD_SUGGESTIONS_CACHE_TTL = getattr(
+    settings, "EXPLORE_KEYWORD_SUGGESTIONS_CACHE_TTL", 60
+)
+""" :py:class:`int`: Time to live of the cached suggestions, in seconds.
+"""
+
+# TEMPLATES
+EXPLORE_KEYWORD_TEMPLATE_CACHE_SIZE = getattr(
+    settings, "EXPLORE_KEYWORD_TEMPLATE_CACHE_SIZE", 1024
+)
+""" :py:class:`int`: Maximum number of users whose template choices are
+cached per process (0 to disable the cache).
+"""
+
+EXPLORE_KEYWORD_TEMPLATE_CACHE_TTL = getattr(
+    settings, "EXPLORE_KEYWORD_TEMPLATE_CACHE_TTL", 60
+)
+""" :py:class:`int`: Time to live of the cached template choices, in seconds.
+"""
+
+# CLEANUP
+EXPLORE_KEYWORD_QUERY_RETENTION_DAYS = getattr(
+    settings, "EXPLORE_KEYWORD_QUERY_RETENTION_DAYS", None
+)
+""" :py:class:`int`: Number of days after their last access after which the
+unreferenced queries of the keyword search are deleted by the cleanup task
+(None to keep all queries).
+"""
+
+EXPLORE_KEYWORD_PERSISTENT_QUERY_CLEANUP_ENABLED = getattr(
+    settings, "EXPLORE_KEYWORD_PERSISTENT_QUERY_CLEANUP_ENABLED", False
+)
+""" :py:class:`bool`: Let the cleanup task delete the unused unnamed
+persistent queries by keyword. They back shared links, keep disabled unless
+shared links are expected to expire.
+"""
+
+EXPLORE_KEYWORD_PERSISTENT_QUERY_RETENTION_DAYS = getattr(
+    settings, "EXPLORE_KEYWORD_PERSISTENT_QUERY_RETENTION_DAYS", None
+)
+""" :py:class:`int`: Number of days after their last use after which unnamed
+persistent queries by keyword are deleted by the cleanup task, if
+EXPLORE_KEYWORD_PERSISTENT_QUERY_CLEANUP_ENABLED (None to keep all persistent
+queries).
+"""
+
+EXPLORE_KEYWORD_CLEANUP_BATCH_SIZE = getattr(
+    settings, "EXPLORE_KEYWORD_CLEANUP_BATCH_SIZE", 1000
+)
+""" :py:class:`int`: Maximum number of rows deleted per transaction by the
+cleanup task.
+"""
+
+# PERSISTENT QUERIES
+EXPLORE_KEYWORD_PERSISTENT_QUERY_PAGE_SIZE = getattr(
+    settings, "EXPLORE_KEYWORD_PERSISTENT_QUERY_PAGE_SIZE", 100
+)
+""" :py:class:`int`: Default number of persistent queries per page of the REST
+listings.
+"""
+
+EXPLORE_KEYWORD_PERSISTENT_QUERY_MAX_PAGE_SIZE = getattr(
+    settings, "EXPLORE_KEYWORD_PERSISTENT_QUERY_MAX_PAGE_SIZE", 1000
+)
+""" :py:class:`int`: Maximum number of persistent queries per page of the REST
+listings.
+"""
+
+EXPLORE_KEYWORD_PERSISTENT_QUERY_EXPORT_CHUNK_SIZE = getattr(
+    settings, "EXPLORE_KEYWORD_PERSISTENT_QUERY_EXPORT_CHUNK_SIZE", 1000
+)
+""" :py:class:`int`: Number of persistent queries read from the database at
+once by the export.
+"""
+
+EXPLORE_KEYWORD_PERSISTENT_QUERY_IMPORT_BATCH_SIZE = getattr(
+    settings, "EXPLORE_KEYWORD_PERSISTENT_QUERY_IMPORT_BATCH_SIZE", 1000
+)
+""" :py:class:`int`: Number of persistent queries validated and inserted per
+transaction by the import.
+"""
@@ -5,6 +5,8 @@ var SUBMIT_DELAY = 3000;
 var SORTING_SUBMIT_DELAY = 500;
 var timer;
 var cachedOperators;
+// first results requests answered by the search, by url
+var searchResultsResponses = {};
 const SELECT_ALL_LABEL = "Select All";
 const UNSELECT_ALL_LABEL = "Unselect All";
 
@@ -198,7 +200,13 @@ var initAutocomplete = function () {
             minLength: 2,
             select: function (event, ui) {
                 this.value = ui.item.label;
-                $("#id_keywords").tagit("createTag", this.value);
+                if (this.value.slice(-1) === ":") {
+                    // search operator selected: suggest its values
+                    checkOperator(this.value, $(".tagit-new"));
+                    $(this).autocomplete("search", this.value);
+                } else {
+                    $("#id_keywords").tagit("createTag", this.value);
+                }
                 return false;
             }
         })
@@ -288,27 +296,133 @@ var submitForm = function () {
     $("#form_search").submit();
 }
 
+/**
+ * Submit the search in place, without reloading the page
+ */
+var initSearchInPlace = function() {
+    $("#form_search").on("submit", function(event) {
+        var $form = $(this);
+        var searchUrl = $form.attr("data-search-url");
+        if (searchUrl === undefined) return;
+        event.preventDefault();
+
+        $.ajax({
+            url: searchUrl,
+            type: "POST",
+            data: $form.serialize(),
+            success: function(data) {
+                displaySearchMessages(null, null);
+                displaySearchResults($form, data);
+            },
+            error: function(data) {
+                var response = data.responseJSON || {};
+                // the search may have created the query before failing
+                if (response.query_id) setSearchQueryId($form, response.query_id);
+                if (response.error || response.warning) {
+                    displaySearchMessages(response.error, response.warning);
+                } else {
+                    displaySearchMessages("An unexpected error occurred.", null);
+                }
+            }
+        });
+    });
+}
+
+/**
+ * Set the query of the search form, and the url of the page
+ * @param $form the search form
+ * @param queryId the id of the query
+ */
+var setSearchQueryId = function($form, queryId) {
+    $("#query_id").html(queryId);
+    $("#id_query_id").val(queryId);
+    window.history.replaceState(null, "", $form.attr("action") + queryId);
+}
+
+/**
+ * Display the error or the warning of a search submitted in place
+ * @param error the error message, or null
+ * @param warning the warning message, or null
+ */
+var displaySearchMessages = function(error, warning) {
+    var $messages = $("#search_messages").empty();
+    if (error) {
+        $messages.append(
+            $('<div class="alert alert-danger"><i class="fas fa-times-circle"></i> </div>')
+                .append(document.createTextNode(error))
+        );
+    } else if (warning) {
+        $messages.append(
+            $('<div class="alert alert-warning"><i class="fas fa-exclamation-triangle"></i> </div>')
+                .append(document.createTextNode(warning))
+        );
+    }
+}
+
+/**
+ * Display the results of a search submitted in place
+ * @param $form the search form
+ * @param data the search response
+ */
+var displaySearchResults = function($form, data) {
+    setSearchQueryId($form, data.query_id);
+
+    $("#results").html(data.results);
+    // setup all the toolbar components (listeners, callbacks and default values)
+    initToolbarComponents();
+    // display the first page of each data source (results.js), from the
+    // responses returned with the search
+    searchResultsResponses = {};
+    data.data_sources.forEach(function(response) {
+        searchResultsResponses[response.url] = response;
+    });
+    getDataSourcesResults();
+    searchResultsResponses = {};
+}
+
+/**
+ * Answer the results requests of the results script with the responses
+ * returned by the search, instead of sending them again
+ */
+var initSearchResultsTransport = function() {
+    $.ajaxTransport("+*", function(options) {
+        var response = searchResultsResponses[options.url];
+        if (options.type !== "POST" || response === undefined) return;
+        delete searchResultsResponses[options.url];
+        return {
+            send: function(headers, completeCallback) {
+                completeCallback(
+                    response.status,
+                    response.status === 200 ? "success" : "error",
+                    {text: response.content},
+                    "Content-Type: " + response.content_type
+                );
+            },
+            abort: function() {}
+        };
+    });
+}
+
+/**
+ * Submit the form when the sorting changes
+ * Called by initToolbarComponents (results.js) each time the results holders,
+ * and their sorting menus, are injected, after the sorting listeners are
+ * created: these listeners stop the click propagation, so the handler can not
+ * be delegated.
+ */
 var initSortingAutoSubmit = function() {
-    // waiting for the end of the AJAX call result DOM injection
-    var MAX_INTERVAL_ITER = 10;
-    var iteration = 0;
-
-    var interval = setInterval(function() {
-        iteration++;
-        if (iteration >= MAX_INTERVAL_ITER) clearInterval(interval);
-        if ($(".filter-dropdown-menu").length > 0) {
-            clearInterval(interval);
-            $(".dropdown-menu.tools-menu.filter-dropdown-menu li").click(debounce(function() {
-                submitForm();
-            }, SORTING_SUBMIT_DELAY));
-        }
-    }, 500);
+    $(".dropdown-menu.tools-menu.filter-dropdown-menu li")
+        .off("click.sortingAutoSubmit")
+        .on("click.sortingAutoSubmit", debounce(function() {
+            submitForm();
+        }, SORTING_SUBMIT_DELAY));
 }
 
 $(document).ready(function() {
     initAutocomplete();
     initAutoSubmit();
     initSelectAllTemplate();
-    initSortingAutoSubmit();
+    initSearchInPlace();
+    initSearchResultsTransport();
     addOperatorTagStyle();
 });
\ No newline at end of file
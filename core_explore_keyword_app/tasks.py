@@ -0,0 +1,56 @@
+""" Explore Keyword App tasks
+"""
+import logging
+
+from celery import shared_task
+
+from core_explore_keyword_app.components.keyword_term import (
+    api as keyword_term_api,
+)
+from core_explore_keyword_app.utils import query_cleanup
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def rebuild_keyword_terms():
+    """Rebuild the term dictionary used by the keyword suggestions.
+
+    Returns:
+
+    """
+    try:
+        count = keyword_term_api.rebuild()
+        logger.info("Periodic task: %d keyword terms indexed.", count)
+    except Exception as exception:
+        logger.error(
+            "An error occurred while rebuilding keyword terms (%s).",
+            str(exception),
+        )
+
+
+@shared_task
+def cleanup_queries():
+    """Delete the expired queries and the stale persistent queries.
+
+    Returns:
+
+    """
+    try:
+        report = query_cleanup.cleanup_queries(
+            persistent_query_retention_days=(
+                query_cleanup.get_persistent_query_retention_days()
+            )
+        )
+        logger.info(
+            "Periodic task: %d queries and %d persistent queries deleted "
+            "in %.2fs.",
+            report["queries"],
+            report["persistent_queries"],
+            report["elapsed"],
+        )
+    except Exception as exception:
+        logger.error(
+            "An error occurred while cleaning up queries (%s).",
+            str(exception),
+        )
@@ -5,8 +5,6 @@ from django import template
 
 from core_main_app.access_control.exceptions import AccessControlError
 from core_main_app.settings import DATA_SORTING_FIELDS
-from core_explore_common_app.components.query import api as query_api
-from core_explore_common_app.components.query.models import Query
 from core_explore_keyword_app.forms import KeywordForm
 
 
@@ -20,6 +18,9 @@ register = template.Library()
 def show_search_bar(context):
     """Include the search bar in a template.
 
+    The query is only created when the search is submitted, so rendering the
+    search bar does not write to the database.
+
     Args:
         context: Context
 
@@ -28,23 +29,12 @@ def show_search_bar(context):
     """
     request = context["request"]
     try:
-        # create Query
-        query = Query(user_id=str(request.user.id))
-
-        # add local data source to the query
-        query_api.add_local_data_source(request, query)
-
-        # set visibility
-        query_api.set_visibility_to_query(query, request.user)
-
-        # upsert the query
-        query_api.upsert(query, request.user)
-
-        # create keyword form
+        # create keyword form, without query
         data_form = {
-            "query_id": str(query.id),
-            "user_id": query.user_id,
+            "query_id": "",
+            "user_id": str(request.user.id),
             "order_by_field": ",".join(DATA_SORTING_FIELDS),
+            "embedded": True,
         }
         search_form = KeywordForm(data=data_form, request=request)
 
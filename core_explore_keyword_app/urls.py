@@ -19,6 +19,11 @@ urlpatterns = [
         user_ajax.SuggestionsKeywordSearchView.as_view(),
         name="core_explore_keyword_suggestions",
     ),
+    re_path(
+        r"^search$",
+        user_ajax.SearchKeywordView.as_view(),
+        name="core_explore_keyword_search",
+    ),
     re_path(
         r"^get-persistent-query-url$",
         user_ajax.CreatePersistentQueryUrlKeywordView.as_view(),
@@ -0,0 +1,124 @@
+""" Cache utilities
+"""
+import threading
+import time
+from collections import OrderedDict
+from uuid import uuid4
+
+from django.core.cache import cache
+
+GENERATION_KEY_PREFIX = "core_explore_keyword_app:generation:"
+
+
+def get_generation(name):
+    """Return the current generation stamp for the given name.
+
+    The stamp is stored in the Django cache so every worker sharing the cache
+    backend sees the same value. A missing stamp (first access, eviction) is
+    replaced by a new one, which forces all workers to reload their data.
+    Never returns None: without a cache backend storing the stamp (e.g.
+    DummyCache), each call returns a new stamp.
+
+    Args:
+        name:
+
+    Returns:
+    """
+    key = GENERATION_KEY_PREFIX + name
+    generation = cache.get(key)
+    if generation is None:
+        generation = uuid4().hex
+        if not cache.add(key, generation, None):
+            # another worker set the stamp first, unless it was evicted
+            generation = cache.get(key) or generation
+    return generation
+
+
+def bump_generation(name):
+    """Set a new generation stamp for the given name.
+
+    Args:
+        name:
+
+    Returns:
+    """
+    generation = uuid4().hex
+    cache.set(GENERATION_KEY_PREFIX + name, generation, None)
+    return generation
+
+
+class LRUTTLCache:
+    """Process-local cache with a bounded size and a time to live"""
+
+    def __init__(self, max_size, ttl):
+        """Init the cache
+
+        Args:
+            max_size: maximum number of entries, cache disabled if 0
+            ttl: time to live of an entry, in seconds
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """Return the value stored for key, or default if missing or expired.
+
+        Args:
+            key:
+            default:
+
+        Returns:
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        """Store a value for key, evicting the least recently used entries.
+
+        Args:
+            key:
+            value:
+
+        Returns:
+        """
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries.
+
+        Returns:
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self):
+        """Return the size and the hit/miss counters of the cache.
+
+        Returns:
+        """
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -0,0 +1,85 @@
+""" Keyword extractor utilities
+
+Extract, from raw documents, the words completing the keywords typed by a
+user, to generate keyword suggestions.
+"""
+import re
+from collections import Counter
+from functools import lru_cache
+
+from core_explore_keyword_app.utils.term_dictionary import tokenize
+
+
+class KeywordExtractor:
+    """Single pass extractor of the words starting with a set of prefixes"""
+
+    def __init__(self, prefixes):
+        """Compile the pattern matching whole words starting with a prefix.
+
+        Args:
+            prefixes: iterable of lowercase prefixes
+        """
+        self.prefixes = tuple(sorted(set(prefixes)))
+        # longest prefixes first, so the alternation never stops on a
+        # shorter prefix of the same word
+        alternatives = sorted(self.prefixes, key=len, reverse=True)
+        self.pattern = (
+            re.compile(
+                r"\b(?:%s)\w*" % "|".join(map(re.escape, alternatives)),
+                flags=re.IGNORECASE,
+            )
+            if alternatives
+            else None
+        )
+
+    def extract(self, content):
+        """Return the set of lowercase words of content completing a prefix.
+
+        Args:
+            content:
+
+        Returns:
+        """
+        if self.pattern is None or not content:
+            return set()
+        return {word.lower() for word in set(self.pattern.findall(content))}
+
+    def count(self, contents):
+        """Count, for each word completing a prefix, the number of contents
+        it appears in.
+
+        Args:
+            contents: iterable of raw documents
+
+        Returns:
+            Counter: word -> document frequency
+        """
+        frequencies = Counter()
+        for content in contents:
+            frequencies.update(self.extract(content))
+        return frequencies
+
+
+@lru_cache(maxsize=256)
+def _get_keyword_extractor(prefixes):
+    """Return the extractor compiled for a tuple of prefixes.
+
+    Args:
+        prefixes:
+
+    Returns:
+    """
+    return KeywordExtractor(prefixes)
+
+
+def get_keyword_extractor(keywords):
+    """Return the extractor of the words completing the keywords.
+
+    Extractors are compiled once per set of keywords and reused.
+
+    Args:
+        keywords:
+
+    Returns:
+    """
+    return _get_keyword_extractor(tuple(sorted(set(tokenize(keywords)))))
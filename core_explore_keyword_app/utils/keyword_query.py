@@ -0,0 +1,233 @@
+""" Keyword query utilities
+
+Typed representation of a keyword query, compiled to the JSON query stored in
+a Query and decompiled back to the tags of the keyword search bar.
+"""
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+
+from core_explore_keyword_app.utils.search_operator_registry import (
+    get_search_operator_registry,
+)
+from core_explore_keyword_app.utils.search_operators import (
+    get_search_operator_query,
+    get_search_operator_value_from_query,
+    get_search_operators_by_name,
+)
+
+
+@dataclass(frozen=True)
+class Keyword:
+    """Full text keyword"""
+
+    value: str
+
+    def to_tag(self):
+        """Return the tag of the keyword.
+
+        Returns:
+        """
+        return self.value
+
+
+@dataclass(frozen=True)
+class OperatorTerm:
+    """Value searched at the paths of a search operator"""
+
+    name: str
+    dot_notation_list: tuple
+    value: str
+
+    def to_tag(self):
+        """Return the tag of the term.
+
+        Returns:
+        """
+        return "%s:%s" % (self.name, self.value)
+
+
+@dataclass(frozen=True)
+class And:
+    """Conjunction of terms, matches all documents if empty"""
+
+    terms: tuple = ()
+
+    def to_tags(self):
+        """Return the tags of all the terms.
+
+        Returns:
+        """
+        return [term.to_tag() for term in self.terms]
+
+
+def parse_keywords(keyword_list):
+    """Build a keyword query from the tags of the keyword search bar.
+
+    Tags of the form `name:value` are search operator terms if `name` is a
+    search operator, keywords otherwise.
+
+    Args:
+        keyword_list:
+
+    Returns:
+        And
+    """
+    # resolve all the search operators at once
+    search_operators = get_search_operators_by_name(
+        keyword.split(":")[0] for keyword in keyword_list if ":" in keyword
+    )
+
+    terms = []
+    for keyword in keyword_list:
+        split_keyword = keyword.split(":")
+        if len(split_keyword) > 1 and split_keyword[0] in search_operators:
+            terms.append(
+                OperatorTerm(
+                    name=split_keyword[0],
+                    dot_notation_list=tuple(
+                        search_operators[split_keyword[0]].dot_notation_list
+                    ),
+                    value=split_keyword[1],
+                )
+            )
+        else:
+            terms.append(Keyword(keyword))
+    return And(tuple(terms))
+
+
+def compile_query(query):
+    """Compile a keyword query to a JSON query.
+
+    Search operator terms are compiled in order, followed by a single full
+    text search on all the keywords.
+
+    Args:
+        query: And
+
+    Returns:
+        dict
+    """
+    main_query = [
+        get_search_operator_query(term, term.value)
+        for term in query.terms
+        if isinstance(term, OperatorTerm)
+    ]
+
+    keyword_query = [
+        '"' + term.value + '"'
+        for term in query.terms
+        if isinstance(term, Keyword)
+    ]
+    if len(keyword_query) > 0:
+        main_query.append({"$text": {"$search": " ".join(keyword_query)}})
+
+    # If the query is empty, match all documents
+    if len(main_query) == 0:
+        return {}
+    # If there is one query item, match one this item.
+    if len(main_query) == 1:
+        return main_query[0]
+    # For multiple items, a "$and" query is needed.
+    return {"$and": main_query}
+
+
+@lru_cache(maxsize=1024)
+def get_query_content(query):
+    """Return the JSON query of a keyword query, as stored in a Query.
+
+    Args:
+        query: And
+
+    Returns:
+        str
+    """
+    return json.dumps(compile_query(query))
+
+
+def _decompile_terms(query, registry, terms):
+    """Append to terms the keyword query terms found in a JSON query.
+
+    Args:
+        query: dict
+        registry:
+        terms: list
+
+    Returns:
+    """
+    if "$and" in query:
+        for sub_query in query["$and"]:
+            _decompile_terms(sub_query, registry, terms)
+        return
+
+    if "$text" in query:
+        terms.extend(
+            Keyword(keyword)
+            for keyword in query["$text"]["$search"].split('"')
+            if keyword not in ("", " ")
+        )
+    elif len(query.keys()) != 0:  # Avoid parsing empty query
+        search_operator_value = get_search_operator_value_from_query(
+            query, registry
+        )
+        if search_operator_value is not None:
+            search_operator, value = search_operator_value
+            terms.append(
+                OperatorTerm(
+                    name=search_operator.name,
+                    dot_notation_list=tuple(search_operator.dot_notation_list),
+                    value=value,
+                )
+            )
+
+
+def decompile_query(query, registry=None):
+    """Build a keyword query from a JSON query.
+
+    Parts of the JSON query that were not compiled from a keyword query are
+    ignored.
+
+    Args:
+        query: dict
+        registry: search operator registry, the one of the process if None
+
+    Returns:
+        And
+    """
+    if registry is None:
+        registry = get_search_operator_registry()
+    terms = []
+    _decompile_terms(query, registry, terms)
+    return And(tuple(terms))
+
+
+@lru_cache(maxsize=1024)
+def _parse_query_content(query_content, generation):
+    """Build a keyword query from a JSON query string.
+
+    The generation of the search operator registry is part of the cache key,
+    so that a change of the search operators invalidates the parsed queries
+    without the cache holding on to the previous registries.
+
+    Args:
+        query_content:
+        generation: generation of the search operator registry
+
+    Returns:
+        And
+    """
+    return decompile_query(json.loads(query_content))
+
+
+def parse_query_content(query_content):
+    """Build a keyword query from the JSON query stored in a Query.
+
+    Args:
+        query_content:
+
+    Returns:
+        And
+    """
+    return _parse_query_content(
+        query_content, get_search_operator_registry().generation
+    )
@@ -0,0 +1,173 @@
+""" Pagination utilities
+
+Keyset pagination of the REST listings: pages are selected by the position
+of their last row, so deep pages cost the same as the first one.
+"""
+import base64
+import binascii
+import json
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+from core_explore_keyword_app.settings import (
+    EXPLORE_KEYWORD_PERSISTENT_QUERY_MAX_PAGE_SIZE,
+    EXPLORE_KEYWORD_PERSISTENT_QUERY_PAGE_SIZE,
+)
+
+PAGINATE_QUERY_PARAM = "paginate"
+
+
+def is_pagination_disabled(request):
+    """Return True if the request explicitly asks for all the results.
+
+    Args:
+        request:
+
+    Returns:
+    """
+    return (
+        request.query_params.get(PAGINATE_QUERY_PARAM, "").lower() == "false"
+    )
+
+
+def get_position(row):
+    """Return the position of a row, model instance or values() dict.
+
+    Args:
+        row:
+
+    Returns:
+        tuple: creation date, primary key
+    """
+    if isinstance(row, dict):
+        return row["creation_date"], row["id"]
+    return row.creation_date, row.id
+
+
+def encode_cursor(creation_date, pk):
+    """Encode the position of a row as a cursor.
+
+    Args:
+        creation_date:
+        pk:
+
+    Returns:
+        str
+    """
+    return base64.urlsafe_b64encode(
+        json.dumps([creation_date.isoformat(), pk]).encode("utf-8")
+    ).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """Decode the position of a row from a cursor.
+
+    Args:
+        cursor:
+
+    Returns:
+        tuple: creation date, primary key
+    """
+    try:
+        creation_date, pk = json.loads(
+            base64.urlsafe_b64decode(cursor.encode("ascii"))
+        )
+        creation_date = parse_datetime(creation_date)
+        if creation_date is None or not isinstance(pk, int):
+            raise ValueError(cursor)
+        return creation_date, pk
+    except (TypeError, ValueError, binascii.Error):
+        raise ValidationError("Invalid cursor.")
+
+
+class KeysetPagination(BasePagination):
+    """Keyset pagination ordered by (creation_date, id)"""
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    page_size = EXPLORE_KEYWORD_PERSISTENT_QUERY_PAGE_SIZE
+    max_page_size = EXPLORE_KEYWORD_PERSISTENT_QUERY_MAX_PAGE_SIZE
+
+    def __init__(self):
+        """Init the pagination"""
+        self.request = None
+        self.next_cursor = None
+
+    def get_page_size(self, request):
+        """Return the page size requested, bounded by the maximum page size.
+
+        Args:
+            request:
+
+        Returns:
+        """
+        page_size = request.query_params.get(self.page_size_query_param)
+        if page_size is None:
+            return self.page_size
+        try:
+            page_size = int(page_size)
+        except ValueError:
+            raise ValidationError("Invalid page size.")
+        if page_size <= 0:
+            raise ValidationError("Invalid page size.")
+        return min(page_size, self.max_page_size)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        """Return the page of the queryset following the cursor.
+
+        Args:
+            queryset:
+            request:
+            view:
+
+        Returns:
+            list
+        """
+        self.request = request
+        page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by("creation_date", "id")
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            creation_date, pk = decode_cursor(cursor)
+            queryset = queryset.filter(
+                Q(creation_date__gt=creation_date)
+                | Q(creation_date=creation_date, id__gt=pk)
+            )
+
+        # fetch one more row to know if there is a next page
+        page = list(queryset[: page_size + 1])
+        if len(page) > page_size:
+            page = page[:page_size]
+            self.next_cursor = encode_cursor(*get_position(page[-1]))
+        else:
+            self.next_cursor = None
+        return page
+
+    def get_next_link(self):
+        """Return the url of the next page, None on the last page.
+
+        Returns:
+        """
+        if self.next_cursor is None:
+            return None
+        return replace_query_param(
+            self.request.build_absolute_uri(),
+            self.cursor_query_param,
+            self.next_cursor,
+        )
+
+    def get_paginated_response(self, data):
+        """Return the response of a page.
+
+        Args:
+            data:
+
+        Returns:
+        """
+        return Response({"next": self.get_next_link(), "results": data})
@@ -0,0 +1,258 @@
+""" Persistent query import utilities
+
+Import persistent queries by keyword in batches, with one insert per batch for
+the persistent queries and one for their templates.
+"""
+import logging
+import time
+from itertools import islice
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from core_main_app.components.template.models import Template
+from core_explore_keyword_app.components.persistent_query_keyword.models import (
+    PersistentQueryKeyword,
+)
+from core_explore_keyword_app.settings import (
+    EXPLORE_KEYWORD_PERSISTENT_QUERY_IMPORT_BATCH_SIZE,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+# rows per UPDATE statement, each row adds a CASE branch to the statement
+CREATION_DATE_UPDATE_BATCH_SIZE = 100
+
+NAME_MAX_LENGTH = PersistentQueryKeyword._meta.get_field("name").max_length
+USER_ID_MAX_LENGTH = PersistentQueryKeyword._meta.get_field(
+    "user_id"
+).max_length
+
+
+def _validate_row(row, template_ids, names):
+    """Validate an imported row, in the export format.
+
+    Args:
+        row: dict
+        template_ids: dict, string template id -> template id of the existing
+            templates
+        names: set of the names already taken
+
+    Returns:
+        tuple: unsaved persistent query keyword, list of template ids, or
+        errors dict
+    """
+    if not isinstance(row, dict):
+        return None, None, {"row": ["Expected an object."]}
+
+    errors = {}
+    user_id = row.get("user_id")
+    if isinstance(user_id, int) and not isinstance(user_id, bool):
+        user_id = str(user_id)
+    if not isinstance(user_id, str) or not user_id:
+        errors["user_id"] = ["This field is required."]
+    elif len(user_id) > USER_ID_MAX_LENGTH:
+        errors["user_id"] = [
+            "Ensure this field has no more than %d characters."
+            % USER_ID_MAX_LENGTH
+        ]
+
+    content = row.get("content")
+    if content is not None and not isinstance(content, str):
+        errors["content"] = ["Not a valid string."]
+
+    name = row.get("name")
+    if name is not None:
+        if not isinstance(name, str):
+            errors["name"] = ["Not a valid string."]
+        elif len(name) > NAME_MAX_LENGTH:
+            errors["name"] = [
+                "Ensure this field has no more than %d characters."
+                % NAME_MAX_LENGTH
+            ]
+        elif name in names:
+            errors["name"] = [
+                "persistent query keyword with this name already exists."
+            ]
+
+    row_template_ids = row.get("templates") or []
+    if not isinstance(row_template_ids, list):
+        errors["templates"] = ["Expected a list of items."]
+    else:
+        unknown_template_ids = [
+            template_id
+            for template_id in row_template_ids
+            if str(template_id) not in template_ids
+        ]
+        if unknown_template_ids:
+            errors["templates"] = [
+                'Invalid pk "%s" - object does not exist.' % template_id
+                for template_id in unknown_template_ids
+            ]
+
+    creation_date = row.get("creation_date")
+    if creation_date is not None:
+        try:
+            creation_date = parse_datetime(creation_date)
+        except (TypeError, ValueError):
+            creation_date = None
+        if creation_date is None:
+            errors["creation_date"] = ["Datetime has wrong format."]
+        elif settings.USE_TZ and timezone.is_naive(creation_date):
+            creation_date = timezone.make_aware(creation_date)
+        elif not settings.USE_TZ and timezone.is_aware(creation_date):
+            creation_date = timezone.make_naive(creation_date)
+
+    if errors:
+        return None, None, errors
+
+    if name is not None:
+        names.add(name)
+    persistent_query_keyword = PersistentQueryKeyword(
+        user_id=user_id,
+        content=content,
+        name=name,
+        creation_date=creation_date,
+    )
+    # bulk_create does not call save
+    persistent_query_keyword.set_content_json()
+    return (
+        persistent_query_keyword,
+        list(
+            dict.fromkeys(
+                template_ids[str(template_id)]
+                for template_id in row_template_ids
+            )
+        ),
+        None,
+    )
+
+
+def _import_batch(rows, start_index):
+    """Validate and insert a batch of rows.
+
+    Args:
+        rows:
+        start_index: index of the first row of the batch in the import
+
+    Returns:
+        tuple: number of persistent queries created, list of row errors
+    """
+    # fetch the templates and the names referenced by the batch at once
+    referenced_template_ids = {
+        str(template_id)
+        for row in rows
+        if isinstance(row, dict) and isinstance(row.get("templates"), list)
+        for template_id in row["templates"]
+    }
+    template_ids = {
+        str(template_id): template_id
+        for template_id in Template.objects.filter(
+            id__in=[
+                template_id
+                for template_id in referenced_template_ids
+                if template_id.isdigit()
+            ]
+        ).values_list("id", flat=True)
+    }
+    names = set(
+        PersistentQueryKeyword.objects.filter(
+            name__in=[
+                row["name"]
+                for row in rows
+                if isinstance(row, dict) and isinstance(row.get("name"), str)
+            ]
+        ).values_list("name", flat=True)
+    )
+
+    errors = []
+    persistent_queries = []
+    persistent_query_template_ids = []
+    for index, row in enumerate(rows, start_index):
+        persistent_query_keyword, row_template_ids, row_errors = _validate_row(
+            row, template_ids, names
+        )
+        if row_errors:
+            errors.append({"index": index, "errors": row_errors})
+            continue
+        persistent_queries.append(persistent_query_keyword)
+        persistent_query_template_ids.append(row_template_ids)
+
+    if not persistent_queries:
+        return 0, errors
+
+    with transaction.atomic():
+        # creation dates are overwritten by bulk_create, restored afterwards
+        creation_dates = [
+            persistent_query_keyword.creation_date
+            for persistent_query_keyword in persistent_queries
+        ]
+        PersistentQueryKeyword.objects.bulk_create(persistent_queries)
+        dated_persistent_queries = []
+        for persistent_query_keyword, creation_date in zip(
+            persistent_queries, creation_dates
+        ):
+            if creation_date is not None:
+                persistent_query_keyword.creation_date = creation_date
+                dated_persistent_queries.append(persistent_query_keyword)
+        PersistentQueryKeyword.objects.bulk_update(
+            dated_persistent_queries,
+            ["creation_date"],
+            batch_size=CREATION_DATE_UPDATE_BATCH_SIZE,
+        )
+
+        through_model = PersistentQueryKeyword.templates.through
+        through_model.objects.bulk_create(
+            [
+                through_model(
+                    persistentquerykeyword_id=persistent_query_keyword.id,
+                    template_id=template_id,
+                )
+                for persistent_query_keyword, row_template_ids in zip(
+                    persistent_queries, persistent_query_template_ids
+                )
+                for template_id in row_template_ids
+            ]
+        )
+    return len(persistent_queries), errors
+
+
+def import_persistent_queries(
+    rows, batch_size=EXPLORE_KEYWORD_PERSISTENT_QUERY_IMPORT_BATCH_SIZE
+):
+    """Import persistent queries by keyword, in the export format.
+
+    Rows are validated and inserted one batch at a time, invalid rows are
+    skipped and reported. Ids of the imported rows are not kept.
+
+    Args:
+        rows: iterable of dicts with the user_id, content, templates, name
+            and optional creation_date keys
+        batch_size: number of rows per transaction
+
+    Returns:
+        dict: number of persistent queries created, errors of the invalid
+        rows, and elapsed time in seconds
+    """
+    start_time = time.monotonic()
+    report = {"created": 0, "errors": []}
+    rows = iter(rows)
+    start_index = 0
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+        created, errors = _import_batch(batch, start_index)
+        report["created"] += created
+        report["errors"].extend(errors)
+        start_index += len(batch)
+    report["elapsed"] = time.monotonic() - start_time
+    LOGGER.info(
+        "%d persistent queries imported, %d rows rejected in %.2fs.",
+        report["created"],
+        len(report["errors"]),
+        report["elapsed"],
+    )
+    return report
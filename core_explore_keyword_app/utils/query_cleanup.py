@@ -0,0 +1,155 @@
+""" Query cleanup utilities
+
+Delete the queries that are no longer used, in batches so that each
+transaction stays small.
+"""
+import logging
+import time
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from core_explore_common_app.components.query.models import Query
+from core_explore_keyword_app.components.persistent_query_keyword.models import (
+    PersistentQueryKeyword,
+)
+from core_explore_keyword_app.components.query_access.models import (
+    QueryAccess,
+)
+from core_explore_keyword_app.settings import (
+    EXPLORE_KEYWORD_CLEANUP_BATCH_SIZE,
+    EXPLORE_KEYWORD_PERSISTENT_QUERY_CLEANUP_ENABLED,
+    EXPLORE_KEYWORD_PERSISTENT_QUERY_RETENTION_DAYS,
+    EXPLORE_KEYWORD_QUERY_RETENTION_DAYS,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+
+def get_expiration_date(retention_days):
+    """Return the last access date before which a query is expired.
+
+    Args:
+        retention_days:
+
+    Returns:
+    """
+    return timezone.now() - timedelta(days=retention_days)
+
+
+def get_persistent_query_retention_days():
+    """Return the retention of the unused persistent queries, None unless
+    their cleanup is enabled.
+
+    Returns:
+    """
+    if not EXPLORE_KEYWORD_PERSISTENT_QUERY_CLEANUP_ENABLED:
+        return None
+    return EXPLORE_KEYWORD_PERSISTENT_QUERY_RETENTION_DAYS
+
+
+def get_expired_queries(retention_days):
+    """Return the queries of the keyword search not accessed for the
+    retention period, and that no other model refers to.
+
+    Queries of the other explore apps have no access date and are kept.
+
+    Args:
+        retention_days:
+
+    Returns:
+    """
+    queryset = Query.objects.filter(
+        keyword_query_access__last_access_date__lt=get_expiration_date(
+            retention_days
+        )
+    )
+    # keep the queries referenced by models of other apps
+    for related_object in Query._meta.related_objects:
+        if (
+            related_object.many_to_many
+            or related_object.related_model is QueryAccess
+        ):
+            continue
+        queryset = queryset.filter(
+            **{"%s__isnull" % related_object.name: True}
+        )
+    return queryset
+
+
+def get_stale_persistent_queries(retention_days):
+    """Return the unnamed persistent queries not used for the retention
+    period.
+
+    Named persistent queries are kept, they are shared on purpose.
+
+    Args:
+        retention_days:
+
+    Returns:
+    """
+    return PersistentQueryKeyword.get_all_unused_since(
+        get_expiration_date(retention_days)
+    ).filter(name__isnull=True)
+
+
+def delete_in_batches(queryset, batch_size):
+    """Delete the rows of a queryset, one transaction per batch.
+
+    Args:
+        queryset:
+        batch_size:
+
+    Returns:
+        int: number of rows deleted
+    """
+    count = 0
+    while True:
+        with transaction.atomic():
+            batch_ids = list(
+                queryset.order_by("pk").values_list("pk", flat=True)[
+                    :batch_size
+                ]
+            )
+            if not batch_ids:
+                return count
+            queryset.model.objects.filter(pk__in=batch_ids).delete()
+        count += len(batch_ids)
+
+
+def cleanup_queries(
+    query_retention_days=EXPLORE_KEYWORD_QUERY_RETENTION_DAYS,
+    persistent_query_retention_days=None,
+    batch_size=EXPLORE_KEYWORD_CLEANUP_BATCH_SIZE,
+):
+    """Delete the expired queries and the stale persistent queries.
+
+    Args:
+        query_retention_days: None to keep all queries
+        persistent_query_retention_days: None to keep all persistent queries
+        batch_size:
+
+    Returns:
+        dict: number of deleted queries and persistent queries, and elapsed
+        time in seconds
+    """
+    start_time = time.monotonic()
+    report = {"queries": 0, "persistent_queries": 0}
+    if query_retention_days is not None:
+        report["queries"] = delete_in_batches(
+            get_expired_queries(query_retention_days), batch_size
+        )
+    if persistent_query_retention_days is not None:
+        report["persistent_queries"] = delete_in_batches(
+            get_stale_persistent_queries(persistent_query_retention_days),
+            batch_size,
+        )
+    report["elapsed"] = time.monotonic() - start_time
+    LOGGER.info(
+        "%d queries and %d persistent queries deleted in %.2fs.",
+        report["queries"],
+        report["persistent_queries"],
+        report["elapsed"],
+    )
+    return report
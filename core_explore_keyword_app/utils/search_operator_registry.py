@@ -0,0 +1,120 @@
+""" Search operator registry utilities
+
+Process-local registry of the search operators, used to resolve the operators
+of a keyword query without querying the database for each keyword.
+"""
+import logging
+import threading
+
+from core_main_app.commons.exceptions import ApiError
+from core_explore_keyword_app.utils.cache import (
+    bump_generation,
+    get_generation,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+SEARCH_OPERATOR_GENERATION = "search_operators"
+
+
+class SearchOperatorRegistry:
+    """Search operators indexed by name and by dot notation list"""
+
+    def __init__(self, search_operators=(), generation=None):
+        """Index the search operators.
+
+        Args:
+            search_operators:
+            generation: generation stamp of the search operators
+        """
+        self.generation = generation
+        self.search_operators = sorted(
+            search_operators, key=lambda search_operator: search_operator.name
+        )
+        self.by_name = {
+            search_operator.name: search_operator
+            for search_operator in self.search_operators
+        }
+        self.by_dot_notation_list = {
+            tuple(search_operator.dot_notation_list): search_operator
+            for search_operator in self.search_operators
+        }
+
+    def __len__(self):
+        return len(self.search_operators)
+
+    def get_all(self):
+        """Return all the search operators, sorted by name.
+
+        Returns:
+        """
+        return list(self.search_operators)
+
+    def get_by_name(self, operator_name):
+        """Return the search operator with the given name.
+
+        Args:
+            operator_name:
+
+        Returns:
+        """
+        try:
+            return self.by_name[operator_name]
+        except KeyError:
+            raise ApiError("Operator does not exist")
+
+    def get_by_dot_notation_list(self, dot_notation_list):
+        """Return the search operator with the given dot notation list.
+
+        Args:
+            dot_notation_list:
+
+        Returns:
+        """
+        try:
+            return self.by_dot_notation_list[tuple(dot_notation_list)]
+        except KeyError:
+            raise ApiError("Operator does not exist")
+
+
+_search_operator_registry_lock = threading.Lock()
+_search_operator_registry = {"registry": None}
+
+
+def get_search_operator_registry():
+    """Return the search operator registry of the process, reloaded when
+    stale.
+
+    Returns:
+    """
+    from core_explore_keyword_app.components.search_operator import (
+        api as search_operator_api,
+    )
+
+    generation = get_generation(SEARCH_OPERATOR_GENERATION)
+    registry = _search_operator_registry["registry"]
+    if registry is not None and registry.generation == generation:
+        return registry
+
+    with _search_operator_registry_lock:
+        registry = _search_operator_registry["registry"]
+        if registry is None or registry.generation != generation:
+            LOGGER.info("Loading search operator registry.")
+            _search_operator_registry["registry"] = SearchOperatorRegistry(
+                search_operator_api.get_all(), generation
+            )
+        return _search_operator_registry["registry"]
+
+
+def invalidate_search_operator_registry(*args, **kwargs):
+    """Notify all processes that the search operators changed.
+
+    Can be connected to model signals.
+
+    Args:
+        *args:
+        **kwargs:
+
+    Returns:
+    """
+    bump_generation(SEARCH_OPERATOR_GENERATION)
@@ -3,8 +3,8 @@
 import logging
 
 from core_main_app.commons.exceptions import ApiError
-from core_explore_keyword_app.components.search_operator import (
-    api as search_operator_api,
+from core_explore_keyword_app.utils.search_operator_registry import (
+    get_search_operator_registry,
 )
 
 LOGGER = logging.getLogger(__name__)
@@ -12,7 +12,21 @@ LOGGER = logging.getLogger(__name__)
 
 def build_search_operator_query(search_operator_name, value):
     """build_search_operator_query"""
-    search_operator = search_operator_api.get_by_name(search_operator_name)
+    search_operator = get_search_operator_registry().get_by_name(
+        search_operator_name
+    )
+    return get_search_operator_query(search_operator, value)
+
+
+def get_search_operator_query(search_operator, value):
+    """Build the query matching a value at the paths of a search operator.
+
+    Args:
+        search_operator:
+        value:
+
+    Returns:
+    """
     search_operator_list = [
         {search_operator_dot_notation: value}
         for search_operator_dot_notation in search_operator.dot_notation_list
@@ -27,8 +41,47 @@ def build_search_operator_query(search_operator_name, value):
     return {"$or": search_operator_list}
 
 
+def get_search_operators_by_name(search_operator_names):
+    """Resolve a list of search operator names at once.
+
+    Args:
+        search_operator_names:
+
+    Returns:
+        dict: name -> search operator, for the existing operators only
+    """
+    registry = get_search_operator_registry()
+    search_operators = dict()
+    for search_operator_name in set(search_operator_names):
+        try:
+            search_operators[search_operator_name] = registry.get_by_name(
+                search_operator_name
+            )
+        except ApiError:
+            continue
+    return search_operators
+
+
 def get_keywords_from_search_operator_query(query):
     """get_keywords_from_search_operator_query"""
+    search_operator_value = get_search_operator_value_from_query(query)
+    if search_operator_value is None:
+        return None
+    search_operator, value = search_operator_value
+    return "%s:%s" % (search_operator.name, value)
+
+
+def get_search_operator_value_from_query(query, registry=None):
+    """Return the search operator and the value of a search operator query.
+
+    Args:
+        query: query built by get_search_operator_query
+        registry: search operator registry, the one of the process if None
+
+    Returns:
+        tuple: (search operator, value), or None if query is not a search
+        operator query
+    """
     # Any query without $or does not contain keywords (since keyword and keyword.#text
     # are always part of the query, separated by $or).
     if "$or" not in query.keys():
@@ -50,13 +103,10 @@ def get_keywords_from_search_operator_query(query):
     ]
     value = list(query["$or"][0].values())[0]
 
+    if registry is None:
+        registry = get_search_operator_registry()
     try:
-        return "%s:%s" % (
-            search_operator_api.get_by_dot_notation_list(
-                dot_notation_list
-            ).name,
-            value,
-        )
+        return registry.get_by_dot_notation_list(dot_notation_list), value
     except ApiError as api_error:
         LOGGER.info(
             "API error for query: %s (%s)" % (str(query), str(api_error))
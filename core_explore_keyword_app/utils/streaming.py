@@ -0,0 +1,41 @@
+""" Streaming utilities
+
+Encode streamed responses chunk by chunk, so that memory stays flat whatever
+the number of items.
+"""
+import json
+import zlib
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+# zlib window bits producing a gzip header and trailer
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+def iter_ndjson(items):
+    """Encode items as newline delimited JSON, one line per item.
+
+    Args:
+        items:
+
+    Returns:
+    """
+    for item in items:
+        yield json.dumps(item, cls=DjangoJSONEncoder) + "\n"
+
+
+def iter_gzip(chunks, compression_level=6):
+    """Compress text chunks with gzip.
+
+    Args:
+        chunks:
+        compression_level:
+
+    Returns:
+    """
+    compressor = zlib.compressobj(compression_level, zlib.DEFLATED, GZIP_WBITS)
+    for chunk in chunks:
+        compressed_chunk = compressor.compress(chunk.encode("utf-8"))
+        if compressed_chunk:
+            yield compressed_chunk
+    yield compressor.flush()
@@ -0,0 +1,143 @@
+""" Keyword suggestions utilities
+"""
+import heapq
+
+from core_explore_keyword_app.settings import (
+    EXPLORE_KEYWORD_SUGGESTIONS_CACHE_SIZE,
+    EXPLORE_KEYWORD_SUGGESTIONS_CACHE_TTL,
+)
+from core_explore_keyword_app.utils.cache import (
+    LRUTTLCache,
+    bump_generation,
+    get_generation,
+)
+from core_explore_keyword_app.utils.term_dictionary import tokenize
+from core_main_app.utils.query.constants import (
+    VISIBILITY_OPTION,
+    VISIBILITY_PUBLIC,
+)
+
+SUGGESTIONS_GENERATION = "suggestions"
+
+suggestion_cache = LRUTTLCache(
+    EXPLORE_KEYWORD_SUGGESTIONS_CACHE_SIZE,
+    EXPLORE_KEYWORD_SUGGESTIONS_CACHE_TTL,
+)
+
+
+def get_access_scope(user, data_source=None):
+    """Return the scope of the documents visible for a suggestion request.
+
+    Requests limited to public documents share the same scope, other
+    requests are scoped to the user.
+
+    Args:
+        user:
+        data_source: local data source, public documents only if None
+
+    Returns:
+    """
+    if data_source is None:
+        return VISIBILITY_PUBLIC
+    query_options = data_source.get("query_options") or {}
+    if query_options.get(VISIBILITY_OPTION) == VISIBILITY_PUBLIC:
+        return VISIBILITY_PUBLIC
+    return "user:%s" % str(user.id)
+
+
+def get_suggestion_cache_key(
+    keywords, template_ids, access_scope, term_dictionary_generation=None
+):
+    """Return the cache key of a suggestion request.
+
+    Args:
+        keywords:
+        template_ids:
+        access_scope:
+        term_dictionary_generation: generation of the term dictionary the
+            suggestions are computed from, None if not computed from it
+
+    Returns:
+    """
+    return (
+        get_generation(SUGGESTIONS_GENERATION),
+        term_dictionary_generation,
+        " ".join(sorted(set(tokenize(keywords)))),
+        frozenset(str(template_id) for template_id in template_ids),
+        access_scope,
+    )
+
+
+def invalidate_suggestion_cache(*args, **kwargs):
+    """Invalidate the suggestions cached by all processes.
+
+    Can be connected to model signals.
+
+    Args:
+        *args:
+        **kwargs:
+
+    Returns:
+    """
+    suggestion_cache.clear()
+    bump_generation(SUGGESTIONS_GENERATION)
+
+
+def _get_rank_key(item):
+    """Return the sort key of a (term, frequency) item.
+
+    Args:
+        item:
+
+    Returns:
+    """
+    return -item[1], item[0]
+
+
+def rank_terms(frequencies, limit=None):
+    """Return the terms sorted by decreasing frequency, then alphabetically.
+
+    Args:
+        frequencies: dict term -> frequency
+        limit: maximum number of terms to return, all if None
+
+    Returns:
+    """
+    items = frequencies.items()
+    if limit is None:
+        ranked_items = sorted(items, key=_get_rank_key)
+    else:
+        ranked_items = heapq.nsmallest(limit, items, key=_get_rank_key)
+    return [term for term, _ in ranked_items]
+
+
+def rank_fuzzy_terms(matches, limit=None):
+    """Return the terms sorted by edit distance, decreasing frequency, then
+    alphabetically.
+
+    Args:
+        matches: dict term -> (edit distance, frequency)
+        limit: maximum number of terms to return, all if None
+
+    Returns:
+    """
+    items = [
+        (distance, -frequency, term)
+        for term, (distance, frequency) in matches.items()
+    ]
+    if limit is None:
+        ranked_items = sorted(items)
+    else:
+        ranked_items = heapq.nsmallest(limit, items)
+    return [term for _, _, term in ranked_items]
+
+
+def format_suggestions(terms):
+    """Format a list of terms as autocomplete suggestions.
+
+    Args:
+        terms:
+
+    Returns:
+    """
+    return [{"label": term, "value": term} for term in terms]
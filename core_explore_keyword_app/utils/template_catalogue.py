@@ -0,0 +1,165 @@
+""" Template catalogue utilities
+
+Per-user cache of the templates a user can search, used to build the keyword
+search form and to resolve the selected templates without querying the
+database on every request.
+"""
+from core_explore_keyword_app.settings import (
+    EXPLORE_KEYWORD_TEMPLATE_CACHE_SIZE,
+    EXPLORE_KEYWORD_TEMPLATE_CACHE_TTL,
+)
+from core_explore_keyword_app.utils.cache import (
+    LRUTTLCache,
+    bump_generation,
+    get_generation,
+)
+from core_main_app.components.template.access_control import (
+    get_accessible_owners,
+)
+from core_main_app.components.template.models import Template
+from core_main_app.components.template_version_manager import (
+    api as template_version_manager_api,
+)
+
+TEMPLATE_CATALOGUE_GENERATION = "template_catalogue"
+REQUEST_TEMPLATE_IDS_ATTRIBUTE = "_explore_keyword_template_ids"
+
+template_choice_cache = LRUTTLCache(
+    EXPLORE_KEYWORD_TEMPLATE_CACHE_SIZE,
+    EXPLORE_KEYWORD_TEMPLATE_CACHE_TTL,
+)
+template_id_cache = LRUTTLCache(
+    EXPLORE_KEYWORD_TEMPLATE_CACHE_SIZE,
+    EXPLORE_KEYWORD_TEMPLATE_CACHE_TTL,
+)
+
+
+def get_user_cache_key(request):
+    """Return the part of a cache key identifying the user of a request.
+
+    Args:
+        request:
+
+    Returns:
+    """
+    user = request.user
+    if user is None or user.is_anonymous:
+        return "anonymous"
+    return "user:%s" % str(user.id)
+
+
+def get_template_choices(request):
+    """Return the choices of the global and user templates of the keyword
+    search form.
+
+    Args:
+        request:
+
+    Returns:
+        tuple: (global template choices, user template choices), lists of
+        (version manager id, title)
+    """
+    cache_key = (
+        get_generation(TEMPLATE_CATALOGUE_GENERATION),
+        get_user_cache_key(request),
+    )
+    choices = template_choice_cache.get(cache_key)
+    if choices is not None:
+        return choices
+
+    global_templates = [
+        (template_version_manager.id, template_version_manager.title)
+        for template_version_manager in template_version_manager_api.get_active_global_version_manager(
+            request=request
+        )
+    ]
+    user_templates = [
+        (template_version_manager.id, template_version_manager.title)
+        for template_version_manager in template_version_manager_api.get_active_version_manager_by_user_id(
+            request=request
+        )
+    ]
+    choices = (global_templates, user_templates)
+    template_choice_cache.set(cache_key, choices)
+    return choices
+
+
+def get_template_ids(version_manager_ids, request):
+    """Return the ids of the templates of the version managers, that the user
+    of the request can access.
+
+    All the versions of the version managers are returned. The ids are
+    resolved with a single query, then memoized on the request and cached
+    per user.
+
+    Args:
+        version_manager_ids:
+        request:
+
+    Returns:
+        list: sorted template ids, as strings
+    """
+    version_manager_ids = frozenset(
+        str(version_manager_id) for version_manager_id in version_manager_ids
+    )
+    request_template_ids = getattr(
+        request, REQUEST_TEMPLATE_IDS_ATTRIBUTE, None
+    )
+    if request_template_ids is None:
+        request_template_ids = dict()
+        setattr(request, REQUEST_TEMPLATE_IDS_ATTRIBUTE, request_template_ids)
+    if version_manager_ids in request_template_ids:
+        return request_template_ids[version_manager_ids]
+
+    cache_key = (
+        get_generation(TEMPLATE_CATALOGUE_GENERATION),
+        get_user_cache_key(request),
+        version_manager_ids,
+    )
+    template_ids = template_id_cache.get(cache_key)
+    if template_ids is None:
+        template_ids = _get_accessible_template_ids(
+            version_manager_ids, request
+        )
+        template_id_cache.set(cache_key, template_ids)
+    request_template_ids[version_manager_ids] = template_ids
+    return template_ids
+
+
+def _get_accessible_template_ids(version_manager_ids, request):
+    """Query the ids of the accessible templates of the version managers.
+
+    Args:
+        version_manager_ids:
+        request:
+
+    Returns:
+    """
+    if not version_manager_ids:
+        return []
+    templates = Template.objects.filter(
+        version_manager_id__in=version_manager_ids
+    )
+    users = get_accessible_owners(request=request)
+    if users is not None:
+        templates = templates.filter(users)
+    return sorted(
+        str(template_id)
+        for template_id in templates.values_list("id", flat=True)
+    )
+
+
+def invalidate_template_catalogue(*args, **kwargs):
+    """Invalidate the templates cached by all processes.
+
+    Can be connected to model signals.
+
+    Args:
+        *args:
+        **kwargs:
+
+    Returns:
+    """
+    template_choice_cache.clear()
+    template_id_cache.clear()
+    bump_generation(TEMPLATE_CATALOGUE_GENERATION)
@@ -0,0 +1,517 @@
+""" Term dictionary utilities
+
+In-memory dictionary of the terms found in the indexed data, used to answer
+keyword suggestion requests without querying the document collection.
+"""
+
+import logging
+import re
+import threading
+from bisect import bisect_left
+from collections import Counter
+
+from django.db import connection
+
+from core_explore_keyword_app.settings import (
+    EXPLORE_KEYWORD_SUGGESTIONS_FUZZY_DISTANCE,
+)
+from core_explore_keyword_app.utils.cache import get_generation
+
+LOGGER = logging.getLogger(__name__)
+
+TERM_DICTIONARY_GENERATION = "term_dictionary"
+TERM_MAX_LENGTH = 200
+FUZZY_PREFIX_LENGTH = 7
+TOKEN_PATTERN = re.compile(r"\w+")
+# characters splitting tags or search operator keywords
+VALUE_SEPARATORS = (",", ":")
+
+
+def iter_string_values(dict_content):
+    """Iterate over all string values of a data dict content.
+
+    Args:
+        dict_content:
+
+    Returns:
+    """
+    stack = [dict_content]
+    while stack:
+        item = stack.pop()
+        if isinstance(item, dict):
+            stack.extend(item.values())
+        elif isinstance(item, list):
+            stack.extend(item)
+        elif isinstance(item, str):
+            yield item
+        elif item is not None and not isinstance(item, bool):
+            yield str(item)
+
+
+def tokenize(text):
+    """Split a text into lowercase terms.
+
+    Args:
+        text:
+
+    Returns:
+    """
+    for token in TOKEN_PATTERN.findall(text):
+        if len(token) <= TERM_MAX_LENGTH:
+            yield token.lower()
+
+
+def get_document_terms(dict_content):
+    """Return the set of terms found in a data dict content.
+
+    Args:
+        dict_content:
+
+    Returns:
+    """
+    terms = set()
+    for value in iter_string_values(dict_content):
+        terms.update(tokenize(value))
+    return terms
+
+
+def get_path_values(dict_content, dot_notation):
+    """Return the set of values found at a dot notation path of a data dict
+    content.
+
+    Lists are traversed, and the text of elements with attributes is read from
+    their `#text` field. Values that can not be typed back as a search
+    operator keyword are ignored.
+
+    Args:
+        dict_content:
+        dot_notation:
+
+    Returns:
+    """
+    items = [dict_content]
+    for key in dot_notation.split("."):
+        next_items = []
+        for item in items:
+            if isinstance(item, list):
+                item = [i for i in item if isinstance(i, dict)]
+            else:
+                item = [item] if isinstance(item, dict) else []
+            for element in item:
+                if key in element:
+                    value = element[key]
+                    next_items.extend(
+                        value if isinstance(value, list) else [value]
+                    )
+        items = next_items
+
+    values = set()
+    for item in items:
+        if isinstance(item, dict):
+            item = item.get("#text")
+        if item is None or isinstance(item, (bool, dict, list)):
+            continue
+        value = str(item).strip()
+        if (
+            value
+            and len(value) <= TERM_MAX_LENGTH
+            and not any(separator in value for separator in VALUE_SEPARATORS)
+        ):
+            values.add(value)
+    return values
+
+
+def get_prefix_upper_bound(prefix):
+    """Return the smallest string greater than all strings starting with prefix.
+
+    Args:
+        prefix:
+
+    Returns:
+    """
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def get_deletes(word, max_distance):
+    """Return all the strings obtained by deleting up to max_distance
+    characters from word.
+
+    Args:
+        word:
+        max_distance:
+
+    Returns:
+    """
+    deletes = {word}
+    current_deletes = [word]
+    for _ in range(max_distance):
+        next_deletes = []
+        for current_delete in current_deletes:
+            if len(current_delete) <= 1:
+                continue
+            for index in range(len(current_delete)):
+                delete = current_delete[:index] + current_delete[index + 1 :]
+                if delete not in deletes:
+                    deletes.add(delete)
+                    next_deletes.append(delete)
+        current_deletes = next_deletes
+    return deletes
+
+
+def get_edit_distance(source, target, max_distance):
+    """Return the edit distance (optimal string alignment) between two words.
+
+    Adjacent transpositions count as one edit. The computation stops as soon
+    as the distance exceeds max_distance.
+
+    Args:
+        source:
+        target:
+        max_distance:
+
+    Returns:
+        int: edit distance, or max_distance + 1 if greater than max_distance
+    """
+    if abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+    before_previous_row = None
+    previous_row = list(range(len(target) + 1))
+    for i in range(1, len(source) + 1):
+        current_row = [i] + [0] * len(target)
+        for j in range(1, len(target) + 1):
+            cost = 0 if source[i - 1] == target[j - 1] else 1
+            distance = min(
+                previous_row[j] + 1,
+                current_row[j - 1] + 1,
+                previous_row[j - 1] + cost,
+            )
+            if (
+                i > 1
+                and j > 1
+                and source[i - 1] == target[j - 2]
+                and source[i - 2] == target[j - 1]
+            ):
+                distance = min(distance, before_previous_row[j - 2] + 1)
+            current_row[j] = distance
+        if min(current_row) > max_distance:
+            return max_distance + 1
+        before_previous_row, previous_row = previous_row, current_row
+    return min(previous_row[-1], max_distance + 1)
+
+
+class SymSpellIndex:
+    """Deletion index finding the terms close to a misspelled word"""
+
+    def __init__(self, terms, max_distance, prefix_length=FUZZY_PREFIX_LENGTH):
+        """Index the deletes of the prefix of each term.
+
+        Args:
+            terms: sorted list of terms
+            max_distance: maximum edit distance of a match
+            prefix_length: number of characters of the terms to index
+        """
+        self.terms = terms
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+        self.deletes = dict()
+        for index, term in enumerate(terms):
+            for delete in get_deletes(term[:prefix_length], max_distance):
+                self.deletes.setdefault(delete, []).append(index)
+
+    def lookup(self, word):
+        """Return the terms within max_distance edits of word.
+
+        Args:
+            word:
+
+        Returns:
+            dict: term index -> edit distance
+        """
+        candidates = set()
+        for delete in get_deletes(
+            word[: self.prefix_length], self.max_distance
+        ):
+            candidates.update(self.deletes.get(delete, ()))
+
+        matches = dict()
+        for index in candidates:
+            distance = get_edit_distance(
+                word, self.terms[index], self.max_distance
+            )
+            if distance <= self.max_distance:
+                matches[index] = distance
+        return matches
+
+
+class TermDictionary:
+    """Sorted term array with per-template document frequencies
+
+    Lookups are case-insensitive and return the terms as they were indexed.
+    """
+
+    def __init__(self, entries=()):
+        """Build the dictionary from (term, template id, frequency) tuples.
+
+        Args:
+            entries:
+        """
+        postings = dict()
+        for term, template_id, document_frequency in entries:
+            postings.setdefault(term, dict())[
+                str(template_id)
+            ] = document_frequency
+        self.terms = sorted(postings, key=lambda term: (term.lower(), term))
+        self.keys = [term.lower() for term in self.terms]
+        self.postings = [postings[term] for term in self.terms]
+        self._fuzzy_indexes = dict()
+        self._fuzzy_indexes_lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.terms)
+
+    def get_frequency(self, index, template_ids=None):
+        """Return the document frequency of the term at index.
+
+        Args:
+            index:
+            template_ids: set of template ids to count, all if None
+
+        Returns:
+        """
+        posting = self.postings[index]
+        if template_ids is None:
+            return sum(posting.values())
+        return sum(
+            frequency
+            for template_id, frequency in posting.items()
+            if template_id in template_ids
+        )
+
+    def lookup(self, prefix, template_ids=None):
+        """Return the frequencies of all terms starting with prefix, all
+        terms if the prefix is empty.
+
+        Args:
+            prefix:
+            template_ids: set of template ids to count, all if None
+
+        Returns:
+            Counter: term -> document frequency
+        """
+        frequencies = Counter()
+        prefix = prefix.lower()
+        if prefix:
+            start = bisect_left(self.keys, prefix)
+            end = bisect_left(
+                self.keys, get_prefix_upper_bound(prefix), lo=start
+            )
+        else:
+            start, end = 0, len(self.keys)
+        for index in range(start, end):
+            frequency = self.get_frequency(index, template_ids)
+            if frequency > 0:
+                frequencies[self.terms[index]] = frequency
+        return frequencies
+
+    def lookup_keywords(self, keywords, template_ids=None):
+        """Return the frequencies of all terms completing one of the keywords.
+
+        Args:
+            keywords:
+            template_ids: template ids to count, all if None
+
+        Returns:
+            Counter: term -> document frequency
+        """
+        if template_ids is not None:
+            template_ids = {str(template_id) for template_id in template_ids}
+        frequencies = Counter()
+        for prefix in set(tokenize(keywords)):
+            frequencies.update(self.lookup(prefix, template_ids))
+        return frequencies
+
+    def get_fuzzy_index(self, max_distance):
+        """Return the deletion index for max_distance, built on first use.
+
+        Args:
+            max_distance:
+
+        Returns:
+        """
+        fuzzy_index = self._fuzzy_indexes.get(max_distance)
+        if fuzzy_index is None:
+            with self._fuzzy_indexes_lock:
+                fuzzy_index = self._fuzzy_indexes.get(max_distance)
+                if fuzzy_index is None:
+                    fuzzy_index = SymSpellIndex(self.keys, max_distance)
+                    self._fuzzy_indexes[max_distance] = fuzzy_index
+        return fuzzy_index
+
+    def lookup_keywords_fuzzy(self, keywords, max_distance, template_ids=None):
+        """Return the terms close to one of the keywords.
+
+        Keywords too short to be misspelled (max_distance characters or
+        less) are ignored.
+
+        Args:
+            keywords:
+            max_distance: maximum edit distance
+            template_ids: template ids to count, all if None
+
+        Returns:
+            dict: term -> (edit distance, document frequency)
+        """
+        if template_ids is not None:
+            template_ids = {str(template_id) for template_id in template_ids}
+        fuzzy_index = self.get_fuzzy_index(max_distance)
+        matches = dict()
+        for word in set(tokenize(keywords)):
+            if len(word) <= max_distance:
+                continue
+            for index, distance in fuzzy_index.lookup(word).items():
+                frequency = self.get_frequency(index, template_ids)
+                if frequency == 0:
+                    continue
+                term = self.terms[index]
+                if term not in matches or distance < matches[term][0]:
+                    matches[term] = (distance, frequency)
+        return matches
+
+
+_term_dictionary_lock = threading.Lock()
+_term_dictionary = {
+    "generation": None,
+    "dictionary": None,
+    "search_operator_dictionaries": None,
+    "reload_thread": None,
+}
+
+
+def _build_term_dictionaries(generation):
+    """Load the term dictionaries of a generation, and replace the current
+    ones.
+
+    Args:
+        generation:
+
+    Returns:
+    """
+    from core_explore_keyword_app.components.keyword_term import (
+        api as keyword_term_api,
+    )
+
+    LOGGER.info("Loading keyword term dictionary.")
+    term_dictionary = TermDictionary(keyword_term_api.get_all_entries())
+    if EXPLORE_KEYWORD_SUGGESTIONS_FUZZY_DISTANCE > 0:
+        term_dictionary.get_fuzzy_index(
+            EXPLORE_KEYWORD_SUGGESTIONS_FUZZY_DISTANCE
+        )
+
+    search_operator_entries = dict()
+    for (
+        search_operator_id,
+        value,
+        template_id,
+        document_frequency,
+    ) in keyword_term_api.get_all_search_operator_entries():
+        search_operator_entries.setdefault(search_operator_id, []).append(
+            (value, template_id, document_frequency)
+        )
+
+    _term_dictionary.update(
+        {
+            "dictionary": term_dictionary,
+            "search_operator_dictionaries": {
+                search_operator_id: TermDictionary(entries)
+                for search_operator_id, entries in search_operator_entries.items()
+            },
+            "generation": generation,
+        }
+    )
+
+
+def _reload_term_dictionaries(generation):
+    """Reload the term dictionaries in a background thread.
+
+    Args:
+        generation:
+
+    Returns:
+    """
+    try:
+        _build_term_dictionaries(generation)
+    except Exception as exception:
+        LOGGER.error(
+            "Error while reloading keyword term dictionary: %s",
+            str(exception),
+        )
+    finally:
+        # the thread has its own database connection
+        connection.close()
+
+
+def _load_term_dictionaries():
+    """Load the term dictionaries of the process if they are stale.
+
+    Only the first load blocks the requests. Afterwards, stale dictionaries
+    keep being served while a single background thread reloads them.
+
+    Returns:
+    """
+    generation = get_generation(TERM_DICTIONARY_GENERATION)
+    if (
+        _term_dictionary["dictionary"] is not None
+        and _term_dictionary["generation"] == generation
+    ):
+        return
+
+    with _term_dictionary_lock:
+        if _term_dictionary["dictionary"] is None:
+            # nothing to serve yet, wait for the first load
+            _build_term_dictionaries(generation)
+            return
+        if _term_dictionary["generation"] == generation:
+            return
+        reload_thread = _term_dictionary["reload_thread"]
+        if reload_thread is not None and reload_thread.is_alive():
+            return
+        reload_thread = threading.Thread(
+            target=_reload_term_dictionaries, args=(generation,), daemon=True
+        )
+        _term_dictionary["reload_thread"] = reload_thread
+        reload_thread.start()
+
+
+def get_term_dictionary_generation():
+    """Return the generation of the term dictionaries served by the process.
+
+    It lags the current generation while the dictionaries are reloaded, and
+    is None before the first load.
+
+    Returns:
+    """
+    return _term_dictionary["generation"]
+
+
+def get_term_dictionary():
+    """Return the term dictionary of the process, reloaded when stale.
+
+    Returns:
+    """
+    _load_term_dictionaries()
+    return _term_dictionary["dictionary"]
+
+
+def get_search_operator_value_dictionary(search_operator_id):
+    """Return the dictionary of the values of a search operator, reloaded
+    when stale.
+
+    Args:
+        search_operator_id:
+
+    Returns:
+    """
+    _load_term_dictionaries()
+    return _term_dictionary["search_operator_dictionaries"].get(
+        search_operator_id, TermDictionary()
+    )
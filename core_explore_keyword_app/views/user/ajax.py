@@ -2,28 +2,60 @@
 """
 import json
 import logging
-import re
 
 from django.http import HttpResponse, HttpResponseBadRequest
+from django.urls import reverse
 from django.utils.decorators import method_decorator
 from django.views.generic import View
 
-import core_main_app.components.template_version_manager.api as template_version_manager_api
 from core_explore_common_app.components.query import api as query_api
 from core_explore_common_app.rest.query.views import execute_local_query
 from core_explore_common_app.utils.query.query import (
-    create_local_data_source,
-    serialize_query,
     is_local_data_source,
 )
 from core_explore_common_app.views.user.ajax import (
     CreatePersistentQueryUrlView,
+    get_data_source_results,
+    get_data_sources_html,
 )
 from core_explore_keyword_app.components.persistent_query_keyword.models import (
     PersistentQueryKeyword,
+    load_content,
 )
 from core_explore_keyword_app.forms import KeywordForm
 from core_explore_keyword_app.permissions import rights
+from core_explore_keyword_app.settings import (
+    EXPLORE_KEYWORD_SUGGESTIONS_FUZZY_DISTANCE,
+    EXPLORE_KEYWORD_SUGGESTIONS_LIMIT,
+    EXPLORE_KEYWORD_TERM_DICTIONARY_ENABLED,
+)
+from core_explore_keyword_app.utils.keyword_extractor import (
+    get_keyword_extractor,
+)
+from core_explore_keyword_app.utils.search_operator_registry import (
+    get_search_operator_registry,
+)
+from core_explore_keyword_app.utils.suggestions import (
+    format_suggestions,
+    get_access_scope,
+    get_suggestion_cache_key,
+    rank_fuzzy_terms,
+    rank_terms,
+    suggestion_cache,
+)
+from core_explore_keyword_app.utils.template_catalogue import (
+    get_template_ids,
+)
+from core_explore_keyword_app.utils.term_dictionary import (
+    get_search_operator_value_dictionary,
+    get_term_dictionary,
+    get_term_dictionary_generation,
+)
+from core_explore_keyword_app.views.user.views import (
+    build_search_query,
+    save_keyword_search,
+)
+from core_main_app.commons.exceptions import ApiError
 from core_main_app.components.template import api as template_api
 from core_main_app.utils import decorators
 from core_main_app.utils.databases.mongo.pymongo_database import (
@@ -92,42 +124,50 @@ class SuggestionsKeywordSearchView(View):
             )
             user_templates = search_form.cleaned_data.get("user_templates", [])
 
-            # get all template version manager ids
-            template_version_manager_ids = global_templates + user_templates
-
-            # from ids, get all version manager
-            version_manager_list = template_version_manager_api.get_by_id_list(
-                template_version_manager_ids, request=request
+            # get all the accessible versions of the selected templates
+            template_ids = get_template_ids(
+                global_templates + user_templates, request
             )
 
-            # from all version manager, build a list of all version (template)
-            template_ids = []
-            list(
-                [template_ids.extend(x.versions) for x in version_manager_list]
+            search_operator = (
+                self._get_search_operator(keywords)
+                if EXPLORE_KEYWORD_TERM_DICTIONARY_ENABLED
+                and keywords is not None
+                else None
             )
-
-            if query_id is not None and keywords is not None:
-                # get query
-                query = query_api.get_by_id(query_id, request.user)
+            if search_operator is not None:
+                suggestions = self._get_search_operator_value_suggestions(
+                    search_operator, keywords, template_ids
+                )
+            elif EXPLORE_KEYWORD_TERM_DICTIONARY_ENABLED:
+                if keywords is not None:
+                    suggestions = self._get_cached_suggestions(
+                        keywords, template_ids, None, request
+                    )
+            elif keywords is not None:
+                if query_id:
+                    # get query
+                    query = query_api.get_by_id(query_id, request.user)
+                else:
+                    # the query is only created by the first search
+                    query = build_search_query(
+                        request, search_form.cleaned_data.get("embedded")
+                    )
 
                 # Get local data source
                 local_data_source = _get_local_data_source(query)
 
                 if local_data_source:
-
-                    # Prepare query
-                    query = self._get_query_prepared(
-                        keywords, query, request, template_ids
+                    suggestions = self._get_cached_suggestions(
+                        keywords, template_ids, local_data_source, request
                     )
 
-                    # Send query
-                    json_query = serialize_query(query, local_data_source)
-                    dict_results = execute_local_query(json_query, 1, request)
-
-                    if dict_results.paginator.count > 0:
-                        self._extract_suggestion_from_results(
-                            dict_results.object_list, keywords, suggestions
-                        )
+            if keywords is not None and search_operator is None:
+                # suggest the search operators completing the keyword first
+                suggestions = (
+                    self._get_search_operator_name_suggestions(keywords)
+                    + suggestions
+                )[:EXPLORE_KEYWORD_SUGGESTIONS_LIMIT]
 
             return HttpResponse(
                 json.dumps({"suggestions": suggestions}),
@@ -141,28 +181,210 @@ class SuggestionsKeywordSearchView(View):
             logger.error(error_message)
             return HttpResponseBadRequest(error_message)
 
-    def _get_query_prepared(self, keywords, query, request, template_ids):
-        """Prepare the query for suggestions.
+    def _get_cached_suggestions(
+        self, keywords, template_ids, local_data_source, request
+    ):
+        """Get suggestions from the cache, or generate and cache them.
 
         Args:
             keywords:
-            query:
+            template_ids:
+            local_data_source: local data source, term dictionary if None
+            request:
+
+        Returns:
+        """
+        term_dictionary_generation = None
+        if local_data_source is None:
+            # a dictionary being reloaded is stale, its suggestions are
+            # cached under its own generation and not the current one
+            term_dictionary_generation = get_term_dictionary_generation()
+        cache_key = get_suggestion_cache_key(
+            keywords,
+            template_ids,
+            get_access_scope(request.user, local_data_source),
+            term_dictionary_generation,
+        )
+        suggestions = suggestion_cache.get(cache_key)
+        if suggestions is not None:
+            return suggestions
+
+        if local_data_source is None:
+            suggestions = self._get_suggestions_from_term_dictionary(
+                keywords, template_ids
+            )
+        else:
+            suggestions = self._get_suggestions_from_query(
+                keywords, template_ids, local_data_source, request
+            )
+        suggestion_cache.set(cache_key, suggestions)
+        return suggestions
+
+    def _get_suggestions_from_query(
+        self, keywords, template_ids, local_data_source, request
+    ):
+        """Get suggestions from the results of a full text query.
+
+        Args:
+            keywords:
+            template_ids:
+            local_data_source:
             request:
+
+        Returns:
+        """
+        suggestions = []
+
+        # Prepare query
+        json_query = self._get_query_prepared(
+            keywords, local_data_source, request, template_ids
+        )
+
+        # Send query
+        dict_results = execute_local_query(json_query, 1, request)
+
+        if dict_results.paginator.count > 0:
+            self._extract_suggestion_from_results(
+                dict_results.object_list, keywords, suggestions
+            )
+        return suggestions
+
+    @staticmethod
+    def _get_suggestions_from_term_dictionary(keywords, template_ids):
+        """Get suggestions from the term dictionary.
+
+        Args:
+            keywords:
             template_ids:
+
         Returns:
         """
+        term_dictionary = get_term_dictionary()
+        template_ids = template_ids if template_ids else None
+        terms = rank_terms(
+            term_dictionary.lookup_keywords(keywords, template_ids),
+            EXPLORE_KEYWORD_SUGGESTIONS_LIMIT,
+        )
+        if EXPLORE_KEYWORD_SUGGESTIONS_FUZZY_DISTANCE > 0 and (
+            EXPLORE_KEYWORD_SUGGESTIONS_LIMIT is None
+            or len(terms) < EXPLORE_KEYWORD_SUGGESTIONS_LIMIT
+        ):
+            # complete with the terms close to the keywords
+            fuzzy_matches = term_dictionary.lookup_keywords_fuzzy(
+                keywords,
+                EXPLORE_KEYWORD_SUGGESTIONS_FUZZY_DISTANCE,
+                template_ids,
+            )
+            for term in terms:
+                fuzzy_matches.pop(term, None)
+            fuzzy_limit = (
+                EXPLORE_KEYWORD_SUGGESTIONS_LIMIT - len(terms)
+                if EXPLORE_KEYWORD_SUGGESTIONS_LIMIT is not None
+                else None
+            )
+            terms += rank_fuzzy_terms(fuzzy_matches, fuzzy_limit)
+        return format_suggestions(terms)
 
-        # update query
-        query.templates.set(
-            template_api.get_all_accessible_by_id_list(
-                template_ids, request=request
+    @staticmethod
+    def _get_search_operator(keywords):
+        """Return the search operator of a `name:value` keyword, or None.
+
+        Args:
+            keywords:
+
+        Returns:
+        """
+        if ":" not in keywords:
+            return None
+        try:
+            return get_search_operator_registry().get_by_name(
+                keywords.split(":", 1)[0].strip()
             )
+        except ApiError:
+            return None
+
+    @staticmethod
+    def _get_search_operator_name_suggestions(keywords):
+        """Get the search operators whose name starts with the keyword.
+
+        Args:
+            keywords:
+
+        Returns:
+        """
+        keyword = keywords.strip().lower()
+        if not keyword or ":" in keyword or " " in keyword:
+            return []
+        names = sorted(
+            search_operator.name
+            for search_operator in get_search_operator_registry().get_all()
+            if search_operator.name.lower().startswith(keyword)
+        )
+        return format_suggestions(["%s:" % name for name in names])
+
+    @staticmethod
+    def _get_search_operator_value_suggestions(
+        search_operator, keywords, template_ids
+    ):
+        """Get the values of a search operator starting with the value typed
+        after `name:`, from the search operator value index.
+
+        Args:
+            search_operator:
+            keywords:
+            template_ids:
+
+        Returns:
+        """
+        value_dictionary = get_search_operator_value_dictionary(
+            search_operator.id
+        )
+        template_ids = (
+            {str(template_id) for template_id in template_ids}
+            if template_ids
+            else None
+        )
+        values = rank_terms(
+            value_dictionary.lookup(
+                keywords.split(":", 1)[1].strip(), template_ids
+            ),
+            EXPLORE_KEYWORD_SUGGESTIONS_LIMIT,
+        )
+        return format_suggestions(
+            ["%s:%s" % (search_operator.name, value) for value in values]
+        )
+
+    @staticmethod
+    def _get_query_prepared(
+        keywords, local_data_source, request, template_ids
+    ):
+        """Prepare the query for suggestions.
+
+        The query is only built in memory: the user's query is never
+        modified, so generating suggestions does not write to the database.
+
+        Args:
+            keywords:
+            local_data_source:
+            request:
+            template_ids:
+        Returns:
+        """
+        templates = template_api.get_all_accessible_by_id_list(
+            template_ids, request=request
         )
         # TODO: improve query to get better results
-        query.content = json.dumps(get_full_text_query(keywords))
-        # Data source is local
-        query.data_sources = [create_local_data_source(request)]
-        return query
+        return {
+            "query": json.dumps(get_full_text_query(keywords)),
+            "templates": json.dumps(
+                [
+                    {"id": template.id, "hash": template.hash}
+                    for template in templates
+                ]
+            ),
+            "options": json.dumps(local_data_source["query_options"]),
+            "order_by_field": local_data_source["order_by_field"],
+        }
 
     @staticmethod
     def _extract_suggestion_from_results(results, keywords, suggestions):
@@ -175,26 +397,132 @@ class SuggestionsKeywordSearchView(View):
 
         Returns:
         """
-        # Prepare keywords
-        word_list = re.sub(r"[^\w]", " ", keywords).split()
-        word_list = [x + "|" + x + r"\w+" for x in word_list]
-        word_list = "|".join(word_list)
-        for result in results:
-            # Extract suggestions from data
-            list_whole_keywords = re.findall(
-                "\\b(" + word_list + ")\\b",
-                result.content,
-                flags=re.IGNORECASE,
-            )
-            labels = list(set(list_whole_keywords))
-
-            for label in labels:
-                label = label.lower()
-                result_json = dict()
-                result_json["label"] = label
-                result_json["value"] = label
-                if result_json not in suggestions:
-                    suggestions.append(result_json)
+        frequencies = get_keyword_extractor(keywords).count(
+            result.content for result in results
+        )
+        suggestions.extend(
+            format_suggestions(
+                rank_terms(frequencies, EXPLORE_KEYWORD_SUGGESTIONS_LIMIT)
+            )
+        )
+
+
+class SearchKeywordView(View):
+    """Search Keyword View
+
+    Save the search and return the results holders and the first page of
+    results of its data sources in one round trip, instead of the POST,
+    redirect and GET of the search page, and of one request per data source.
+    """
+
+    @method_decorator(
+        decorators.permission_required(
+            content_type=rights.EXPLORE_KEYWORD_CONTENT_TYPE,
+            permission=rights.EXPLORE_KEYWORD_ACCESS,
+        )
+    )
+    def post(self, request, *args, **kwargs):
+        """POST
+
+        Args:
+            request:
+            *args:
+            **kwargs:
+
+        Returns:
+
+        """
+        search_form = KeywordForm(data=request.POST, request=request)
+        query, error, warning = save_keyword_search(request, search_form)
+        if error or warning:
+            # the query may have been created before the warning
+            return HttpResponseBadRequest(
+                json.dumps(
+                    {
+                        "error": error,
+                        "warning": warning,
+                        "query_id": str(query.id) if query else None,
+                    }
+                ),
+                content_type="application/json",
+            )
+
+        # the query may have been created by the search
+        request.POST = request.POST.copy()
+        request.POST["query_id"] = str(query.id)
+
+        try:
+            response_dict = {
+                "query_id": str(query.id),
+                "results": self._get_json_content(
+                    get_data_sources_html(request)
+                )["results"],
+                "data_sources": [
+                    self._get_data_source_first_page(
+                        request, query, data_source_index
+                    )
+                    for data_source_index in range(len(query.data_sources))
+                ],
+            }
+        except Exception as exception:
+            error_message = "Exception while getting the results: %s" % str(
+                exception
+            )
+            logger.error(error_message)
+            return HttpResponseBadRequest(
+                json.dumps(
+                    {
+                        "error": error_message,
+                        "warning": None,
+                        "query_id": str(query.id),
+                    }
+                ),
+                content_type="application/json",
+            )
+
+        return HttpResponse(
+            json.dumps(response_dict), content_type="application/json"
+        )
+
+    @staticmethod
+    def _get_json_content(response):
+        """Return the JSON content of a results response.
+
+        Args:
+            response:
+
+        Returns:
+        """
+        if response.status_code != 200:
+            raise ApiError(response.content.decode("utf-8"))
+        return json.loads(response.content)
+
+    @staticmethod
+    def _get_data_source_first_page(request, query, data_source_index):
+        """Get the response to the first results request of a data source.
+
+        The response is returned as is, with the url requested by the results
+        holder, so that the results script renders it, errors included.
+
+        Args:
+            request:
+            query:
+            data_source_index:
+
+        Returns:
+        """
+        response = get_data_source_results(
+            request, str(query.id), data_source_index, page=1
+        )
+        return {
+            "url": reverse(
+                "core_explore_common_data_source_results",
+                args=[query.id, data_source_index],
+            ),
+            "status": response.status_code,
+            "content_type": response["Content-Type"],
+            "content": response.content.decode("utf-8"),
+        }
 
 
 class CreatePersistentQueryUrlKeywordView(CreatePersistentQueryUrlView):
@@ -204,6 +532,16 @@ class CreatePersistentQueryUrlKeywordView(CreatePersistentQueryUrlView):
 
     @staticmethod
     def _create_persistent_query(query):
+        # share the same url again when the user shares the same search
+        content_json = load_content(query.content)
+        if query.user_id is not None and content_json is not None:
+            persistent_query = PersistentQueryKeyword.get_unnamed_by_content(
+                query.user_id,
+                content_json,
+                query.templates.values_list("id", flat=True),
+            )
+            if persistent_query is not None:
+                return persistent_query
         # create the persistent query
         return PersistentQueryKeyword(
             user_id=query.user_id,
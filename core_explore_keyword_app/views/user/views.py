@@ -1,6 +1,5 @@
 """Core Explore Keyword App views
 """
-import json
 from typing import Dict, Any, List
 
 from django.http import HttpResponseRedirect
@@ -8,9 +7,16 @@ from django.urls import reverse
 from django.utils.decorators import method_decorator
 
 import core_explore_keyword_app.components.persistent_query_keyword.api as persistent_query_keyword_api
-import core_main_app.components.template_version_manager.api as template_version_manager_api
 from core_explore_common_app.components.query import api as query_api
-from core_explore_common_app.settings import DEFAULT_DATE_TOGGLE_VALUE
+from core_explore_common_app.components.query.models import Query
+from core_explore_common_app.settings import (
+    DATA_SOURCES_EXPLORE_APPS,
+    DEFAULT_DATE_TOGGLE_VALUE,
+    EXPLORE_ADD_DEFAULT_LOCAL_DATA_SOURCE_TO_QUERY,
+)
+from core_explore_common_app.utils.query.query import (
+    create_local_data_source,
+)
 from core_explore_common_app.views.user.views import (
     ResultQueryRedirectView,
     ResultsView,
@@ -18,15 +24,21 @@ from core_explore_common_app.views.user.views import (
 from core_explore_keyword_app.components.persistent_query_keyword.models import (
     PersistentQueryKeyword,
 )
+from core_explore_keyword_app.components.query_access import (
+    api as query_access_api,
+)
 from core_explore_keyword_app.forms import KeywordForm
 from core_explore_keyword_app.permissions import rights
 from core_explore_keyword_app.settings import EXPLORE_KEYWORD_APP_EXTRAS
-from core_explore_keyword_app.utils.search_operators import (
-    build_search_operator_query,
-    get_keywords_from_search_operator_query,
+from core_explore_keyword_app.utils.keyword_query import (
+    get_query_content,
+    parse_keywords,
+    parse_query_content,
 )
-from core_main_app.commons.exceptions import DoesNotExist, ApiError
-from core_main_app.components.template import api as template_api
+from core_explore_keyword_app.utils.template_catalogue import (
+    get_template_ids,
+)
+from core_main_app.commons.exceptions import DoesNotExist
 from core_main_app.settings import DATA_SORTING_FIELDS
 from core_main_app.utils import decorators
 from core_main_app.utils.rendering import render
@@ -109,35 +121,14 @@ class KeywordSearchView(ResultsView):
 
     @staticmethod
     def _parse_query(query_content):
-        keyword_list = list()
-        query_json = json.loads(query_content)
-
-        if "$text" in query_json:
-            keywords = query_json["$text"]["$search"]
-            keyword_list = [
-                "{}".format(keyword)
-                for keyword in keywords.split('"')
-                if keyword not in ("", " ")
-            ]
+        """Get the keywords of a query content
 
-        if "$and" in query_json:
-            result = []
-
-            # parse all the sub_queries
-            for sub_query in query_json["$and"]:
-                result.append(
-                    KeywordSearchView._parse_query(json.dumps(sub_query))
-                )
-
-            return ",".join(result)
-
-        elif len(query_json.keys()) != 0:  # Avoid parsing empty query
-            keyword = get_keywords_from_search_operator_query(query_json)
-
-            if keyword is not None:
-                keyword_list.append(keyword)
+        Args:
+            query_content:
 
-        return ",".join(keyword_list)
+        Returns:
+        """
+        return ",".join(parse_query_content(query_content).to_tags())
 
     def _get(self, request, query_id):
         """Prepare the GET context
@@ -152,27 +143,33 @@ class KeywordSearchView(ResultsView):
             error = None
             # set the correct default ordering for the context
             default_order = ",".join(DATA_SORTING_FIELDS)
-            if query_id is None:
-                # create query
+            if query_id is None and DATA_SOURCES_EXPLORE_APPS:
+                # create query, the data sources selector needs one
                 query = query_api.create_default_query(request, [])
+                query_access_api.record_access(query)
                 # create keyword form
                 # create all data for select values in forms
                 keywords_data_form = {
                     "query_id": str(query.id),
                     "user_id": query.user_id,
                 }
+            elif query_id is None:
+                # the query is created by the first search
+                keywords_data_form = {
+                    "query_id": "",
+                    "user_id": str(request.user.id),
+                }
             else:  # query_id is not None
                 # get the query id
                 query = query_api.get_by_id(query_id, request.user)
+                query_access_api.record_access(query)
                 user_id = query.user_id
 
                 # get all keywords back
                 keywords = self._parse_query(query.content)
 
                 # get all version managers
-                version_managers = []
-                for template in query.templates.all():
-                    version_managers.append(str(template.version_manager.id))
+                version_managers = self._get_version_manager_ids(query)
                 # create all data for select values in forms
                 keywords_data_form = {
                     "query_id": str(query.id),
@@ -199,6 +196,49 @@ class KeywordSearchView(ResultsView):
             search_form, error, None, default_order
         )
 
+    @staticmethod
+    def _get_version_manager_ids(query):
+        """Get the ids of the version managers of the query templates
+
+        Args:
+            query:
+
+        Returns:
+        """
+        return [
+            str(version_manager_id)
+            for version_manager_id in query.templates.filter(
+                version_manager__isnull=False
+            )
+            .values_list("version_manager_id", flat=True)
+            .distinct()
+        ]
+
+    @staticmethod
+    def _update_query_templates(query, template_ids):
+        """Update the templates of the query, only writing the added and
+        removed templates
+
+        Args:
+            query:
+            template_ids:
+
+        Returns:
+            bool: True if the templates were modified
+        """
+        template_ids = {str(template_id) for template_id in template_ids}
+        current_template_ids = {
+            str(template_id)
+            for template_id in query.templates.values_list("id", flat=True)
+        }
+        removed_template_ids = current_template_ids - template_ids
+        added_template_ids = template_ids - current_template_ids
+        if removed_template_ids:
+            query.templates.remove(*removed_template_ids)
+        if added_template_ids:
+            query.templates.add(*added_template_ids)
+        return bool(removed_template_ids or added_template_ids)
+
     def _post(self, request):
         """Prepare the POST context
 
@@ -208,92 +248,19 @@ class KeywordSearchView(ResultsView):
         Returns:
 
         """
-        error = None
-        warning = None
         search_form = KeywordForm(data=request.POST, request=request)
-        # validate form
-        if search_form.is_valid():
-            try:
-                # get form values
-                query_id = search_form.cleaned_data.get("query_id", None)
-                keywords = search_form.cleaned_data.get("keywords", None)
-                global_templates = search_form.cleaned_data.get(
-                    "global_templates", []
-                )
-                user_templates = search_form.cleaned_data.get(
-                    "user_templates", []
-                )
-                order_by_field_array = (
-                    search_form.cleaned_data.get("order_by_field", "")
-                    .strip()
-                    .split(";")
-                )
-                # get all template version manager ids
-                template_version_manager_ids = (
-                    global_templates + user_templates
-                )
-                # from ids, get all version manager
-                version_manager_list = (
-                    template_version_manager_api.get_by_id_list(
-                        template_version_manager_ids, request=request
-                    )
-                )
-                # from all version manager, build a list of all version (template)
-                template_ids = []
-                list(
-                    [
-                        template_ids.extend(x.versions)
-                        for x in version_manager_list
-                    ]
-                )
-                if query_id is None or keywords is None:
-                    error = "Expected parameters are not provided"
-                else:
-                    # get query
-                    query = query_api.get_by_id(query_id, request.user)
-                    if len(query.data_sources) == 0:
-                        warning = "Please select at least 1 data source."
-                    else:
-                        # update query
-                        query.templates.set(
-                            template_api.get_all_accessible_by_id_list(
-                                template_ids, request=request
-                            )
-                        )
-                        keywords_list = keywords.split(",") if keywords else []
-                        query.content = self._build_query(keywords_list)
-                        # set the data-sources filter value according to the POST request field
-                        for data_sources_index in range(
-                            len(query.data_sources)
-                        ):
-                            # update the data-source filter only if it's not a new data-source
-                            # (the default filter value is already added when the data-source
-                            # is created)
-                            if data_sources_index in range(
-                                0, len(order_by_field_array)
-                            ):
-                                query.data_sources[data_sources_index][
-                                    "order_by_field"
-                                ] = order_by_field_array[data_sources_index]
-
-                        query_api.upsert(query, request.user)
-            except DoesNotExist:
-                error = (
-                    "An unexpected error occurred while retrieving the query."
-                )
-            except Exception as exception:
-                error = "An unexpected error occurred: {}.".format(
-                    str(exception)
-                )
-        else:
-            error = "An unexpected error occurred: the form is not valid."
+        query, error, warning = save_keyword_search(request, search_form)
 
-        return self._format_keyword_search_context(
+        context = self._format_keyword_search_context(
             search_form,
             error,
             warning,
             search_form.cleaned_data.get("order_by_field", "").strip(),
         )
+        if query is not None:
+            # the query may have been created by the search
+            context["query_id"] = str(query.id)
+        return context
 
     @staticmethod
     def _build_query(initial_keyword_list):
@@ -304,40 +271,7 @@ class KeywordSearchView(ResultsView):
 
         Returns:
         """
-        main_query = list()
-        keyword_list = list()
-
-        for keyword in initial_keyword_list:
-            if ":" in keyword:
-                try:
-                    split_keyword = keyword.split(":")
-
-                    main_query.append(
-                        build_search_operator_query(
-                            split_keyword[0], split_keyword[1]
-                        )
-                    )
-                except ApiError:
-                    keyword_list.append(keyword)
-            else:
-                keyword_list.append(keyword)
-
-        keyword_query = ['"' + keyword + '"' for keyword in keyword_list]
-
-        if len(keyword_query) > 0:
-            keyword_query = {"$text": {"$search": " ".join(keyword_query)}}
-            main_query.append(keyword_query)
-
-        # If the query is empty, match all documents
-        if len(main_query) == 0:
-            return json.dumps({})
-        if (
-            len(main_query) == 1
-        ):  # If there is one query item, match one this item.
-            return json.dumps(main_query[0])
-
-        # For multiple items, a "$and" query is needed.
-        return json.dumps({"$and": main_query})
+        return get_query_content(parse_keywords(initial_keyword_list))
 
     def _load_assets(self):
         """Return assets structure
@@ -425,6 +359,138 @@ class KeywordSearchView(ResultsView):
         return context
 
 
+def build_search_query(request, embedded=False):
+    """Build the query of a search started without query, without saving it
+
+    The query is the default query of the search page, or the query of the
+    embedded search bar, with the visibility defined in settings.
+
+    Args:
+        request:
+        embedded: True if the search comes from the embedded search bar
+
+    Returns:
+    """
+    query = Query(user_id=str(request.user.id), content="{}")
+
+    if embedded:
+        # add local data source to the query
+        query.data_sources.append(create_local_data_source(request))
+
+        # set visibility
+        query_api.set_visibility_to_query(query, request.user)
+    elif EXPLORE_ADD_DEFAULT_LOCAL_DATA_SOURCE_TO_QUERY:
+        # add the local data source by default
+        query.data_sources.append(create_local_data_source(request))
+    return query
+
+
+def create_search_query(request, embedded=False):
+    """Create the query of a search submitted without query
+
+    Args:
+        request:
+        embedded: True if the search comes from the embedded search bar
+
+    Returns:
+    """
+    query = build_search_query(request, embedded)
+
+    # upsert the query
+    query_api.upsert(query, request.user)
+    query_access_api.record_access(query)
+    return query
+
+
+def save_keyword_search(request, search_form):
+    """Validate a keyword search form and update its query
+
+    Args:
+        request:
+        search_form:
+
+    Returns:
+        query, error, warning
+    """
+    query = None
+    error = None
+    warning = None
+    # validate form
+    if search_form.is_valid():
+        try:
+            # get form values
+            query_id = search_form.cleaned_data.get("query_id", None)
+            keywords = search_form.cleaned_data.get("keywords", None)
+            global_templates = search_form.cleaned_data.get(
+                "global_templates", []
+            )
+            user_templates = search_form.cleaned_data.get("user_templates", [])
+            order_by_field_array = (
+                search_form.cleaned_data.get("order_by_field", "")
+                .strip()
+                .split(";")
+            )
+            # get all the accessible versions of the selected templates
+            template_ids = get_template_ids(
+                global_templates + user_templates, request
+            )
+            if keywords is None:
+                error = "Expected parameters are not provided"
+            else:
+                if query_id:
+                    # get query
+                    query = query_api.get_by_id(query_id, request.user)
+                    query_access_api.record_access(query)
+                else:
+                    # create the query on the first search
+                    query = create_search_query(
+                        request, search_form.cleaned_data.get("embedded")
+                    )
+                if len(query.data_sources) == 0:
+                    warning = "Please select at least 1 data source."
+                else:
+                    # update query
+                    KeywordSearchView._update_query_templates(
+                        query, template_ids
+                    )
+                    keywords_list = keywords.split(",") if keywords else []
+                    content = KeywordSearchView._build_query(keywords_list)
+                    is_modified = query.content != content
+                    query.content = content
+                    # set the data-sources filter value according to the POST request field
+                    for data_sources_index in range(len(query.data_sources)):
+                        # update the data-source filter only if it's not a new data-source
+                        # (the default filter value is already added when the data-source
+                        # is created)
+                        if data_sources_index in range(
+                            0, len(order_by_field_array)
+                        ):
+                            data_source = query.data_sources[
+                                data_sources_index
+                            ]
+                            order_by_field = order_by_field_array[
+                                data_sources_index
+                            ]
+                            if (
+                                data_source.get("order_by_field")
+                                != order_by_field
+                            ):
+                                data_source["order_by_field"] = order_by_field
+                                is_modified = True
+
+                    # avoid writing an unchanged query
+                    if is_modified:
+                        query_api.upsert(query, request.user)
+        except DoesNotExist:
+            error = "An unexpected error occurred while retrieving the query."
+        except Exception as exception:
+            error = "An unexpected error occurred: {}.".format(str(exception))
+    else:
+        error = "An unexpected error occurred: the form is not valid."
+
+    return query, error, warning
+
+
 class ResultQueryRedirectKeywordView(ResultQueryRedirectView):
     """Result Query Redirect Keyword View"""
 
@@ -443,12 +509,15 @@ class ResultQueryRedirectKeywordView(ResultQueryRedirectView):
 
     @staticmethod
     def _get_persistent_query_by_id(persistent_query_id, user):
-        return persistent_query_keyword_api.get_by_id(
+        persistent_query = persistent_query_keyword_api.get_by_id(
             persistent_query_id, user
         )
+        persistent_query_keyword_api.record_access(persistent_query)
+        return persistent_query
 
     @staticmethod
     def _get_persistent_query_by_name(persistent_query_name, user):
+        # named persistent queries are never cleaned up, no access to record
         return persistent_query_keyword_api.get_by_name(
             persistent_query_name, user
         )
@@ -0,0 +1,121 @@
+""" Unit tests for Keyword Term API calls.
+"""
+from unittest import TestCase, mock
+
+from core_explore_keyword_app.components.keyword_term import (
+    api as keyword_term_api,
+)
+from core_explore_keyword_app.components.keyword_term.models import (
+    KeywordTerm,
+)
+
+
+class TestsApiRebuild(TestCase):
+    """Tests Api Rebuild"""
+
+    def setUp(self):
+        """setUp"""
+
+        patcher = mock.patch.object(
+            keyword_term_api.search_operator_api, "get_all"
+        )
+        self.mock_get_all_search_operators = patcher.start()
+        self.mock_get_all_search_operators.return_value = []
+        self.addCleanup(patcher.stop)
+
+    @mock.patch.object(keyword_term_api, "bump_generation")
+    @mock.patch.object(KeywordTerm, "bulk_insert")
+    @mock.patch.object(KeywordTerm, "delete_all")
+    @mock.patch.object(keyword_term_api, "get_indexed_data")
+    def test_rebuild_counts_document_frequencies(
+        self,
+        mock_get_indexed_data,
+        mock_delete_all,
+        mock_bulk_insert,
+        mock_bump_generation,
+    ):
+        """test_rebuild_counts_document_frequencies"""
+
+        mock_data_1 = mock.Mock(template_id=1)
+        mock_data_1.get_dict_content.return_value = {"a": "steel steel"}
+        mock_data_2 = mock.Mock(template_id=1)
+        mock_data_2.get_dict_content.return_value = {"a": "Steel alloy"}
+        mock_get_indexed_data.return_value.iterator.return_value = [
+            mock_data_1,
+            mock_data_2,
+        ]
+
+        self.assertEqual(keyword_term_api.rebuild(), 2)
+
+        keyword_term_list = mock_bulk_insert.call_args[0][0]
+        self.assertDictEqual(
+            {
+                keyword_term.term: keyword_term.document_frequency
+                for keyword_term in keyword_term_list
+            },
+            {"steel": 2, "alloy": 1},
+        )
+        self.assertTrue(mock_delete_all.called)
+        self.assertTrue(mock_bump_generation.called)
+
+    @mock.patch.object(keyword_term_api, "bump_generation")
+    @mock.patch.object(KeywordTerm, "bulk_insert")
+    @mock.patch.object(KeywordTerm, "delete_all")
+    @mock.patch.object(keyword_term_api, "get_indexed_data")
+    def test_rebuild_counts_search_operator_values(
+        self,
+        mock_get_indexed_data,
+        mock_delete_all,
+        mock_bulk_insert,
+        mock_bump_generation,
+    ):
+        """test_rebuild_counts_search_operator_values"""
+
+        self.mock_get_all_search_operators.return_value = [
+            mock.Mock(id=7, dot_notation_list=["root.name", "root.alias"])
+        ]
+        mock_data_1 = mock.Mock(template_id=1)
+        mock_data_1.get_dict_content.return_value = {
+            "root": {"name": "Steel 316", "alias": "Steel 316"}
+        }
+        mock_data_2 = mock.Mock(template_id=1)
+        mock_data_2.get_dict_content.return_value = {
+            "root": {"name": {"#text": "Steel 316"}}
+        }
+        mock_get_indexed_data.return_value.iterator.return_value = [
+            mock_data_1,
+            mock_data_2,
+        ]
+
+        keyword_term_api.rebuild()
+
+        keyword_term_list = mock_bulk_insert.call_args[0][0]
+        self.assertDictEqual(
+            {
+                (
+                    keyword_term.search_operator_id,
+                    keyword_term.term,
+                ): keyword_term.document_frequency
+                for keyword_term in keyword_term_list
+            },
+            {(None, "steel"): 2, (None, "316"): 2, (7, "Steel 316"): 2},
+        )
+
+    @mock.patch.object(keyword_term_api, "bump_generation")
+    @mock.patch.object(KeywordTerm, "bulk_insert")
+    @mock.patch.object(KeywordTerm, "delete_all")
+    @mock.patch.object(keyword_term_api, "get_indexed_data")
+    def test_rebuild_skips_invalid_data(
+        self,
+        mock_get_indexed_data,
+        mock_delete_all,
+        mock_bulk_insert,
+        mock_bump_generation,
+    ):
+        """test_rebuild_skips_invalid_data"""
+
+        mock_data = mock.Mock(template_id=1)
+        mock_data.get_dict_content.side_effect = Exception("mock_error")
+        mock_get_indexed_data.return_value.iterator.return_value = [mock_data]
+
+        self.assertEqual(keyword_term_api.rebuild(), 0)
@@ -0,0 +1,358 @@
+""" Integration tests for PersistentQueryKeyword
+"""
+import json
+from datetime import timedelta
+from unittest import skipUnless
+
+from django.db import connection
+from django.utils import timezone
+
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_explore_keyword_app.components.persistent_query_keyword import (
+    api as persistent_query_keyword_api,
+)
+from core_explore_keyword_app.components.persistent_query_keyword.models import (
+    PersistentQueryKeyword,
+    get_content_hash,
+)
+from tests.components.persistent_query_keyword.fixtures.fixtures import (
+    PersistentQueryKeywordFixtures,
+)
+
+
+class TestPersistentQueryKeywordContentJson(IntegrationBaseTestCase):
+    """Test Persistent Query Keyword Content Json"""
+
+    fixture = PersistentQueryKeywordFixtures()
+
+    def test_save_stores_parsed_content(self):
+        """test_save_stores_parsed_content"""
+
+        persistent_query_keyword = self.fixture.persistent_query_keyword_1
+        persistent_query_keyword.content = json.dumps(
+            {"$text": {"$search": '"alloy"'}}
+        )
+        persistent_query_keyword.save()
+
+        self.assertDictEqual(
+            PersistentQueryKeyword.get_by_id(
+                persistent_query_keyword.id
+            ).content_json,
+            {"$text": {"$search": '"alloy"'}},
+        )
+
+    def test_save_with_update_fields_stores_parsed_content(self):
+        """test_save_with_update_fields_stores_parsed_content"""
+
+        persistent_query_keyword = self.fixture.persistent_query_keyword_1
+        persistent_query_keyword.content = json.dumps({"a": 1})
+        persistent_query_keyword.save(update_fields=["content"])
+
+        self.assertDictEqual(
+            PersistentQueryKeyword.get_by_id(
+                persistent_query_keyword.id
+            ).content_json,
+            {"a": 1},
+        )
+
+    def test_content_json_can_be_filtered(self):
+        """test_content_json_can_be_filtered"""
+
+        persistent_query_keyword = self.fixture.persistent_query_keyword_2
+        persistent_query_keyword.content = json.dumps(
+            {"$text": {"$search": "x"}}
+        )
+        persistent_query_keyword.save()
+
+        self.assertListEqual(
+            list(
+                PersistentQueryKeyword.objects.filter(
+                    content_json__has_key="$text"
+                )
+            ),
+            [persistent_query_keyword],
+        )
+
+    def test_get_content_json_parses_legacy_content(self):
+        """test_get_content_json_parses_legacy_content"""
+
+        persistent_query_keyword = self.fixture.persistent_query_keyword_3
+        PersistentQueryKeyword.objects.filter(
+            pk=persistent_query_keyword.pk
+        ).update(content=json.dumps({"a": 1}), content_json=None)
+
+        self.assertDictEqual(
+            PersistentQueryKeyword.get_by_id(
+                persistent_query_keyword.id
+            ).get_content_json(),
+            {"a": 1},
+        )
+
+    def test_invalid_content_is_not_parsed(self):
+        """test_invalid_content_is_not_parsed"""
+
+        persistent_query_keyword = self.fixture.persistent_query_keyword_1
+        persistent_query_keyword.content = "not json"
+        persistent_query_keyword.save()
+
+        self.assertIsNone(persistent_query_keyword.get_content_json())
+        self.assertIsNone(persistent_query_keyword.content_hash)
+
+    def test_save_stores_content_hash(self):
+        """test_save_stores_content_hash"""
+
+        persistent_query_keyword = self.fixture.persistent_query_keyword_1
+        persistent_query_keyword.content = json.dumps({"b": 2, "a": 1})
+        persistent_query_keyword.save()
+
+        self.assertEqual(
+            PersistentQueryKeyword.get_by_id(
+                persistent_query_keyword.id
+            ).content_hash,
+            get_content_hash({"a": 1, "b": 2}),
+        )
+
+
+class TestPersistentQueryKeywordGetUnnamedByContent(IntegrationBaseTestCase):
+    """Test Persistent Query Keyword Get Unnamed By Content"""
+
+    fixture = PersistentQueryKeywordFixtures()
+
+    def setUp(self):
+        """setUp"""
+
+        super().setUp()
+        self.persistent_query_keyword = PersistentQueryKeyword(
+            user_id="1", content=json.dumps({"$text": {"$search": "x"}})
+        )
+        self.persistent_query_keyword.save()
+
+    def test_returns_unnamed_query_with_same_content(self):
+        """test_returns_unnamed_query_with_same_content"""
+
+        self.assertEqual(
+            PersistentQueryKeyword.get_unnamed_by_content(
+                "1", {"$text": {"$search": "x"}}, []
+            ),
+            self.persistent_query_keyword,
+        )
+
+    def test_returns_none_for_other_content(self):
+        """test_returns_none_for_other_content"""
+
+        self.assertIsNone(
+            PersistentQueryKeyword.get_unnamed_by_content(
+                "1", {"$text": {"$search": "y"}}, []
+            )
+        )
+
+    def test_returns_none_for_other_user(self):
+        """test_returns_none_for_other_user"""
+
+        self.assertIsNone(
+            PersistentQueryKeyword.get_unnamed_by_content(
+                "2", {"$text": {"$search": "x"}}, []
+            )
+        )
+
+    def test_returns_none_for_other_templates(self):
+        """test_returns_none_for_other_templates"""
+
+        self.assertIsNone(
+            PersistentQueryKeyword.get_unnamed_by_content(
+                "1", {"$text": {"$search": "x"}}, [1]
+            )
+        )
+
+    def test_returns_none_for_named_query(self):
+        """test_returns_none_for_named_query"""
+
+        self.persistent_query_keyword.name = "named"
+        self.persistent_query_keyword.save()
+
+        self.assertIsNone(
+            PersistentQueryKeyword.get_unnamed_by_content(
+                "1", {"$text": {"$search": "x"}}, []
+            )
+        )
+
+
+class TestPersistentQueryKeywordLastAccess(IntegrationBaseTestCase):
+    """Test Persistent Query Keyword Last Access"""
+
+    fixture = PersistentQueryKeywordFixtures()
+
+    def setUp(self):
+        """setUp"""
+
+        super().setUp()
+        self.persistent_query_keyword = PersistentQueryKeyword(user_id="1")
+        self.persistent_query_keyword.save()
+
+    def test_record_access_sets_last_access_date(self):
+        """test_record_access_sets_last_access_date"""
+
+        self.assertIsNone(self.persistent_query_keyword.last_access_date)
+
+        persistent_query_keyword_api.record_access(
+            self.persistent_query_keyword
+        )
+
+        self.persistent_query_keyword.refresh_from_db()
+        self.assertIsNotNone(self.persistent_query_keyword.last_access_date)
+
+    def test_record_access_updates_old_last_access_date(self):
+        """test_record_access_updates_old_last_access_date"""
+
+        long_ago = timezone.now() - timedelta(days=2)
+        PersistentQueryKeyword.set_last_access_date(
+            self.persistent_query_keyword.id, long_ago
+        )
+
+        persistent_query_keyword_api.record_access(
+            self.persistent_query_keyword
+        )
+
+        self.persistent_query_keyword.refresh_from_db()
+        self.assertGreater(
+            self.persistent_query_keyword.last_access_date, long_ago
+        )
+
+    def test_record_access_keeps_recent_last_access_date(self):
+        """test_record_access_keeps_recent_last_access_date"""
+
+        recently = timezone.now() - timedelta(hours=1)
+        PersistentQueryKeyword.set_last_access_date(
+            self.persistent_query_keyword.id, recently
+        )
+
+        with self.assertNumQueries(1):
+            persistent_query_keyword_api.record_access(
+                self.persistent_query_keyword
+            )
+
+        self.persistent_query_keyword.refresh_from_db()
+        self.assertEqual(
+            self.persistent_query_keyword.last_access_date, recently
+        )
+
+    def test_record_access_skips_named_query(self):
+        """test_record_access_skips_named_query"""
+
+        persistent_query_keyword = self.fixture.persistent_query_keyword_1
+
+        with self.assertNumQueries(0):
+            persistent_query_keyword_api.record_access(
+                persistent_query_keyword
+            )
+
+        persistent_query_keyword.refresh_from_db()
+        self.assertIsNone(persistent_query_keyword.last_access_date)
+
+    def test_get_all_unused_since_uses_last_access_date(self):
+        """test_get_all_unused_since_uses_last_access_date"""
+
+        self.persistent_query_keyword.delete()
+        long_ago = timezone.now() - timedelta(days=40)
+        PersistentQueryKeyword.objects.update(creation_date=long_ago)
+        PersistentQueryKeyword.set_last_access_date(
+            self.fixture.persistent_query_keyword_1.id, timezone.now()
+        )
+
+        unused_persistent_queries = (
+            PersistentQueryKeyword.get_all_unused_since(
+                timezone.now() - timedelta(days=30)
+            )
+        )
+
+        self.assertSetEqual(
+            set(unused_persistent_queries.values_list("pk", flat=True)),
+            {
+                self.fixture.persistent_query_keyword_2.pk,
+                self.fixture.persistent_query_keyword_3.pk,
+            },
+        )
+
+
+class TestPersistentQueryKeywordIndexes(IntegrationBaseTestCase):
+    """Test Persistent Query Keyword Indexes"""
+
+    fixture = PersistentQueryKeywordFixtures()
+
+    def test_user_index_is_created(self):
+        """test_user_index_is_created"""
+
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, PersistentQueryKeyword._meta.db_table
+            )
+
+        self.assertTrue(constraints["persistent_kw_user_date_idx"]["index"])
+        self.assertListEqual(
+            constraints["persistent_kw_user_date_idx"]["columns"],
+            ["user_id", "creation_date"],
+        )
+
+    def test_content_hash_index_is_created(self):
+        """test_content_hash_index_is_created"""
+
+        with connection.cursor() as cursor:
+            constraints = connection.introspection.get_constraints(
+                cursor, PersistentQueryKeyword._meta.db_table
+            )
+
+        self.assertTrue(constraints["persistent_kw_content_hash_idx"]["index"])
+        self.assertListEqual(
+            constraints["persistent_kw_content_hash_idx"]["columns"],
+            ["content_hash"],
+        )
+
+
+@skipUnless(
+    connection.vendor == "sqlite",
+    "assertions match the EXPLAIN output of SQLite",
+)
+class TestPersistentQueryKeywordQueryPlans(IntegrationBaseTestCase):
+    """Test Persistent Query Keyword Query Plans"""
+
+    fixture = PersistentQueryKeywordFixtures()
+
+    def test_get_all_by_user_uses_user_index(self):
+        """test_get_all_by_user_uses_user_index"""
+
+        query_plan = PersistentQueryKeyword.get_all_by_user("1").explain()
+
+        self.assertIn("persistent_kw_user_date_idx", query_plan)
+
+    def test_user_listing_is_ordered_by_user_index(self):
+        """test_user_listing_is_ordered_by_user_index"""
+
+        query_plan = (
+            PersistentQueryKeyword.get_all_by_user("1")
+            .order_by("creation_date")
+            .explain()
+        )
+
+        self.assertIn("persistent_kw_user_date_idx", query_plan)
+        self.assertNotIn("TEMP B-TREE", query_plan)
+
+    def test_get_unnamed_by_content_uses_content_hash_index(self):
+        """test_get_unnamed_by_content_uses_content_hash_index"""
+
+        query_plan = PersistentQueryKeyword.objects.filter(
+            user_id="1", content_hash=get_content_hash({"a": 1})
+        ).explain()
+
+        self.assertIn("persistent_kw_content_hash_idx", query_plan)
+
+    def test_get_by_name_uses_name_index(self):
+        """test_get_by_name_uses_name_index"""
+
+        query_plan = PersistentQueryKeyword.objects.filter(
+            name="persistent_query_keyword_1"
+        ).explain()
+
+        self.assertIn("INDEX", query_plan)
+        self.assertNotIn("SCAN", query_plan)
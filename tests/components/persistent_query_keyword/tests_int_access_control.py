@@ -261,6 +261,69 @@ class TestPersistentQueryKeywordDelete(IntegrationBaseTestCase):
             )
 
 
+class TestPersistentQueryKeywordDeleteList(IntegrationBaseTestCase):
+    """Test Persistent Query Keyword Delete List"""
+
+    fixture = fixture_persistent_query_keyword
+
+    def test_delete_list_as_superuser_deletes_all_persistent_query_keyword(
+        self,
+    ):
+        """test_delete_list_as_superuser_deletes_all_persistent_query_keyword"""
+
+        # Arrange
+        mock_user = create_mock_user("0", is_staff=True, is_superuser=True)
+
+        # Act
+        deleted = persistent_query_keyword_api.delete_list(
+            PersistentQueryKeyword.get_all(), mock_user
+        )
+
+        # Assert
+        self.assertEqual(deleted, 3)
+        self.assertEqual(PersistentQueryKeyword.get_all().count(), 0)
+
+    def test_delete_own_list_deletes_persistent_query_keyword(self):
+        """test_delete_own_list_deletes_persistent_query_keyword"""
+
+        # Arrange
+        mock_user = create_mock_user("1")
+
+        # Act
+        deleted = persistent_query_keyword_api.delete_list(
+            PersistentQueryKeyword.get_all_by_user("1"), mock_user
+        )
+
+        # Assert
+        self.assertEqual(deleted, 1)
+        self.assertEqual(PersistentQueryKeyword.get_all().count(), 2)
+
+    def test_delete_list_with_others_persistent_query_keyword_raises_error(
+        self,
+    ):
+        """test_delete_list_with_others_persistent_query_keyword_raises_error"""
+
+        # Arrange
+        mock_user = create_mock_user("1")
+
+        # Act # Assert
+        with self.assertRaises(AccessControlError):
+            persistent_query_keyword_api.delete_list(
+                PersistentQueryKeyword.get_all(), mock_user
+            )
+        self.assertEqual(PersistentQueryKeyword.get_all().count(), 3)
+
+    def test_delete_list_as_anonymous_raises_error(self):
+        """test_delete_list_as_anonymous_raises_error"""
+
+        # Act # Assert
+        with self.assertRaises(AccessControlError):
+            persistent_query_keyword_api.delete_list(
+                PersistentQueryKeyword.get_all_by_user("None"),
+                AnonymousUser(),
+            )
+
+
 class TestPersistentQueryKeywordUpdate(IntegrationBaseTestCase):
     """Test Persistent Query Keyword Update"""
 
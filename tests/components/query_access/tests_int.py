@@ -0,0 +1,63 @@
+""" Integration tests for QueryAccess
+"""
+from datetime import timedelta
+
+from django.utils import timezone
+
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_explore_keyword_app.components.query_access import (
+    api as query_access_api,
+)
+from core_explore_keyword_app.components.query_access.models import (
+    QueryAccess,
+)
+from tests.views.user.views.fixtures.fixtures import QueryFixtures
+
+
+class TestRecordAccess(IntegrationBaseTestCase):
+    """Test Record Access"""
+
+    fixture = QueryFixtures()
+
+    def test_first_access_creates_query_access(self):
+        """test_first_access_creates_query_access"""
+
+        QueryAccess.objects.all().delete()
+
+        query_access_api.record_access(self.fixture.query)
+
+        self.assertIsNotNone(
+            QueryAccess.get_last_access_date(self.fixture.query.pk)
+        )
+
+    def test_recent_access_is_not_written_again(self):
+        """test_recent_access_is_not_written_again"""
+
+        last_access_date = QueryAccess.get_last_access_date(
+            self.fixture.query.pk
+        )
+
+        with self.assertNumQueries(1):
+            query_access_api.record_access(self.fixture.query)
+
+        self.assertEqual(
+            QueryAccess.get_last_access_date(self.fixture.query.pk),
+            last_access_date,
+        )
+
+    def test_old_access_is_updated(self):
+        """test_old_access_is_updated"""
+
+        old_access_date = timezone.now() - timedelta(days=2)
+        QueryAccess.set_last_access_date(
+            self.fixture.query.pk, old_access_date
+        )
+
+        query_access_api.record_access(self.fixture.query)
+
+        self.assertGreater(
+            QueryAccess.get_last_access_date(self.fixture.query.pk),
+            old_access_date,
+        )
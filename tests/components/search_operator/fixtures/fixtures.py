@@ -0,0 +1,41 @@
+""" Fixtures files for Search Operator
+"""
+from core_main_app.utils.integration_tests.fixture_interface import (
+    FixtureInterface,
+)
+from core_explore_keyword_app.components.search_operator.models import (
+    SearchOperator,
+)
+
+
+class SearchOperatorFixtures(FixtureInterface):
+    """Search operator fixtures"""
+
+    data_collection = None
+
+    def insert_data(self):
+        """Insert a set of Search Operators.
+
+        Returns:
+
+        """
+        self.generate_search_operator_collection()
+
+    def generate_search_operator_collection(self, count=10):
+        """Generate a Search Operator collection.
+
+        Args:
+            count:
+
+        Returns:
+
+        """
+        self.data_collection = []
+        for index in range(count):
+            search_operator = SearchOperator(
+                name="operator%d" % index,
+                xpath_list=["/root/element%d" % index],
+                dot_notation_list=["root.element%d" % index],
+            )
+            search_operator.save()
+            self.data_collection.append(search_operator)
@@ -1,18 +1,36 @@
 """ Integration Test for Persistent Query Keyword Rest API
 """
 
+import gzip
+import json
+from datetime import timedelta
+from unittest.mock import patch
+from urllib.parse import parse_qs, urlparse
+
 from django.contrib.auth.models import AnonymousUser
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from rest_framework import status
 
+from core_main_app.components.template.models import Template
 from core_main_app.utils.integration_tests.integration_base_test_case import (
     IntegrationBaseTestCase,
 )
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
 from core_main_app.utils.tests_tools.RequestMock import RequestMock
 
+from core_explore_keyword_app.components.persistent_query_keyword.models import (
+    PersistentQueryKeyword,
+)
 from core_explore_keyword_app.rest.persistent_query_keyword import (
     views as persistent_query_keyword_views,
 )
+from core_explore_keyword_app.rest.persistent_query_keyword.serializers import (
+    PersistentQueryKeywordSerializer,
+    serialize_persistent_query_keyword_list,
+)
+from core_explore_keyword_app.utils.pagination import KeysetPagination
 from tests.components.persistent_query_keyword.fixtures.fixtures import (
     PersistentQueryKeywordFixtures,
 )
@@ -47,7 +65,8 @@ class TestPersistentQueryKeywordListAdmin(IntegrationBaseTestCase):
         )
 
         # Assert
-        self.assertEqual(len(response.data), 3)
+        self.assertEqual(len(response.data["results"]), 3)
+        self.assertIsNone(response.data["next"])
 
     def test_post_returns_http_201(self):
         """test_post_returns_http_201"""
@@ -65,6 +84,326 @@ class TestPersistentQueryKeywordListAdmin(IntegrationBaseTestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
 
+class TestPersistentQueryKeywordListAdminPagination(IntegrationBaseTestCase):
+    """Test Persistent Query Keyword List Admin Pagination"""
+
+    fixture = fixture_data_structure
+
+    def setUp(self):
+        """setUp"""
+
+        super().setUp()
+
+        self.user = create_mock_user("1", is_staff=True, is_superuser=True)
+
+    def _get(self, data):
+        """Get a page of the admin list
+
+        Args:
+            data:
+
+        Returns:
+        """
+        return RequestMock.do_request_get(
+            persistent_query_keyword_views.AdminPersistentQueryKeywordList.as_view(),
+            self.user,
+            data=data,
+        )
+
+    def _get_all_pages(self, page_size):
+        """Get the ids of all the pages of the admin list
+
+        Args:
+            page_size:
+
+        Returns:
+        """
+        pages = []
+        data = {"page_size": page_size}
+        while True:
+            response = self._get(data)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+            pages.append([result["id"] for result in response.data["results"]])
+            if response.data["next"] is None:
+                return pages
+            data = {
+                key: value[0]
+                for key, value in parse_qs(
+                    urlparse(response.data["next"]).query
+                ).items()
+            }
+
+    def test_pages_follow_creation_order(self):
+        """test_pages_follow_creation_order"""
+
+        pages = self._get_all_pages(page_size=2)
+
+        self.assertListEqual(
+            pages,
+            [
+                [
+                    self.fixture.persistent_query_keyword_1.id,
+                    self.fixture.persistent_query_keyword_2.id,
+                ],
+                [self.fixture.persistent_query_keyword_3.id],
+            ],
+        )
+
+    def test_pages_with_same_creation_date_are_ordered_by_id(self):
+        """test_pages_with_same_creation_date_are_ordered_by_id"""
+
+        PersistentQueryKeyword.objects.update(creation_date=timezone.now())
+
+        pages = self._get_all_pages(page_size=1)
+
+        self.assertListEqual(
+            pages,
+            [
+                [persistent_query_keyword.id]
+                for persistent_query_keyword in sorted(
+                    self.fixture.data_collection,
+                    key=lambda persistent_query_keyword: persistent_query_keyword.id,
+                )
+            ],
+        )
+
+    def test_page_size_is_bounded(self):
+        """test_page_size_is_bounded"""
+
+        with patch.object(KeysetPagination, "max_page_size", 2):
+            response = self._get({"page_size": 1000})
+
+        self.assertEqual(len(response.data["results"]), 2)
+        self.assertIsNotNone(response.data["next"])
+
+    def test_invalid_cursor_returns_http_400(self):
+        """test_invalid_cursor_returns_http_400"""
+
+        response = self._get({"cursor": "invalid"})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_invalid_page_size_returns_http_400(self):
+        """test_invalid_page_size_returns_http_400"""
+
+        response = self._get({"page_size": 0})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_pagination_can_be_disabled(self):
+        """test_pagination_can_be_disabled"""
+
+        response = self._get({"paginate": "false", "page_size": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data), 3)
+
+
+class TestSerializePersistentQueryKeywordList(IntegrationBaseTestCase):
+    """Test Serialize Persistent Query Keyword List"""
+
+    fixture = fixture_data_structure
+
+    def setUp(self):
+        """setUp"""
+
+        super().setUp()
+
+        templates = []
+        for index in range(3):
+            template = Template(
+                filename="template_%d.xsd" % index,
+                user="1",
+                _hash="hash_%d" % index,
+            )
+            template.save()
+            templates.append(template)
+        self.fixture.persistent_query_keyword_1.templates.set(templates)
+        self.fixture.persistent_query_keyword_2.templates.set(templates[:1])
+        self.fixture.persistent_query_keyword_2.content = "{}"
+        self.fixture.persistent_query_keyword_2.save()
+
+    def test_returns_model_serializer_representation(self):
+        """test_returns_model_serializer_representation"""
+
+        expected = PersistentQueryKeywordSerializer(
+            PersistentQueryKeyword.get_all().order_by("id"), many=True
+        ).data
+
+        result = serialize_persistent_query_keyword_list(
+            PersistentQueryKeyword.get_all().order_by("id")
+        )
+
+        self.assertListEqual(
+            [
+                dict(item, templates=sorted(item["templates"]))
+                for item in result
+            ],
+            [
+                dict(item, templates=sorted(item["templates"]))
+                for item in expected
+            ],
+        )
+
+    def test_query_count_does_not_depend_on_rows(self):
+        """test_query_count_does_not_depend_on_rows"""
+
+        # persistent queries, templates
+        with self.assertNumQueries(2):
+            serialize_persistent_query_keyword_list(
+                PersistentQueryKeyword.get_all()
+            )
+
+
+class TestPersistentQueryKeywordExportAdmin(IntegrationBaseTestCase):
+    """Test Persistent Query Keyword Export Admin"""
+
+    fixture = fixture_data_structure
+
+    def setUp(self):
+        """setUp"""
+
+        super().setUp()
+
+        self.user = create_mock_user("1", is_staff=True, is_superuser=True)
+        template = Template(filename="template.xsd", user="1", _hash="hash")
+        template.save()
+        self.fixture.persistent_query_keyword_1.templates.set([template])
+        self.template = template
+
+    def _export(self, data=None):
+        """Export the persistent queries
+
+        Args:
+            data:
+
+        Returns:
+        """
+        response = RequestMock.do_request_get(
+            persistent_query_keyword_views.AdminPersistentQueryKeywordExport.as_view(),
+            self.user,
+            data=data,
+        )
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        return response
+
+    def test_export_returns_one_line_per_persistent_query(self):
+        """test_export_returns_one_line_per_persistent_query"""
+
+        response = self._export()
+        lines = b"".join(response.streaming_content).decode().splitlines()
+
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        items = [json.loads(line) for line in lines]
+        self.assertListEqual(
+            [item["id"] for item in items],
+            [
+                persistent_query_keyword.id
+                for persistent_query_keyword in self.fixture.data_collection
+            ],
+        )
+        self.assertEqual(items[0]["name"], "persistent_query_keyword_1")
+        self.assertListEqual(items[0]["templates"], [self.template.id])
+        self.assertIn("creation_date", items[0])
+
+    def test_export_is_read_by_chunks(self):
+        """test_export_is_read_by_chunks"""
+
+        with patch.object(
+            persistent_query_keyword_views,
+            "EXPLORE_KEYWORD_PERSISTENT_QUERY_EXPORT_CHUNK_SIZE",
+            2,
+        ):
+            response = self._export()
+            lines = b"".join(response.streaming_content).decode().splitlines()
+
+        self.assertEqual(len(lines), 3)
+
+    def test_gzip_export_returns_compressed_lines(self):
+        """test_gzip_export_returns_compressed_lines"""
+
+        response = self._export({"gzip": "true"})
+        content = gzip.decompress(b"".join(response.streaming_content))
+
+        self.assertEqual(response["Content-Type"], "application/gzip")
+        self.assertEqual(len(content.decode().splitlines()), 3)
+
+
+class TestPersistentQueryKeywordImportAdmin(IntegrationBaseTestCase):
+    """Test Persistent Query Keyword Import Admin"""
+
+    fixture = fixture_data_structure
+
+    def setUp(self):
+        """setUp"""
+
+        super().setUp()
+
+        self.user = create_mock_user("1", is_staff=True, is_superuser=True)
+
+    def test_import_of_export_creates_persistent_queries(self):
+        """test_import_of_export_creates_persistent_queries"""
+
+        # Arrange
+        response = RequestMock.do_request_get(
+            persistent_query_keyword_views.AdminPersistentQueryKeywordExport.as_view(),
+            self.user,
+        )
+        rows = [
+            json.loads(line)
+            for line in b"".join(response.streaming_content)
+            .decode()
+            .splitlines()
+        ]
+        for row in rows:
+            row["name"] = "imported_%s" % row["id"]
+
+        # Act
+        response = RequestMock.do_request_post(
+            persistent_query_keyword_views.AdminPersistentQueryKeywordImport.as_view(),
+            self.user,
+            data=rows,
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["created"], 3)
+        self.assertListEqual(response.data["errors"], [])
+        self.assertEqual(PersistentQueryKeyword.objects.count(), 6)
+
+    def test_import_reports_invalid_items(self):
+        """test_import_reports_invalid_items"""
+
+        # Act
+        response = RequestMock.do_request_post(
+            persistent_query_keyword_views.AdminPersistentQueryKeywordImport.as_view(),
+            self.user,
+            data=[
+                {"user_id": "1", "name": "persistent_query_keyword_1"},
+                {"user_id": "1", "name": "imported"},
+            ],
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["created"], 1)
+        self.assertEqual(response.data["errors"][0]["index"], 0)
+        self.assertIn("name", response.data["errors"][0]["errors"])
+
+    def test_import_of_object_returns_http_400(self):
+        """test_import_of_object_returns_http_400"""
+
+        # Act
+        response = RequestMock.do_request_post(
+            persistent_query_keyword_views.AdminPersistentQueryKeywordImport.as_view(),
+            self.user,
+            data={"user_id": "1"},
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
 class TestPersistentQueryKeywordList(IntegrationBaseTestCase):
     """Test Persistent Query Keyword List"""
 
@@ -92,7 +431,8 @@ class TestPersistentQueryKeywordList(IntegrationBaseTestCase):
         )
 
         # Assert
-        self.assertEqual(len(response.data), 1)
+        self.assertEqual(len(response.data["results"]), 1)
+        self.assertIsNone(response.data["next"])
 
     def test_post_returns_http_201(self):
         """test_post_returns_http_201"""
@@ -108,6 +448,169 @@ class TestPersistentQueryKeywordList(IntegrationBaseTestCase):
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
 
+class TestPersistentQueryKeywordDeleteList(IntegrationBaseTestCase):
+    """Test Persistent Query Keyword Delete List"""
+
+    fixture = fixture_data_structure
+
+    def _delete_list(self, user, data):
+        """Delete the persistent query keyword matching the filters
+
+        Args:
+            user:
+            data:
+
+        Returns:
+        """
+        return RequestMock.do_request_post(
+            persistent_query_keyword_views.PersistentQueryKeywordDeleteList.as_view(),
+            user,
+            data=data,
+        )
+
+    def test_superuser_deletes_by_ids(self):
+        """test_superuser_deletes_by_ids"""
+
+        # Arrange
+        user = create_mock_user("0", is_staff=True, is_superuser=True)
+        ids = [
+            self.fixture.persistent_query_keyword_1.id,
+            self.fixture.persistent_query_keyword_2.id,
+        ]
+
+        # Act
+        response = self._delete_list(user, {"ids": ids})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["deleted"], 2)
+        self.assertListEqual(
+            list(PersistentQueryKeyword.objects.values_list("id", flat=True)),
+            [self.fixture.persistent_query_keyword_3.id],
+        )
+
+    def test_superuser_deletes_by_user_id(self):
+        """test_superuser_deletes_by_user_id"""
+
+        # Arrange
+        user = create_mock_user("0", is_staff=True, is_superuser=True)
+
+        # Act
+        response = self._delete_list(user, {"user_id": "2"})
+
+        # Assert
+        self.assertEqual(response.data["deleted"], 1)
+        self.assertFalse(
+            PersistentQueryKeyword.objects.filter(user_id="2").exists()
+        )
+
+    def test_delete_by_older_than_keeps_recent_persistent_query_keyword(
+        self,
+    ):
+        """test_delete_by_older_than_keeps_recent_persistent_query_keyword"""
+
+        # Arrange
+        user = create_mock_user("0", is_staff=True, is_superuser=True)
+        PersistentQueryKeyword.objects.filter(
+            pk=self.fixture.persistent_query_keyword_1.pk
+        ).update(creation_date=timezone.now() - timedelta(days=10))
+
+        # Act
+        response = self._delete_list(
+            user,
+            {"older_than": (timezone.now() - timedelta(days=5)).isoformat()},
+        )
+
+        # Assert
+        self.assertEqual(response.data["deleted"], 1)
+        self.assertEqual(PersistentQueryKeyword.objects.count(), 2)
+
+    def test_user_deletes_own_persistent_query_keyword_only(self):
+        """test_user_deletes_own_persistent_query_keyword_only"""
+
+        # Arrange
+        user = create_mock_user("1")
+
+        # Act
+        response = self._delete_list(
+            user,
+            {"older_than": (timezone.now() + timedelta(days=1)).isoformat()},
+        )
+
+        # Assert
+        self.assertEqual(response.data["deleted"], 1)
+        self.assertFalse(
+            PersistentQueryKeyword.objects.filter(user_id="1").exists()
+        )
+        self.assertEqual(PersistentQueryKeyword.objects.count(), 2)
+
+    def test_user_deleting_others_ids_returns_http_403(self):
+        """test_user_deleting_others_ids_returns_http_403"""
+
+        # Arrange
+        user = create_mock_user("1")
+
+        # Act
+        response = self._delete_list(
+            user,
+            {
+                "ids": [
+                    self.fixture.persistent_query_keyword_1.id,
+                    self.fixture.persistent_query_keyword_2.id,
+                ]
+            },
+        )
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(PersistentQueryKeyword.objects.count(), 3)
+
+    def test_user_deleting_others_user_id_returns_http_403(self):
+        """test_user_deleting_others_user_id_returns_http_403"""
+
+        # Act
+        response = self._delete_list(create_mock_user("1"), {"user_id": "2"})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_delete_without_filter_returns_http_400(self):
+        """test_delete_without_filter_returns_http_400"""
+
+        # Arrange
+        user = create_mock_user("0", is_staff=True, is_superuser=True)
+
+        # Act
+        response = self._delete_list(user, {})
+
+        # Assert
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(PersistentQueryKeyword.objects.count(), 3)
+
+    def test_number_of_queries_does_not_depend_on_number_of_ids(self):
+        """test_number_of_queries_does_not_depend_on_number_of_ids"""
+
+        # Arrange
+        user = create_mock_user("1")
+        persistent_query_list = [
+            PersistentQueryKeyword(user_id="1") for _ in range(20)
+        ]
+        PersistentQueryKeyword.objects.bulk_create(persistent_query_list)
+        ids = list(
+            PersistentQueryKeyword.objects.filter(user_id="1").values_list(
+                "id", flat=True
+            )
+        )
+
+        # Act
+        with CaptureQueriesContext(connection) as context:
+            response = self._delete_list(user, {"ids": ids})
+
+        # Assert
+        self.assertEqual(response.data["deleted"], 21)
+        self.assertLessEqual(len(context.captured_queries), 6)
+
+
 class TestPersistentQueryKeywordDetail(IntegrationBaseTestCase):
     """Test Persistent Query Keyword Detail"""
 
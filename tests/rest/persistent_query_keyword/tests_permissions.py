@@ -50,7 +50,7 @@ class TestAdminPersistentQueryKeywordListGet(SimpleTestCase):
     def test_superuser_returns_http_200(self, get_all):
         """test_superuser_returns_http_200"""
 
-        get_all.return_value = {}
+        get_all.return_value = PersistentQueryKeyword.get_none()
         mock_user = create_mock_user("1", is_staff=True, is_superuser=True)
 
         response = RequestMock.do_request_get(
@@ -61,6 +61,127 @@ class TestAdminPersistentQueryKeywordListGet(SimpleTestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
 
+class TestAdminPersistentQueryKeywordExportGet(SimpleTestCase):
+    """Test Admin Persistent Query Keyword Export Get"""
+
+    def test_anonymous_returns_http_403(self):
+        """test_anonymous_returns_http_403"""
+
+        response = RequestMock.do_request_get(
+            persistent_query_keyword_views.AdminPersistentQueryKeywordExport.as_view(),
+            AnonymousUser(),
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_authenticated_returns_http_403(self):
+        """test_authenticated_returns_http_403"""
+
+        mock_user = create_mock_user("1")
+
+        response = RequestMock.do_request_get(
+            persistent_query_keyword_views.AdminPersistentQueryKeywordExport.as_view(),
+            mock_user,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @patch.object(PersistentQueryKeyword, "get_all")
+    def test_superuser_returns_http_200(self, get_all):
+        """test_superuser_returns_http_200"""
+
+        get_all.return_value = PersistentQueryKeyword.get_none()
+        mock_user = create_mock_user("1", is_staff=True, is_superuser=True)
+
+        response = RequestMock.do_request_get(
+            persistent_query_keyword_views.AdminPersistentQueryKeywordExport.as_view(),
+            mock_user,
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class TestAdminPersistentQueryKeywordImportPost(SimpleTestCase):
+    """Test Admin Persistent Query Keyword Import Post"""
+
+    def test_anonymous_returns_http_403(self):
+        """test_anonymous_returns_http_403"""
+
+        response = RequestMock.do_request_post(
+            persistent_query_keyword_views.AdminPersistentQueryKeywordImport.as_view(),
+            AnonymousUser(),
+            data=[],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_authenticated_returns_http_403(self):
+        """test_authenticated_returns_http_403"""
+
+        mock_user = create_mock_user("1")
+
+        response = RequestMock.do_request_post(
+            persistent_query_keyword_views.AdminPersistentQueryKeywordImport.as_view(),
+            mock_user,
+            data=[],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @patch.object(persistent_query_keyword_views, "import_persistent_queries")
+    def test_superuser_returns_http_200(self, import_persistent_queries):
+        """test_superuser_returns_http_200"""
+
+        import_persistent_queries.return_value = {
+            "created": 0,
+            "errors": [],
+            "elapsed": 0,
+        }
+        mock_user = create_mock_user("1", is_staff=True, is_superuser=True)
+
+        response = RequestMock.do_request_post(
+            persistent_query_keyword_views.AdminPersistentQueryKeywordImport.as_view(),
+            mock_user,
+            data=[],
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
+class TestPersistentQueryKeywordDeleteListPost(SimpleTestCase):
+    """Test Persistent Query Keyword Delete List Post"""
+
+    def test_anonymous_returns_http_403(self):
+        """test_anonymous_returns_http_403"""
+
+        response = RequestMock.do_request_post(
+            persistent_query_keyword_views.PersistentQueryKeywordDeleteList.as_view(),
+            AnonymousUser(),
+            data={"ids": [1]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    @patch.object(persistent_query_keyword_api, "delete_list")
+    @patch.object(PersistentQueryKeyword, "get_all_by_filters")
+    def test_authenticated_returns_http_200(
+        self, get_all_by_filters, delete_list
+    ):
+        """test_authenticated_returns_http_200"""
+
+        get_all_by_filters.return_value = PersistentQueryKeyword.get_none()
+        delete_list.return_value = 0
+        mock_user = create_mock_user("1")
+
+        response = RequestMock.do_request_post(
+            persistent_query_keyword_views.PersistentQueryKeywordDeleteList.as_view(),
+            mock_user,
+            data={"ids": [1]},
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+
 class TestPersistentQueryKeywordListGet(SimpleTestCase):
     """Test Persistent Query Keyword List Get"""
 
@@ -78,7 +199,7 @@ class TestPersistentQueryKeywordListGet(SimpleTestCase):
     def test_authenticated_returns_http_200(self, get_all):
         """test_authenticated_returns_http_200"""
 
-        get_all.return_value = {}
+        get_all.return_value = PersistentQueryKeyword.get_none()
         mock_user = create_mock_user("1")
 
         response = RequestMock.do_request_get(
@@ -92,7 +213,7 @@ class TestPersistentQueryKeywordListGet(SimpleTestCase):
     def test_superuser_returns_http_200(self, get_all):
         """test_superuser_returns_http_200"""
 
-        get_all.return_value = {}
+        get_all.return_value = PersistentQueryKeyword.get_none()
         mock_user = create_mock_user("1", is_staff=True, is_superuser=True)
 
         response = RequestMock.do_request_get(
@@ -0,0 +1,73 @@
+""" Authentication tests for suggestions REST API.
+"""
+from django.test import SimpleTestCase
+from rest_framework import status
+
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_main_app.utils.tests_tools.RequestMock import RequestMock
+from core_explore_keyword_app.rest.suggestions import (
+    views as suggestion_rest_views,
+)
+
+
+class TestSuggestionCacheStatsGet(SimpleTestCase):
+    """Test Suggestion Cache Stats Get"""
+
+    def test_anonymous_returns_http_403(self):
+        """test_anonymous_returns_http_403"""
+
+        response = RequestMock.do_request_get(
+            suggestion_rest_views.SuggestionCacheStats.as_view(), None
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_authenticated_returns_http_403(self):
+        """test_authenticated_returns_http_403"""
+
+        mock_user = create_mock_user("1")
+
+        response = RequestMock.do_request_get(
+            suggestion_rest_views.SuggestionCacheStats.as_view(), mock_user
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_staff_returns_http_200(self):
+        """test_staff_returns_http_200"""
+
+        mock_user = create_mock_user("1", is_staff=True)
+
+        response = RequestMock.do_request_get(
+            suggestion_rest_views.SuggestionCacheStats.as_view(), mock_user
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertIn("hits", response.data)
+        self.assertIn("misses", response.data)
+
+
+class TestSuggestionCacheStatsDelete(SimpleTestCase):
+    """Test Suggestion Cache Stats Delete"""
+
+    def test_authenticated_returns_http_403(self):
+        """test_authenticated_returns_http_403"""
+
+        mock_user = create_mock_user("1")
+
+        response = RequestMock.do_request_delete(
+            suggestion_rest_views.SuggestionCacheStats.as_view(), mock_user
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_staff_returns_http_204(self):
+        """test_staff_returns_http_204"""
+
+        mock_user = create_mock_user("1", is_staff=True)
+
+        response = RequestMock.do_request_delete(
+            suggestion_rest_views.SuggestionCacheStats.as_view(), mock_user
+        )
+
+        self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
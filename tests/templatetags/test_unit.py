@@ -30,13 +30,33 @@ class TestSearchBar(TestCase):
         mock_user = create_mock_user("1")
         mock_request = create_mock_request(user=mock_user)
         mock_context = {"request": mock_request}
-        mock_add_local_data_source.return_value = None
-        mock_set_visibility_to_query.return_value = None
-        mock_upsert.return_value = None
 
         response = show_search_bar(context=mock_context)
 
         self.assertTrue("search_form" in response["data"])
-        self.assertTrue(mock_add_local_data_source.called)
-        self.assertTrue(mock_set_visibility_to_query.called)
-        self.assertTrue(mock_upsert.called)
+        self.assertEqual(response["data"]["query_id"], "")
+        self.assertTrue(response["data"]["search_form"].data["embedded"])
+
+    @patch("core_explore_common_app.components.query.api.upsert")
+    @patch(
+        "core_explore_common_app.components.query.api.set_visibility_to_query"
+    )
+    @patch(
+        "core_explore_common_app.components.query.api.add_local_data_source"
+    )
+    def test_search_bar_does_not_create_query(
+        self,
+        mock_add_local_data_source,
+        mock_set_visibility_to_query,
+        mock_upsert,
+    ):
+        """test_search_bar_does_not_create_query"""
+        mock_user = create_mock_user("1")
+        mock_request = create_mock_request(user=mock_user)
+        mock_context = {"request": mock_request}
+
+        show_search_bar(context=mock_context)
+
+        self.assertFalse(mock_add_local_data_source.called)
+        self.assertFalse(mock_set_visibility_to_query.called)
+        self.assertFalse(mock_upsert.called)
@@ -0,0 +1,105 @@
+""" Unit tests for the cache utilities
+"""
+from unittest import TestCase
+from unittest.mock import patch
+
+from django.test import override_settings
+
+from core_explore_keyword_app.utils.cache import (
+    LRUTTLCache,
+    bump_generation,
+    get_generation,
+)
+
+
+class TestLRUTTLCache(TestCase):
+    """Test LRU TTL Cache"""
+
+    def test_get_returns_stored_value(self):
+        """test_get_returns_stored_value"""
+
+        cache = LRUTTLCache(2, 60)
+        cache.set("key", "value")
+
+        self.assertEqual(cache.get("key"), "value")
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """test_least_recently_used_entry_is_evicted"""
+
+        cache = LRUTTLCache(2, 60)
+        cache.set("key_1", 1)
+        cache.set("key_2", 2)
+        cache.get("key_1")
+        cache.set("key_3", 3)
+
+        self.assertEqual(cache.get("key_1"), 1)
+        self.assertIsNone(cache.get("key_2"))
+        self.assertEqual(cache.get("key_3"), 3)
+
+    @patch("core_explore_keyword_app.utils.cache.time.monotonic")
+    def test_expired_entry_is_missing(self, mock_monotonic):
+        """test_expired_entry_is_missing"""
+
+        cache = LRUTTLCache(2, 60)
+        mock_monotonic.return_value = 0
+        cache.set("key", "value")
+        mock_monotonic.return_value = 61
+
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.get_stats()["size"], 0)
+
+    def test_zero_size_disables_cache(self):
+        """test_zero_size_disables_cache"""
+
+        cache = LRUTTLCache(0, 60)
+        cache.set("key", "value")
+
+        self.assertIsNone(cache.get("key"))
+
+    def test_stats_count_hits_and_misses(self):
+        """test_stats_count_hits_and_misses"""
+
+        cache = LRUTTLCache(2, 60)
+        cache.set("key", "value")
+        cache.get("key")
+        cache.get("other_key")
+        cache.clear()
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["size"], 0)
+
+
+class TestGeneration(TestCase):
+    """Test Generation"""
+
+    def test_bump_generation_changes_generation(self):
+        """test_bump_generation_changes_generation"""
+
+        generation = get_generation("mock_name")
+
+        self.assertEqual(get_generation("mock_name"), generation)
+        self.assertNotEqual(bump_generation("mock_name"), generation)
+        self.assertNotEqual(get_generation("mock_name"), generation)
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.dummy.DummyCache"
+            }
+        }
+    )
+    def test_generation_without_cache_is_not_none(self):
+        """test_generation_without_cache_is_not_none"""
+
+        self.assertIsNotNone(get_generation("mock_name"))
+
+    @patch("core_explore_keyword_app.utils.cache.cache")
+    def test_generation_evicted_after_add_is_not_none(self, mock_cache):
+        """test_generation_evicted_after_add_is_not_none"""
+
+        mock_cache.get.return_value = None
+        mock_cache.add.return_value = False
+
+        self.assertIsNotNone(get_generation("mock_name"))
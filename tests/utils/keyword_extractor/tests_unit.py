@@ -0,0 +1,67 @@
+""" Unit tests for the keyword extractor utilities
+"""
+from unittest import TestCase
+
+from core_explore_keyword_app.utils.keyword_extractor import (
+    KeywordExtractor,
+    get_keyword_extractor,
+)
+
+
+class TestKeywordExtractorExtract(TestCase):
+    """Test Keyword Extractor Extract"""
+
+    def test_returns_whole_words_starting_with_prefix(self):
+        """test_returns_whole_words_starting_with_prefix"""
+
+        extractor = KeywordExtractor(["ste", "al"])
+        content = "<a>Steel</a><b>stainless steels</b><c>metal alloy</c>"
+
+        self.assertSetEqual(
+            extractor.extract(content), {"steel", "steels", "alloy"}
+        )
+
+    def test_longest_prefix_is_matched(self):
+        """test_longest_prefix_is_matched"""
+
+        extractor = KeywordExtractor(["st", "steel"])
+
+        self.assertSetEqual(extractor.extract("steels"), {"steels"})
+
+    def test_special_characters_are_escaped(self):
+        """test_special_characters_are_escaped"""
+
+        extractor = KeywordExtractor(["a.b"])
+
+        self.assertSetEqual(extractor.extract("axb"), set())
+
+    def test_no_prefix_returns_empty_set(self):
+        """test_no_prefix_returns_empty_set"""
+
+        self.assertSetEqual(KeywordExtractor([]).extract("steel"), set())
+
+
+class TestKeywordExtractorCount(TestCase):
+    """Test Keyword Extractor Count"""
+
+    def test_counts_document_frequencies(self):
+        """test_counts_document_frequencies"""
+
+        extractor = KeywordExtractor(["ste"])
+
+        self.assertDictEqual(
+            dict(extractor.count(["steel steel", "Steel stem", None])),
+            {"steel": 2, "stem": 1},
+        )
+
+
+class TestGetKeywordExtractor(TestCase):
+    """Test Get Keyword Extractor"""
+
+    def test_extractor_is_reused_for_same_keywords(self):
+        """test_extractor_is_reused_for_same_keywords"""
+
+        self.assertIs(
+            get_keyword_extractor("Steel alloy"),
+            get_keyword_extractor("alloy steel"),
+        )
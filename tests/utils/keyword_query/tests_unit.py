@@ -0,0 +1,191 @@
+""" Unit tests for the keyword query utilities
+"""
+import json
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from core_explore_keyword_app.components.search_operator.models import (
+    SearchOperator,
+)
+from core_explore_keyword_app.utils import keyword_query, search_operators
+from core_explore_keyword_app.utils.keyword_query import (
+    And,
+    Keyword,
+    OperatorTerm,
+    compile_query,
+    decompile_query,
+    get_query_content,
+    parse_keywords,
+    parse_query_content,
+)
+from core_explore_keyword_app.utils.search_operator_registry import (
+    SearchOperatorRegistry,
+)
+
+
+def _get_mock_registry(generation=None):
+    """Return a registry with a `material` search operator
+
+    Args:
+        generation:
+
+    Returns:
+    """
+    mock_search_operator = Mock(spec=SearchOperator)
+    mock_search_operator.name = "material"
+    mock_search_operator.dot_notation_list = ["root.material", "root.alloy"]
+    return SearchOperatorRegistry([mock_search_operator], generation)
+
+
+MATERIAL_TERM = OperatorTerm(
+    name="material",
+    dot_notation_list=("root.material", "root.alloy"),
+    value="steel",
+)
+MATERIAL_QUERY = {
+    "$or": [
+        {"root.material": "steel"},
+        {"root.alloy": "steel"},
+        {"root.material.#text": "steel"},
+        {"root.alloy.#text": "steel"},
+    ]
+}
+
+
+class TestParseKeywords(TestCase):
+    """Test Parse Keywords"""
+
+    @patch.object(search_operators, "get_search_operator_registry")
+    def test_returns_operator_terms_and_keywords(
+        self, mock_get_search_operator_registry
+    ):
+        """test_returns_operator_terms_and_keywords"""
+
+        mock_get_search_operator_registry.return_value = _get_mock_registry()
+
+        self.assertEqual(
+            parse_keywords(["alloy", "material:steel", "unknown:value"]),
+            And(
+                (
+                    Keyword("alloy"),
+                    MATERIAL_TERM,
+                    Keyword("unknown:value"),
+                )
+            ),
+        )
+
+
+class TestCompileQuery(TestCase):
+    """Test Compile Query"""
+
+    def test_empty_query_matches_all_documents(self):
+        """test_empty_query_matches_all_documents"""
+
+        self.assertDictEqual(compile_query(And()), {})
+
+    def test_single_term_is_not_wrapped(self):
+        """test_single_term_is_not_wrapped"""
+
+        self.assertDictEqual(
+            compile_query(And((MATERIAL_TERM,))), MATERIAL_QUERY
+        )
+
+    def test_keywords_are_searched_together_after_operators(self):
+        """test_keywords_are_searched_together_after_operators"""
+
+        query = And((Keyword("alloy"), MATERIAL_TERM, Keyword("iron")))
+
+        self.assertDictEqual(
+            compile_query(query),
+            {
+                "$and": [
+                    MATERIAL_QUERY,
+                    {"$text": {"$search": '"alloy" "iron"'}},
+                ]
+            },
+        )
+
+    def test_get_query_content_returns_json(self):
+        """test_get_query_content_returns_json"""
+
+        self.assertDictEqual(
+            json.loads(get_query_content(And((Keyword("alloy"),)))),
+            {"$text": {"$search": '"alloy"'}},
+        )
+
+
+class TestDecompileQuery(TestCase):
+    """Test Decompile Query"""
+
+    def test_compiled_query_is_decompiled(self):
+        """test_compiled_query_is_decompiled"""
+
+        query = And((MATERIAL_TERM, Keyword("alloy"), Keyword("iron")))
+
+        self.assertEqual(
+            decompile_query(compile_query(query), _get_mock_registry()), query
+        )
+
+    def test_nested_and_is_flattened(self):
+        """test_nested_and_is_flattened"""
+
+        query = {
+            "$and": [
+                {"$and": [MATERIAL_QUERY]},
+                {"$text": {"$search": '"alloy"'}},
+            ]
+        }
+
+        self.assertListEqual(
+            decompile_query(query, _get_mock_registry()).to_tags(),
+            ["material:steel", "alloy"],
+        )
+
+    def test_unknown_operator_is_ignored(self):
+        """test_unknown_operator_is_ignored"""
+
+        self.assertEqual(
+            decompile_query(MATERIAL_QUERY, SearchOperatorRegistry()), And()
+        )
+
+    @patch.object(keyword_query, "get_search_operator_registry")
+    def test_parse_query_content_is_cached(
+        self, mock_get_search_operator_registry
+    ):
+        """test_parse_query_content_is_cached"""
+
+        keyword_query._parse_query_content.cache_clear()
+        registry = _get_mock_registry()
+        registry.get_by_dot_notation_list = Mock(
+            wraps=registry.get_by_dot_notation_list
+        )
+        mock_get_search_operator_registry.return_value = registry
+        query_content = json.dumps(MATERIAL_QUERY)
+
+        parse_query_content(query_content)
+        parsed_query = parse_query_content(query_content)
+
+        self.assertEqual(parsed_query, And((MATERIAL_TERM,)))
+        self.assertEqual(registry.get_by_dot_notation_list.call_count, 1)
+
+    @patch.object(keyword_query, "get_search_operator_registry")
+    def test_parse_query_content_is_cached_per_generation(
+        self, mock_get_search_operator_registry
+    ):
+        """test_parse_query_content_is_cached_per_generation"""
+
+        keyword_query._parse_query_content.cache_clear()
+        query_content = json.dumps(MATERIAL_QUERY)
+        mock_get_search_operator_registry.return_value = _get_mock_registry(
+            "generation_1"
+        )
+        self.assertEqual(
+            parse_query_content(query_content), And((MATERIAL_TERM,))
+        )
+
+        # the search operator was deleted
+        mock_get_search_operator_registry.return_value = (
+            SearchOperatorRegistry(generation="generation_2")
+        )
+
+        self.assertEqual(parse_query_content(query_content), And())
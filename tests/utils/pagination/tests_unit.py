@@ -0,0 +1,46 @@
+""" Unit tests for the pagination utilities
+"""
+import base64
+import json
+from datetime import datetime, timezone
+from unittest import TestCase
+
+from rest_framework.exceptions import ValidationError
+
+from core_explore_keyword_app.utils.pagination import (
+    decode_cursor,
+    encode_cursor,
+)
+
+
+class TestCursor(TestCase):
+    """Test Cursor"""
+
+    def test_decode_returns_encoded_position(self):
+        """test_decode_returns_encoded_position"""
+
+        creation_date = datetime(
+            2024, 1, 2, 3, 4, 5, 6789, tzinfo=timezone.utc
+        )
+
+        self.assertEqual(
+            decode_cursor(encode_cursor(creation_date, 42)),
+            (creation_date, 42),
+        )
+
+    def test_decode_invalid_cursor_raises_validation_error(self):
+        """test_decode_invalid_cursor_raises_validation_error"""
+
+        for cursor in ("invalid", "e30=", "WzEsIDJd"):
+            with self.assertRaises(ValidationError):
+                decode_cursor(cursor)
+
+    def test_decode_cursor_with_invalid_id_raises_validation_error(self):
+        """test_decode_cursor_with_invalid_id_raises_validation_error"""
+
+        cursor = base64.urlsafe_b64encode(
+            json.dumps(["2024-01-02T03:04:05+00:00", "1"]).encode("utf-8")
+        ).decode("ascii")
+
+        with self.assertRaises(ValidationError):
+            decode_cursor(cursor)
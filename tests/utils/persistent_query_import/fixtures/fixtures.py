@@ -0,0 +1,36 @@
+""" Fixtures files for the persistent query import utilities
+"""
+from core_main_app.components.template.models import Template
+from core_main_app.utils.integration_tests.fixture_interface import (
+    FixtureInterface,
+)
+from core_explore_keyword_app.components.persistent_query_keyword.models import (
+    PersistentQueryKeyword,
+)
+
+
+class PersistentQueryImportFixtures(FixtureInterface):
+    """Templates and an existing named persistent query"""
+
+    template_1 = None
+    template_2 = None
+    persistent_query = None
+
+    def insert_data(self):
+        """Insert the templates and the persistent query.
+
+        Returns:
+
+        """
+        self.template_1 = Template(
+            filename="template_1.xsd", user="1", _hash="hash_1"
+        )
+        self.template_1.save()
+        self.template_2 = Template(
+            filename="template_2.xsd", user="1", _hash="hash_2"
+        )
+        self.template_2.save()
+        self.persistent_query = PersistentQueryKeyword(
+            user_id="1", content="{}", name="existing"
+        )
+        self.persistent_query.save()
@@ -0,0 +1,196 @@
+""" Integration tests for the persistent query import utilities
+"""
+import gzip
+import json
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_explore_keyword_app.components.persistent_query_keyword.models import (
+    PersistentQueryKeyword,
+    get_content_hash,
+)
+from core_explore_keyword_app.utils.persistent_query_import import (
+    import_persistent_queries,
+)
+from tests.utils.persistent_query_import.fixtures.fixtures import (
+    PersistentQueryImportFixtures,
+)
+
+
+class TestImportPersistentQueries(IntegrationBaseTestCase):
+    """Test Import Persistent Queries"""
+
+    fixture = PersistentQueryImportFixtures()
+
+    def _get_row(self, **kwargs):
+        """Return a valid row, in the export format.
+
+        Args:
+            **kwargs:
+
+        Returns:
+        """
+        row = {
+            "id": 1000,
+            "user_id": "2",
+            "content": '{"$text": {"$search": "\\"test\\""}}',
+            "templates": [self.fixture.template_1.id],
+            "name": None,
+            "creation_date": "2024-01-02T03:04:05Z",
+        }
+        row.update(kwargs)
+        return row
+
+    def test_valid_rows_are_created(self):
+        """test_valid_rows_are_created"""
+
+        report = import_persistent_queries(
+            [
+                self._get_row(name="imported"),
+                self._get_row(
+                    templates=[
+                        self.fixture.template_1.id,
+                        str(self.fixture.template_2.id),
+                    ]
+                ),
+            ]
+        )
+
+        self.assertEqual(report["created"], 2)
+        self.assertListEqual(report["errors"], [])
+        persistent_query = PersistentQueryKeyword.objects.get(name="imported")
+        self.assertEqual(persistent_query.user_id, "2")
+        self.assertDictEqual(
+            persistent_query.content_json, {"$text": {"$search": '"test"'}}
+        )
+        self.assertEqual(
+            persistent_query.content_hash,
+            get_content_hash({"$text": {"$search": '"test"'}}),
+        )
+        self.assertEqual(
+            persistent_query.creation_date,
+            timezone.make_naive(parse_datetime("2024-01-02T03:04:05Z")),
+        )
+        self.assertListEqual(
+            list(persistent_query.templates.values_list("id", flat=True)),
+            [self.fixture.template_1.id],
+        )
+        self.assertEqual(PersistentQueryKeyword.objects.count(), 3)
+        self.assertEqual(
+            PersistentQueryKeyword.templates.through.objects.count(), 3
+        )
+
+    def test_missing_creation_date_defaults_to_now(self):
+        """test_missing_creation_date_defaults_to_now"""
+
+        row = self._get_row(name="imported")
+        del row["creation_date"]
+
+        import_persistent_queries([row])
+
+        self.assertIsNotNone(
+            PersistentQueryKeyword.objects.get(name="imported").creation_date
+        )
+
+    def test_invalid_rows_are_reported_and_skipped(self):
+        """test_invalid_rows_are_reported_and_skipped"""
+
+        report = import_persistent_queries(
+            [
+                self._get_row(),
+                self._get_row(user_id=None),
+                "not an object",
+                self._get_row(templates=[-1]),
+                self._get_row(creation_date="yesterday"),
+                self._get_row(content=1),
+            ]
+        )
+
+        self.assertEqual(report["created"], 1)
+        self.assertListEqual(
+            [error["index"] for error in report["errors"]], [1, 2, 3, 4, 5]
+        )
+        self.assertIn("user_id", report["errors"][0]["errors"])
+        self.assertIn("row", report["errors"][1]["errors"])
+        self.assertIn("templates", report["errors"][2]["errors"])
+        self.assertIn("creation_date", report["errors"][3]["errors"])
+        self.assertIn("content", report["errors"][4]["errors"])
+        self.assertEqual(PersistentQueryKeyword.objects.count(), 2)
+
+    def test_duplicate_names_are_rejected(self):
+        """test_duplicate_names_are_rejected"""
+
+        report = import_persistent_queries(
+            [
+                self._get_row(name="existing"),
+                self._get_row(name="imported"),
+                self._get_row(name="imported"),
+            ]
+        )
+
+        self.assertEqual(report["created"], 1)
+        self.assertListEqual(
+            [error["index"] for error in report["errors"]], [0, 2]
+        )
+        self.assertEqual(
+            PersistentQueryKeyword.objects.filter(name="imported").count(), 1
+        )
+
+    def test_rows_are_inserted_in_batches(self):
+        """test_rows_are_inserted_in_batches"""
+
+        with CaptureQueriesContext(connection) as context:
+            report = import_persistent_queries(
+                [self._get_row() for _ in range(5)], batch_size=2
+            )
+
+        self.assertEqual(report["created"], 5)
+        insert_statements = [
+            captured_query["sql"].split(" ")[2]
+            for captured_query in context.captured_queries
+            if captured_query["sql"].startswith("INSERT INTO")
+        ]
+        self.assertListEqual(
+            insert_statements,
+            [
+                '"core_explore_keyword_app_persistentquerykeyword"',
+                '"core_explore_keyword_app_persistentquerykeyword_templates"',
+            ]
+            * 3,
+        )
+
+    def test_command_imports_gzipped_file(self):
+        """test_command_imports_gzipped_file"""
+
+        handle, path = tempfile.mkstemp(suffix=".ndjson.gz")
+        os.close(handle)
+        self.addCleanup(os.remove, path)
+        with gzip.open(path, "wt", encoding="utf-8") as file:
+            file.write(json.dumps(self._get_row(name="imported")) + "\n")
+            file.write("\n")
+            file.write("not json\n")
+
+        stdout = StringIO()
+        stderr = StringIO()
+        call_command(
+            "import_persistent_queries", path, stdout=stdout, stderr=stderr
+        )
+
+        self.assertIn(
+            "1 persistent queries imported, 1 rows rejected",
+            stdout.getvalue(),
+        )
+        self.assertIn("Row 2", stderr.getvalue())
+        self.assertTrue(
+            PersistentQueryKeyword.objects.filter(name="imported").exists()
+        )
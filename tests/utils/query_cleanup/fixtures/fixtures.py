@@ -0,0 +1,107 @@
+""" Fixtures files for the query cleanup utilities
+"""
+from datetime import timedelta
+
+from django.utils import timezone
+
+from core_main_app.components.template.models import Template
+from core_main_app.utils.integration_tests.fixture_interface import (
+    FixtureInterface,
+)
+from core_explore_common_app.components.query.models import Query
+from core_explore_keyword_app.components.persistent_query_keyword.models import (
+    PersistentQueryKeyword,
+)
+from core_explore_keyword_app.components.query_access.models import (
+    QueryAccess,
+)
+
+
+class QueryCleanupFixtures(FixtureInterface):
+    """Expired and recent queries and persistent queries"""
+
+    template = None
+    expired_queries = None
+    recent_query = None
+    other_app_query = None
+    expired_persistent_query = None
+    named_persistent_query = None
+    recent_persistent_query = None
+    used_persistent_query = None
+
+    def insert_data(self, expired_query_count=5):
+        """Insert the queries.
+
+        Args:
+            expired_query_count:
+
+        Returns:
+
+        """
+        self.template = Template(
+            filename="template.xsd", user="1", _hash="hash"
+        )
+        self.template.save()
+        self.expired_queries = [
+            self._create_query(days=40) for _ in range(expired_query_count)
+        ]
+        # created long ago, accessed recently
+        self.recent_query = self._create_query(days=40, access_days=1)
+        # query of another explore app, never accessed by the keyword search
+        self.other_app_query = self._create_query(days=40, access_days=None)
+        self.expired_persistent_query = self._create_persistent_query(days=40)
+        self.named_persistent_query = self._create_persistent_query(
+            days=40, name="shared"
+        )
+        self.recent_persistent_query = self._create_persistent_query(days=1)
+        self.used_persistent_query = self._create_persistent_query(
+            days=40, access_days=1
+        )
+
+    def _create_query(self, days, access_days=40):
+        """Create a query created and accessed some days ago.
+
+        Args:
+            days:
+            access_days: None if not a query of the keyword search
+
+        Returns:
+
+        """
+        query = Query(user_id="1", content="{}")
+        query.save()
+        query.templates.set([self.template])
+        Query.objects.filter(pk=query.pk).update(
+            creation_date=timezone.now() - timedelta(days=days)
+        )
+        if access_days is not None:
+            QueryAccess.set_last_access_date(
+                query.pk, timezone.now() - timedelta(days=access_days)
+            )
+        return query
+
+    @staticmethod
+    def _create_persistent_query(days, name=None, access_days=None):
+        """Create a persistent query created and opened some days ago.
+
+        Args:
+            days:
+            name:
+            access_days: None if never opened
+
+        Returns:
+
+        """
+        persistent_query = PersistentQueryKeyword(
+            user_id="1", content="{}", name=name
+        )
+        persistent_query.save()
+        PersistentQueryKeyword.objects.filter(pk=persistent_query.pk).update(
+            creation_date=timezone.now() - timedelta(days=days),
+            last_access_date=(
+                timezone.now() - timedelta(days=access_days)
+                if access_days is not None
+                else None
+            ),
+        )
+        return persistent_query
@@ -0,0 +1,136 @@
+""" Integration tests for the query cleanup utilities
+"""
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_explore_common_app.components.query.models import Query
+from core_explore_keyword_app.components.persistent_query_keyword.models import (
+    PersistentQueryKeyword,
+)
+from core_explore_keyword_app.components.query_access.models import (
+    QueryAccess,
+)
+from core_explore_keyword_app.utils import query_cleanup
+from tests.utils.query_cleanup.fixtures.fixtures import QueryCleanupFixtures
+
+
+class TestCleanupQueries(IntegrationBaseTestCase):
+    """Test Cleanup Queries"""
+
+    fixture = QueryCleanupFixtures()
+
+    def test_expired_queries_are_deleted(self):
+        """test_expired_queries_are_deleted"""
+
+        report = query_cleanup.cleanup_queries(
+            query_retention_days=30, persistent_query_retention_days=None
+        )
+
+        self.assertEqual(report["queries"], 5)
+        self.assertEqual(report["persistent_queries"], 0)
+        self.assertSetEqual(
+            set(Query.objects.values_list("pk", flat=True)),
+            {self.fixture.recent_query.pk, self.fixture.other_app_query.pk},
+        )
+        self.assertEqual(
+            Query.templates.through.objects.count(),
+            2,
+        )
+        self.assertListEqual(
+            list(QueryAccess.objects.values_list("pk", flat=True)),
+            [self.fixture.recent_query.pk],
+        )
+
+    def test_queries_are_deleted_in_batches(self):
+        """test_queries_are_deleted_in_batches"""
+
+        with CaptureQueriesContext(connection) as context:
+            report = query_cleanup.cleanup_queries(
+                query_retention_days=30,
+                persistent_query_retention_days=None,
+                batch_size=2,
+            )
+
+        self.assertEqual(report["queries"], 5)
+        query_delete_statements = [
+            captured_query["sql"]
+            for captured_query in context.captured_queries
+            if captured_query["sql"].startswith(
+                'DELETE FROM "core_explore_common_app_query"'
+            )
+        ]
+        self.assertEqual(len(query_delete_statements), 3)
+
+    def test_no_retention_keeps_all_queries(self):
+        """test_no_retention_keeps_all_queries"""
+
+        report = query_cleanup.cleanup_queries(
+            query_retention_days=None, persistent_query_retention_days=None
+        )
+
+        self.assertEqual(report["queries"], 0)
+        self.assertEqual(Query.objects.count(), 7)
+        self.assertEqual(PersistentQueryKeyword.objects.count(), 4)
+
+    def test_stale_persistent_queries_are_deleted(self):
+        """test_stale_persistent_queries_are_deleted"""
+
+        report = query_cleanup.cleanup_queries(
+            query_retention_days=None, persistent_query_retention_days=30
+        )
+
+        self.assertEqual(report["persistent_queries"], 1)
+        self.assertSetEqual(
+            set(PersistentQueryKeyword.objects.values_list("pk", flat=True)),
+            {
+                self.fixture.named_persistent_query.pk,
+                self.fixture.recent_persistent_query.pk,
+                self.fixture.used_persistent_query.pk,
+            },
+        )
+
+    def test_persistent_queries_are_kept_by_default(self):
+        """test_persistent_queries_are_kept_by_default"""
+
+        report = query_cleanup.cleanup_queries(query_retention_days=30)
+
+        self.assertEqual(report["persistent_queries"], 0)
+        self.assertEqual(PersistentQueryKeyword.objects.count(), 4)
+
+    @patch.object(
+        query_cleanup, "EXPLORE_KEYWORD_PERSISTENT_QUERY_RETENTION_DAYS", 30
+    )
+    def test_persistent_query_retention_requires_cleanup_enabled(self):
+        """test_persistent_query_retention_requires_cleanup_enabled"""
+
+        self.assertIsNone(query_cleanup.get_persistent_query_retention_days())
+        with patch.object(
+            query_cleanup,
+            "EXPLORE_KEYWORD_PERSISTENT_QUERY_CLEANUP_ENABLED",
+            True,
+        ):
+            self.assertEqual(
+                query_cleanup.get_persistent_query_retention_days(), 30
+            )
+
+    def test_command_reports_counts(self):
+        """test_command_reports_counts"""
+
+        stdout = StringIO()
+        call_command(
+            "cleanup_queries",
+            query_retention_days=30,
+            persistent_query_retention_days=30,
+            stdout=stdout,
+        )
+
+        self.assertIn(
+            "5 queries and 1 persistent queries deleted", stdout.getvalue()
+        )
@@ -0,0 +1,156 @@
+""" Unit tests for the search operator registry utilities
+"""
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from django.test import override_settings
+
+from core_main_app.commons.exceptions import ApiError
+from core_explore_keyword_app.components.search_operator.models import (
+    SearchOperator,
+)
+from core_explore_keyword_app.utils import search_operator_registry
+from core_explore_keyword_app.utils.search_operator_registry import (
+    SEARCH_OPERATOR_GENERATION,
+    SearchOperatorRegistry,
+    get_search_operator_registry,
+    invalidate_search_operator_registry,
+)
+
+
+def _create_mock_search_operator(name, dot_notation_list):
+    """Create a mock search operator
+
+    Args:
+        name:
+        dot_notation_list:
+
+    Returns:
+    """
+    mock_search_operator = Mock(spec=SearchOperator)
+    mock_search_operator.name = name
+    mock_search_operator.dot_notation_list = dot_notation_list
+    return mock_search_operator
+
+
+class TestSearchOperatorRegistry(TestCase):
+    """Test Search Operator Registry"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.material = _create_mock_search_operator(
+            "material", ["root.material", "root.alloy"]
+        )
+        self.author = _create_mock_search_operator("author", ["root.author"])
+        self.registry = SearchOperatorRegistry([self.material, self.author])
+
+    def test_get_all_returns_operators_sorted_by_name(self):
+        """test_get_all_returns_operators_sorted_by_name"""
+
+        self.assertListEqual(
+            self.registry.get_all(), [self.author, self.material]
+        )
+
+    def test_get_by_name_returns_operator(self):
+        """test_get_by_name_returns_operator"""
+
+        self.assertEqual(self.registry.get_by_name("material"), self.material)
+
+    def test_get_by_unknown_name_raises_api_error(self):
+        """test_get_by_unknown_name_raises_api_error"""
+
+        with self.assertRaises(ApiError):
+            self.registry.get_by_name("unknown")
+
+    def test_get_by_dot_notation_list_returns_operator(self):
+        """test_get_by_dot_notation_list_returns_operator"""
+
+        self.assertEqual(
+            self.registry.get_by_dot_notation_list(
+                ["root.material", "root.alloy"]
+            ),
+            self.material,
+        )
+
+    def test_get_by_dot_notation_list_is_order_sensitive(self):
+        """test_get_by_dot_notation_list_is_order_sensitive"""
+
+        with self.assertRaises(ApiError):
+            self.registry.get_by_dot_notation_list(
+                ["root.alloy", "root.material"]
+            )
+
+
+class TestGetSearchOperatorRegistry(TestCase):
+    """Test Get Search Operator Registry"""
+
+    def setUp(self):
+        """setUp"""
+
+        patcher = patch.dict(
+            search_operator_registry._search_operator_registry,
+            {"registry": None},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @override_settings(
+        CACHES={
+            "default": {
+                "BACKEND": "django.core.cache.backends.dummy.DummyCache"
+            }
+        }
+    )
+    @patch("core_explore_keyword_app.components.search_operator.api.get_all")
+    def test_registry_is_loaded_without_cache(self, mock_get_all):
+        """test_registry_is_loaded_without_cache"""
+
+        mock_get_all.return_value = [
+            _create_mock_search_operator("author", ["root.author"])
+        ]
+
+        self.assertEqual(len(get_search_operator_registry()), 1)
+        self.assertEqual(len(get_search_operator_registry()), 1)
+
+    @patch.object(search_operator_registry, "get_generation")
+    @patch("core_explore_keyword_app.components.search_operator.api.get_all")
+    def test_registry_is_loaded_for_a_none_generation(
+        self, mock_get_all, mock_get_generation
+    ):
+        """test_registry_is_loaded_for_a_none_generation"""
+
+        mock_get_all.return_value = []
+        mock_get_generation.return_value = None
+
+        self.assertIsNotNone(get_search_operator_registry())
+
+    @patch.object(search_operator_registry, "get_generation")
+    @patch("core_explore_keyword_app.components.search_operator.api.get_all")
+    def test_registry_is_loaded_once_per_generation(
+        self, mock_get_all, mock_get_generation
+    ):
+        """test_registry_is_loaded_once_per_generation"""
+
+        mock_get_all.return_value = [
+            _create_mock_search_operator("author", ["root.author"])
+        ]
+        mock_get_generation.return_value = "generation_1"
+        get_search_operator_registry()
+        get_search_operator_registry()
+        self.assertEqual(mock_get_all.call_count, 1)
+
+        mock_get_generation.return_value = "generation_2"
+        self.assertEqual(len(get_search_operator_registry()), 1)
+        self.assertEqual(mock_get_all.call_count, 2)
+        self.assertEqual(
+            get_search_operator_registry().generation, "generation_2"
+        )
+
+    @patch.object(search_operator_registry, "bump_generation")
+    def test_invalidate_bumps_generation(self, mock_bump_generation):
+        """test_invalidate_bumps_generation"""
+
+        invalidate_search_operator_registry(sender=SearchOperator)
+
+        mock_bump_generation.assert_called_with(SEARCH_OPERATOR_GENERATION)
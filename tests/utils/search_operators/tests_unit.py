@@ -4,31 +4,37 @@
 from unittest import TestCase
 from unittest.mock import patch, Mock
 
-from core_main_app.commons.exceptions import ApiError
-from core_explore_keyword_app.components.search_operator import (
-    api as search_operator_api,
-)
 from core_explore_keyword_app.components.search_operator.models import (
     SearchOperator,
 )
+from core_explore_keyword_app.utils import search_operators
+from core_explore_keyword_app.utils.search_operator_registry import (
+    SearchOperatorRegistry,
+)
 from core_explore_keyword_app.utils.search_operators import (
     build_search_operator_query,
     get_keywords_from_search_operator_query,
+    get_search_operators_by_name,
 )
 
 
 class TestBuildSearchOperatorQuery(TestCase):
     """Test Build Search Operator Query"""
 
-    @patch.object(search_operator_api, "get_by_name")
-    def test_single_dot_notation_returns_valid_query(self, mock_get_by_name):
+    @patch.object(search_operators, "get_search_operator_registry")
+    def test_single_dot_notation_returns_valid_query(
+        self, mock_get_search_operator_registry
+    ):
         """test_single_dot_notation_returns_valid_query"""
 
         mock_dot_notation = "mock.dot.notation"
         mock_value = "mock_value"
         mock_search_operator = Mock(spec=SearchOperator)
         mock_search_operator.dot_notation_list = [mock_dot_notation]
-        mock_get_by_name.return_value = mock_search_operator
+        mock_search_operator.name = "mock_name"
+        mock_get_search_operator_registry.return_value = (
+            SearchOperatorRegistry([mock_search_operator])
+        )
 
         expected_dict = {
             "$or": [
@@ -41,15 +47,20 @@ class TestBuildSearchOperatorQuery(TestCase):
 
         self.assertDictEqual(returned_dict, expected_dict)
 
-    @patch.object(search_operator_api, "get_by_name")
-    def test_multi_dot_notation_returns_valid_query(self, mock_get_by_name):
+    @patch.object(search_operators, "get_search_operator_registry")
+    def test_multi_dot_notation_returns_valid_query(
+        self, mock_get_search_operator_registry
+    ):
         """test_multi_dot_notation_returns_valid_query"""
 
         mock_dot_notation_list = ["mock.dot.notation.1", "mock.dot.notation.2"]
         mock_value = "mock_value"
         mock_search_operator = Mock(spec=SearchOperator)
         mock_search_operator.dot_notation_list = mock_dot_notation_list
-        mock_get_by_name.return_value = mock_search_operator
+        mock_search_operator.name = "mock_name"
+        mock_get_search_operator_registry.return_value = (
+            SearchOperatorRegistry([mock_search_operator])
+        )
 
         mock_dot_notation_values = [
             {mock_dot_notation: mock_value}
@@ -67,6 +78,31 @@ class TestBuildSearchOperatorQuery(TestCase):
         self.assertDictEqual(returned_dict, expected_dict)
 
 
+class TestGetSearchOperatorsByName(TestCase):
+    """Test Get Search Operators By Name"""
+
+    @patch.object(search_operators, "get_search_operator_registry")
+    def test_returns_existing_operators_only(
+        self, mock_get_search_operator_registry
+    ):
+        """test_returns_existing_operators_only"""
+
+        mock_search_operator = Mock(spec=SearchOperator)
+        mock_search_operator.name = "mock_name"
+        mock_search_operator.dot_notation_list = ["mock.dot.notation"]
+        mock_get_search_operator_registry.return_value = (
+            SearchOperatorRegistry([mock_search_operator])
+        )
+
+        self.assertDictEqual(
+            get_search_operators_by_name(
+                ["mock_name", "unknown", "mock_name"]
+            ),
+            {"mock_name": mock_search_operator},
+        )
+        self.assertEqual(mock_get_search_operator_registry.call_count, 1)
+
+
 class TestGetKeywordsFromSearchOperatorQuery(TestCase):
     """Test Get Keywords From Search Operator Query"""
 
@@ -75,14 +111,20 @@ class TestGetKeywordsFromSearchOperatorQuery(TestCase):
 
         self.assertEqual(get_keywords_from_search_operator_query({}), None)
 
-    @patch.object(search_operator_api, "get_by_dot_notation_list")
-    def test_returns_valid_keyword(self, mock_get_by_dot_notation_list):
+    @patch.object(search_operators, "get_search_operator_registry")
+    def test_returns_valid_keyword(self, mock_get_search_operator_registry):
         """test_returns_valid_keyword"""
 
         mock_keyword = "mock_keyword"
         mock_search_operator = Mock(spec=SearchOperator)
         mock_search_operator.name = mock_keyword
-        mock_get_by_dot_notation_list.return_value = mock_search_operator
+        mock_search_operator.dot_notation_list = [
+            "mock.dot.notation.1",
+            "mock.dot.notation.2",
+        ]
+        mock_get_search_operator_registry.return_value = (
+            SearchOperatorRegistry([mock_search_operator])
+        )
         mock_value = "mock_value"
         mock_query = {
             "$or": [
@@ -98,11 +140,15 @@ class TestGetKeywordsFromSearchOperatorQuery(TestCase):
 
         self.assertEqual(returned_string, expected_string)
 
-    @patch.object(search_operator_api, "get_by_dot_notation_list")
-    def test_api_error_returns_none(self, mock_get_by_dot_notation_list):
-        """test_api_error_returns_none"""
+    @patch.object(search_operators, "get_search_operator_registry")
+    def test_unknown_dot_notation_list_returns_none(
+        self, mock_get_search_operator_registry
+    ):
+        """test_unknown_dot_notation_list_returns_none"""
 
-        mock_get_by_dot_notation_list.side_effect = ApiError("mock_error")
+        mock_get_search_operator_registry.return_value = (
+            SearchOperatorRegistry()
+        )
         mock_value = "mock_value"
         mock_query = {
             "$or": [
@@ -0,0 +1,49 @@
+""" Unit tests for the streaming utilities
+"""
+import gzip
+import json
+from datetime import datetime, timezone
+from unittest import TestCase
+
+from core_explore_keyword_app.utils.streaming import iter_gzip, iter_ndjson
+
+
+class TestIterNdjson(TestCase):
+    """Test Iter Ndjson"""
+
+    def test_yields_one_line_per_item(self):
+        """test_yields_one_line_per_item"""
+
+        lines = list(
+            iter_ndjson(
+                [
+                    {"id": 1},
+                    {"date": datetime(2024, 1, 2, tzinfo=timezone.utc)},
+                ]
+            )
+        )
+
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(all(line.endswith("\n") for line in lines))
+        self.assertDictEqual(json.loads(lines[0]), {"id": 1})
+        self.assertDictEqual(
+            json.loads(lines[1]), {"date": "2024-01-02T00:00:00Z"}
+        )
+
+
+class TestIterGzip(TestCase):
+    """Test Iter Gzip"""
+
+    def test_compressed_chunks_decompress_to_text(self):
+        """test_compressed_chunks_decompress_to_text"""
+
+        chunks = ["line %d\n" % index for index in range(1000)]
+
+        content = gzip.decompress(b"".join(iter_gzip(iter(chunks))))
+
+        self.assertEqual(content.decode("utf-8"), "".join(chunks))
+
+    def test_empty_input_is_a_valid_gzip_stream(self):
+        """test_empty_input_is_a_valid_gzip_stream"""
+
+        self.assertEqual(gzip.decompress(b"".join(iter_gzip([]))), b"")
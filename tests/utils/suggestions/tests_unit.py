@@ -0,0 +1,108 @@
+""" Unit tests for the keyword suggestions utilities
+"""
+from unittest import TestCase
+
+from core_explore_keyword_app.utils.suggestions import (
+    get_access_scope,
+    get_suggestion_cache_key,
+    invalidate_suggestion_cache,
+    rank_fuzzy_terms,
+    rank_terms,
+)
+from core_main_app.utils.query.constants import (
+    VISIBILITY_OPTION,
+    VISIBILITY_PUBLIC,
+    VISIBILITY_ALL,
+)
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+
+
+class TestGetAccessScope(TestCase):
+    """Test Get Access Scope"""
+
+    def test_term_dictionary_is_public(self):
+        """test_term_dictionary_is_public"""
+
+        self.assertEqual(
+            get_access_scope(create_mock_user("1")), VISIBILITY_PUBLIC
+        )
+
+    def test_public_visibility_is_shared(self):
+        """test_public_visibility_is_shared"""
+
+        data_source = {"query_options": {VISIBILITY_OPTION: VISIBILITY_PUBLIC}}
+
+        self.assertEqual(
+            get_access_scope(create_mock_user("1"), data_source),
+            get_access_scope(create_mock_user("2"), data_source),
+        )
+
+    def test_other_visibility_is_per_user(self):
+        """test_other_visibility_is_per_user"""
+
+        data_source = {"query_options": {VISIBILITY_OPTION: VISIBILITY_ALL}}
+
+        self.assertNotEqual(
+            get_access_scope(create_mock_user("1"), data_source),
+            get_access_scope(create_mock_user("2"), data_source),
+        )
+
+
+class TestGetSuggestionCacheKey(TestCase):
+    """Test Get Suggestion Cache Key"""
+
+    def test_key_is_normalized(self):
+        """test_key_is_normalized"""
+
+        self.assertEqual(
+            get_suggestion_cache_key("Steel alloy", ["1", 2], "public"),
+            get_suggestion_cache_key("alloy, steel", [2, "1"], "public"),
+        )
+
+    def test_invalidation_changes_key(self):
+        """test_invalidation_changes_key"""
+
+        cache_key = get_suggestion_cache_key("steel", [], "public")
+        invalidate_suggestion_cache()
+
+        self.assertNotEqual(
+            get_suggestion_cache_key("steel", [], "public"), cache_key
+        )
+
+    def test_term_dictionary_generation_changes_key(self):
+        """test_term_dictionary_generation_changes_key"""
+
+        self.assertNotEqual(
+            get_suggestion_cache_key("steel", [], "public", "generation_1"),
+            get_suggestion_cache_key("steel", [], "public", "generation_2"),
+        )
+
+
+class TestRankTerms(TestCase):
+    """Test Rank Terms"""
+
+    def test_terms_are_sorted_by_frequency_then_name(self):
+        """test_terms_are_sorted_by_frequency_then_name"""
+
+        self.assertListEqual(
+            rank_terms({"b": 1, "a": 1, "c": 3}), ["c", "a", "b"]
+        )
+
+    def test_limit_returns_top_terms(self):
+        """test_limit_returns_top_terms"""
+
+        self.assertListEqual(
+            rank_terms({"b": 1, "a": 1, "c": 3}, limit=2), ["c", "a"]
+        )
+
+
+class TestRankFuzzyTerms(TestCase):
+    """Test Rank Fuzzy Terms"""
+
+    def test_terms_are_sorted_by_distance_then_frequency(self):
+        """test_terms_are_sorted_by_distance_then_frequency"""
+
+        matches = {"a": (2, 10), "b": (1, 1), "c": (1, 5)}
+
+        self.assertListEqual(rank_fuzzy_terms(matches), ["c", "b", "a"])
+        self.assertListEqual(rank_fuzzy_terms(matches, 1), ["c"])
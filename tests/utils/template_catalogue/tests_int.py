@@ -0,0 +1,112 @@
+""" Integration tests for the template catalogue utilities
+"""
+from django.test import RequestFactory
+
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_explore_keyword_app.utils.template_catalogue import (
+    get_template_ids,
+    invalidate_template_catalogue,
+)
+from tests.views.user.views.fixtures.fixtures import QueryFixtures
+
+
+def _create_request(user):
+    """Create a request for a user
+
+    Args:
+        user:
+
+    Returns:
+    """
+    request = RequestFactory().get("/")
+    request.user = user
+    return request
+
+
+class TestGetTemplateIds(IntegrationBaseTestCase):
+    """Test Get Template Ids"""
+
+    fixture = QueryFixtures()
+
+    def setUp(self):
+        """setUp"""
+
+        super().setUp()
+        invalidate_template_catalogue()
+        self.version_manager_ids = [
+            version_manager.id
+            for version_manager in self.fixture.version_manager_collection
+        ]
+
+    def test_all_versions_are_resolved_with_one_query(self):
+        """test_all_versions_are_resolved_with_one_query"""
+
+        with self.assertNumQueries(1):
+            template_ids = get_template_ids(
+                self.version_manager_ids,
+                _create_request(create_mock_user("1")),
+            )
+
+        self.assertListEqual(
+            template_ids,
+            sorted(
+                str(template.id)
+                for template in self.fixture.template_collection
+            ),
+        )
+
+    def test_template_ids_are_cached_per_user(self):
+        """test_template_ids_are_cached_per_user"""
+
+        get_template_ids(
+            self.version_manager_ids, _create_request(create_mock_user("1"))
+        )
+
+        with self.assertNumQueries(0):
+            get_template_ids(
+                self.version_manager_ids,
+                _create_request(create_mock_user("1")),
+            )
+        with self.assertNumQueries(1):
+            get_template_ids(
+                self.version_manager_ids,
+                _create_request(create_mock_user("2")),
+            )
+
+    def test_templates_of_other_users_are_excluded(self):
+        """test_templates_of_other_users_are_excluded"""
+
+        self.assertListEqual(
+            get_template_ids(
+                self.version_manager_ids,
+                _create_request(create_mock_user("2")),
+            ),
+            [],
+        )
+
+    def test_superuser_gets_all_templates(self):
+        """test_superuser_gets_all_templates"""
+
+        self.assertEqual(
+            len(
+                get_template_ids(
+                    self.version_manager_ids,
+                    _create_request(
+                        create_mock_user("2", is_staff=True, is_superuser=True)
+                    ),
+                )
+            ),
+            100,
+        )
+
+    def test_no_version_manager_returns_empty_list_without_query(self):
+        """test_no_version_manager_returns_empty_list_without_query"""
+
+        with self.assertNumQueries(0):
+            self.assertListEqual(
+                get_template_ids([], _create_request(create_mock_user("1"))),
+                [],
+            )
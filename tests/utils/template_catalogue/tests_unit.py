@@ -0,0 +1,110 @@
+""" Unit tests for the template catalogue utilities
+"""
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from django.contrib.auth.models import AnonymousUser
+
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_explore_keyword_app.utils import template_catalogue
+from core_explore_keyword_app.utils.template_catalogue import (
+    get_template_choices,
+    get_user_cache_key,
+    invalidate_template_catalogue,
+    template_choice_cache,
+)
+
+
+def _create_mock_version_manager(version_manager_id, title):
+    """Create a mock version manager
+
+    Args:
+        version_manager_id:
+        title:
+
+    Returns:
+    """
+    mock_version_manager = Mock(id=version_manager_id)
+    mock_version_manager.title = title
+    return mock_version_manager
+
+
+class TestGetUserCacheKey(TestCase):
+    """Test Get User Cache Key"""
+
+    def test_anonymous_users_share_key(self):
+        """test_anonymous_users_share_key"""
+
+        self.assertEqual(
+            get_user_cache_key(Mock(user=AnonymousUser())), "anonymous"
+        )
+
+    def test_user_key_contains_user_id(self):
+        """test_user_key_contains_user_id"""
+
+        self.assertEqual(
+            get_user_cache_key(Mock(user=create_mock_user("1"))), "user:1"
+        )
+
+
+@patch.object(
+    template_catalogue.template_version_manager_api,
+    "get_active_version_manager_by_user_id",
+)
+@patch.object(
+    template_catalogue.template_version_manager_api,
+    "get_active_global_version_manager",
+)
+class TestGetTemplateChoices(TestCase):
+    """Test Get Template Choices"""
+
+    def setUp(self):
+        """setUp"""
+
+        template_choice_cache.clear()
+
+    def test_returns_global_and_user_choices(
+        self, mock_get_global, mock_get_by_user
+    ):
+        """test_returns_global_and_user_choices"""
+
+        mock_get_global.return_value = [
+            _create_mock_version_manager(1, "global")
+        ]
+        mock_get_by_user.return_value = [
+            _create_mock_version_manager(2, "user")
+        ]
+
+        self.assertEqual(
+            get_template_choices(Mock(user=create_mock_user("1"))),
+            ([(1, "global")], [(2, "user")]),
+        )
+
+    def test_choices_are_cached_per_user(
+        self, mock_get_global, mock_get_by_user
+    ):
+        """test_choices_are_cached_per_user"""
+
+        mock_get_global.return_value = []
+        mock_get_by_user.return_value = []
+
+        get_template_choices(Mock(user=create_mock_user("1")))
+        get_template_choices(Mock(user=create_mock_user("1")))
+        self.assertEqual(mock_get_global.call_count, 1)
+
+        get_template_choices(Mock(user=create_mock_user("2")))
+        self.assertEqual(mock_get_global.call_count, 2)
+
+    def test_invalidate_reloads_choices(
+        self, mock_get_global, mock_get_by_user
+    ):
+        """test_invalidate_reloads_choices"""
+
+        mock_get_global.return_value = []
+        mock_get_by_user.return_value = []
+
+        get_template_choices(Mock(user=create_mock_user("1")))
+        invalidate_template_catalogue()
+        get_template_choices(Mock(user=create_mock_user("1")))
+
+        self.assertEqual(mock_get_global.call_count, 2)
@@ -0,0 +1,367 @@
+""" Unit tests for the term dictionary utilities
+"""
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from core_explore_keyword_app.utils import term_dictionary
+from core_explore_keyword_app.utils.term_dictionary import (
+    SymSpellIndex,
+    TermDictionary,
+    get_deletes,
+    get_document_terms,
+    get_edit_distance,
+    get_path_values,
+    get_prefix_upper_bound,
+    get_search_operator_value_dictionary,
+    get_term_dictionary,
+    get_term_dictionary_generation,
+)
+
+
+class TestGetDocumentTerms(TestCase):
+    """Test Get Document Terms"""
+
+    def test_returns_lowercase_terms_of_nested_values(self):
+        """test_returns_lowercase_terms_of_nested_values"""
+
+        dict_content = {
+            "root": {
+                "title": "Steel Alloy",
+                "items": [{"#text": "alloy steel"}, {"@id": 12}],
+                "flag": True,
+            }
+        }
+
+        self.assertSetEqual(
+            get_document_terms(dict_content), {"steel", "alloy", "12"}
+        )
+
+    def test_empty_content_returns_empty_set(self):
+        """test_empty_content_returns_empty_set"""
+
+        self.assertSetEqual(get_document_terms(None), set())
+
+
+class TestGetPathValues(TestCase):
+    """Test Get Path Values"""
+
+    def test_returns_values_through_lists_and_text_nodes(self):
+        """test_returns_values_through_lists_and_text_nodes"""
+
+        dict_content = {
+            "root": {
+                "material": [
+                    {"name": "Steel"},
+                    {"name": {"@lang": "en", "#text": "Alloy 42"}},
+                    {"name": ["Copper", 12]},
+                ]
+            }
+        }
+
+        self.assertSetEqual(
+            get_path_values(dict_content, "root.material.name"),
+            {"Steel", "Alloy 42", "Copper", "12"},
+        )
+
+    def test_ignores_separators_and_missing_paths(self):
+        """test_ignores_separators_and_missing_paths"""
+
+        dict_content = {"root": {"name": ["a,b", "c:d", " ", "e"]}}
+
+        self.assertSetEqual(get_path_values(dict_content, "root.name"), {"e"})
+        self.assertSetEqual(get_path_values(dict_content, "root.other"), set())
+
+
+class TestGetPrefixUpperBound(TestCase):
+    """Test Get Prefix Upper Bound"""
+
+    def test_returns_next_string(self):
+        """test_returns_next_string"""
+
+        self.assertEqual(get_prefix_upper_bound("abc"), "abd")
+
+
+class TestTermDictionaryLookup(TestCase):
+    """Test Term Dictionary Lookup"""
+
+    def setUp(self):
+        """setUp"""
+
+        self.term_dictionary = TermDictionary(
+            [
+                ("steel", 1, 3),
+                ("steel", 2, 2),
+                ("stem", 1, 1),
+                ("stone", 2, 4),
+                ("alloy", 1, 5),
+            ]
+        )
+
+    def test_prefix_returns_completions(self):
+        """test_prefix_returns_completions"""
+
+        self.assertDictEqual(
+            dict(self.term_dictionary.lookup("ste")), {"steel": 5, "stem": 1}
+        )
+
+    def test_prefix_filters_by_template(self):
+        """test_prefix_filters_by_template"""
+
+        self.assertDictEqual(
+            dict(self.term_dictionary.lookup("st", {"2"})),
+            {"steel": 2, "stone": 4},
+        )
+
+    def test_unknown_prefix_returns_empty(self):
+        """test_unknown_prefix_returns_empty"""
+
+        self.assertEqual(len(self.term_dictionary.lookup("zinc")), 0)
+
+    def test_prefix_is_case_insensitive(self):
+        """test_prefix_is_case_insensitive"""
+
+        term_dictionary = TermDictionary(
+            [("Steel 316", 1, 2), ("stone", 1, 1)]
+        )
+
+        self.assertDictEqual(
+            dict(term_dictionary.lookup("STEEL")), {"Steel 316": 2}
+        )
+
+    def test_empty_prefix_returns_all_terms(self):
+        """test_empty_prefix_returns_all_terms"""
+
+        self.assertDictEqual(
+            dict(self.term_dictionary.lookup("", {"1"})),
+            {"steel": 3, "stem": 1, "alloy": 5},
+        )
+
+    def test_lookup_keywords_merges_all_words(self):
+        """test_lookup_keywords_merges_all_words"""
+
+        self.assertDictEqual(
+            dict(self.term_dictionary.lookup_keywords("Stem all", [1])),
+            {"stem": 1, "alloy": 5},
+        )
+
+
+class TestGetDeletes(TestCase):
+    """Test Get Deletes"""
+
+    def test_returns_deletes_up_to_distance(self):
+        """test_returns_deletes_up_to_distance"""
+
+        self.assertSetEqual(get_deletes("abc", 1), {"abc", "bc", "ac", "ab"})
+        self.assertIn("a", get_deletes("abc", 2))
+
+
+class TestGetEditDistance(TestCase):
+    """Test Get Edit Distance"""
+
+    def test_substitution_insertion_deletion(self):
+        """test_substitution_insertion_deletion"""
+
+        self.assertEqual(get_edit_distance("steel", "steal", 2), 1)
+        self.assertEqual(get_edit_distance("steel", "stel", 2), 1)
+        self.assertEqual(get_edit_distance("steel", "steels", 2), 1)
+
+    def test_transposition_counts_as_one_edit(self):
+        """test_transposition_counts_as_one_edit"""
+
+        self.assertEqual(get_edit_distance("steel", "stele", 2), 1)
+
+    def test_distance_is_capped(self):
+        """test_distance_is_capped"""
+
+        self.assertEqual(get_edit_distance("steel", "alloy", 2), 3)
+
+
+class TestSymSpellIndexLookup(TestCase):
+    """Test SymSpell Index Lookup"""
+
+    def test_returns_terms_within_distance(self):
+        """test_returns_terms_within_distance"""
+
+        terms = ["alloy", "aluminium", "steel", "stone"]
+        fuzzy_index = SymSpellIndex(terms, 2)
+
+        self.assertDictEqual(fuzzy_index.lookup("stel"), {2: 1})
+        self.assertDictEqual(fuzzy_index.lookup("aluminum"), {1: 1})
+
+
+class TestTermDictionaryLookupKeywordsFuzzy(TestCase):
+    """Test Term Dictionary Lookup Keywords Fuzzy"""
+
+    def test_returns_distance_and_frequency(self):
+        """test_returns_distance_and_frequency"""
+
+        term_dictionary = TermDictionary(
+            [("steel", 1, 3), ("steel", 2, 2), ("stone", 2, 4)]
+        )
+
+        self.assertDictEqual(
+            term_dictionary.lookup_keywords_fuzzy("stel stoen", 1),
+            {"steel": (1, 5), "stone": (1, 4)},
+        )
+        self.assertDictEqual(
+            term_dictionary.lookup_keywords_fuzzy("stel", 1, ["2"]),
+            {"steel": (1, 2)},
+        )
+
+
+def _reset_term_dictionaries(test_case):
+    """Reset the term dictionaries of the process for the duration of a test.
+
+    Args:
+        test_case:
+
+    Returns:
+    """
+    patcher = patch.dict(
+        term_dictionary._term_dictionary,
+        {
+            "generation": None,
+            "dictionary": None,
+            "search_operator_dictionaries": None,
+            "reload_thread": None,
+        },
+    )
+    patcher.start()
+    test_case.addCleanup(patcher.stop)
+
+
+def _wait_for_reload():
+    """Wait for the background reload of the term dictionaries.
+
+    Returns:
+    """
+    reload_thread = term_dictionary._term_dictionary["reload_thread"]
+    if reload_thread is not None:
+        reload_thread.join(timeout=5)
+
+
+@patch(
+    "core_explore_keyword_app.components.keyword_term.api"
+    ".get_all_search_operator_entries",
+    return_value=[],
+)
+class TestGetTermDictionary(TestCase):
+    """Test Get Term Dictionary"""
+
+    def setUp(self):
+        """setUp"""
+
+        _reset_term_dictionaries(self)
+
+    @patch.object(term_dictionary, "get_generation")
+    @patch(
+        "core_explore_keyword_app.components.keyword_term.api.get_all_entries"
+    )
+    def test_dictionary_is_loaded_once_per_generation(
+        self, mock_get_all_entries, mock_get_generation, _
+    ):
+        """test_dictionary_is_loaded_once_per_generation"""
+
+        mock_get_all_entries.return_value = [("steel", 1, 1)]
+        mock_get_generation.return_value = "generation_1"
+        first_dictionary = get_term_dictionary()
+        get_term_dictionary()
+        self.assertEqual(mock_get_all_entries.call_count, 1)
+
+        mock_get_generation.return_value = "generation_2"
+        mock_get_all_entries.return_value = [("steel", 1, 1), ("iron", 1, 1)]
+        get_term_dictionary()
+        _wait_for_reload()
+
+        self.assertIsNot(get_term_dictionary(), first_dictionary)
+        self.assertEqual(len(get_term_dictionary()), 2)
+        self.assertEqual(mock_get_all_entries.call_count, 2)
+
+    @patch.object(term_dictionary, "get_generation")
+    @patch(
+        "core_explore_keyword_app.components.keyword_term.api.get_all_entries"
+    )
+    def test_dictionary_is_loaded_for_a_none_generation(
+        self, mock_get_all_entries, mock_get_generation, _
+    ):
+        """test_dictionary_is_loaded_for_a_none_generation"""
+
+        mock_get_all_entries.return_value = [("steel", 1, 1)]
+        mock_get_generation.return_value = None
+
+        self.assertEqual(len(get_term_dictionary()), 1)
+        self.assertEqual(len(get_search_operator_value_dictionary(1)), 0)
+
+    @patch.object(term_dictionary, "get_generation")
+    @patch(
+        "core_explore_keyword_app.components.keyword_term.api.get_all_entries"
+    )
+    def test_stale_dictionary_is_served_while_reloading(
+        self, mock_get_all_entries, mock_get_generation, _
+    ):
+        """test_stale_dictionary_is_served_while_reloading"""
+
+        mock_get_all_entries.return_value = [("steel", 1, 1)]
+        mock_get_generation.return_value = "generation_1"
+        first_dictionary = get_term_dictionary()
+
+        reload_started = threading.Event()
+        reload_released = threading.Event()
+
+        def get_all_entries():
+            reload_started.set()
+            reload_released.wait(timeout=5)
+            return [("iron", 1, 1)]
+
+        mock_get_all_entries.side_effect = get_all_entries
+        mock_get_generation.return_value = "generation_2"
+        self.assertIs(get_term_dictionary(), first_dictionary)
+        self.assertTrue(reload_started.wait(timeout=5))
+        self.assertIs(get_term_dictionary(), first_dictionary)
+        self.assertEqual(get_term_dictionary_generation(), "generation_1")
+
+        reload_released.set()
+        _wait_for_reload()
+
+        self.assertListEqual(get_term_dictionary().terms, ["iron"])
+        self.assertEqual(get_term_dictionary_generation(), "generation_2")
+        self.assertEqual(mock_get_all_entries.call_count, 2)
+
+
+class TestGetSearchOperatorValueDictionary(TestCase):
+    """Test Get Search Operator Value Dictionary"""
+
+    def setUp(self):
+        """setUp"""
+
+        _reset_term_dictionaries(self)
+
+    @patch.object(term_dictionary, "get_generation")
+    @patch(
+        "core_explore_keyword_app.components.keyword_term.api"
+        ".get_all_search_operator_entries"
+    )
+    @patch(
+        "core_explore_keyword_app.components.keyword_term.api.get_all_entries"
+    )
+    def test_returns_dictionary_of_search_operator(
+        self,
+        mock_get_all_entries,
+        mock_get_all_search_operator_entries,
+        mock_get_generation,
+    ):
+        """test_returns_dictionary_of_search_operator"""
+
+        mock_get_all_entries.return_value = []
+        mock_get_all_search_operator_entries.return_value = [
+            (1, "Steel", 1, 2),
+            (2, "Stone", 1, 1),
+        ]
+        mock_get_generation.return_value = "generation_operators"
+
+        self.assertDictEqual(
+            dict(get_search_operator_value_dictionary(1).lookup("st")),
+            {"Steel": 2},
+        )
+        self.assertEqual(len(get_search_operator_value_dictionary(3)), 0)
@@ -4,14 +4,22 @@ import json
 from unittest import TestCase
 from unittest.mock import MagicMock, patch
 
+from django.http import HttpResponse, HttpResponseBadRequest
 from django.test import RequestFactory
 from rest_framework import status
 
 from core_explore_common_app.constants import LOCAL_QUERY_NAME
 from core_explore_keyword_app.views.user.ajax import (
+    CreatePersistentQueryUrlKeywordView,
+    SearchKeywordView,
     SuggestionsKeywordSearchView,
     _get_local_data_source,
 )
+from core_explore_keyword_app.utils.search_operator_registry import (
+    SearchOperatorRegistry,
+)
+from core_explore_keyword_app.utils.suggestions import suggestion_cache
+from core_explore_keyword_app.utils.term_dictionary import TermDictionary
 from core_main_app.commons.exceptions import QueryError, DoesNotExist
 from core_main_app.settings import SERVER_URI
 from core_main_app.utils.tests_tools.MockUser import create_mock_user
@@ -39,6 +47,7 @@ class TestSuggestionsKeywordSearchViewPost(TestCase):
         """setUp"""
         self.user.has_perm = MagicMock()
         self.user.has_perm.return_value = True
+        suggestion_cache.clear()
 
     def _send_post_request(self):
         """_send_post_request"""
@@ -69,18 +78,16 @@ class TestSuggestionsKeywordSearchViewPost(TestCase):
 
         self.assertEquals(response.status_code, status.HTTP_400_BAD_REQUEST)
 
-    @patch(
-        "core_explore_keyword_app.views.user.ajax.template_version_manager_api.get_by_id_list"
-    )
+    @patch("core_explore_keyword_app.views.user.ajax.get_template_ids")
     @patch("core_explore_keyword_app.views.user.ajax.sanitize_value")
     @patch("core_explore_keyword_app.views.user.ajax.KeywordForm")
     def test_template_not_found_returns_400(
-        self, mock_keyword_form, mock_sanitize_value, mock_template_get_by_id
+        self, mock_keyword_form, mock_sanitize_value, mock_get_template_ids
     ):
         """test_template_not_found_returns_400"""
         mock_keyword_form.return_value = MagicMock()
         mock_sanitize_value.return_value = None
-        mock_template_get_by_id.side_effect = DoesNotExist(
+        mock_get_template_ids.side_effect = DoesNotExist(
             "mock_does_not_exist_error"
         )
 
@@ -89,22 +96,20 @@ class TestSuggestionsKeywordSearchViewPost(TestCase):
         self.assertEquals(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     @patch("core_explore_keyword_app.views.user.ajax.query_api.get_by_id")
-    @patch(
-        "core_explore_keyword_app.views.user.ajax.template_version_manager_api.get_by_id_list"
-    )
+    @patch("core_explore_keyword_app.views.user.ajax.get_template_ids")
     @patch("core_explore_keyword_app.views.user.ajax.sanitize_value")
     @patch("core_explore_keyword_app.views.user.ajax.KeywordForm")
     def test_query_not_found_returns_400(
         self,
         mock_keyword_form,
         mock_sanitize_value,
-        mock_template_get_by_id,
+        mock_get_template_ids,
         mock_query_get_by_id,
     ):
         """test_query_not_found_returns_400"""
         mock_keyword_form.return_value = MagicMock()
         mock_sanitize_value.return_value = None
-        mock_template_get_by_id.return_value = []
+        mock_get_template_ids.return_value = []
         mock_query_get_by_id.side_effect = DoesNotExist(
             "mock_does_not_exist_error"
         )
@@ -115,23 +120,21 @@ class TestSuggestionsKeywordSearchViewPost(TestCase):
 
     @patch("core_explore_keyword_app.views.user.ajax._get_local_data_source")
     @patch("core_explore_keyword_app.views.user.ajax.query_api.get_by_id")
-    @patch(
-        "core_explore_keyword_app.views.user.ajax.template_version_manager_api.get_by_id_list"
-    )
+    @patch("core_explore_keyword_app.views.user.ajax.get_template_ids")
     @patch("core_explore_keyword_app.views.user.ajax.sanitize_value")
     @patch("core_explore_keyword_app.views.user.ajax.KeywordForm")
     def test_get_local_data_source_fails_returns_400(
         self,
         mock_keyword_form,
         mock_sanitize_value,
-        mock_template_get_by_id,
+        mock_get_template_ids,
         mock_query_get_by_id,
         mock_get_local_data_source,
     ):
         """test_get_local_data_source_fails_returns_400"""
         mock_keyword_form.return_value = MagicMock()
         mock_sanitize_value.return_value = None
-        mock_template_get_by_id.return_value = []
+        mock_get_template_ids.return_value = []
         mock_query_get_by_id.return_value = MagicMock()
         mock_get_local_data_source.side_effect = Exception(
             "mock_get_local_data_source_exception"
@@ -146,16 +149,14 @@ class TestSuggestionsKeywordSearchViewPost(TestCase):
     )
     @patch("core_explore_keyword_app.views.user.ajax._get_local_data_source")
     @patch("core_explore_keyword_app.views.user.ajax.query_api.get_by_id")
-    @patch(
-        "core_explore_keyword_app.views.user.ajax.template_version_manager_api.get_by_id_list"
-    )
+    @patch("core_explore_keyword_app.views.user.ajax.get_template_ids")
     @patch("core_explore_keyword_app.views.user.ajax.sanitize_value")
     @patch("core_explore_keyword_app.views.user.ajax.KeywordForm")
     def test_get_query_prepared_fails_returns_400(
         self,
         mock_keyword_form,
         mock_sanitize_value,
-        mock_template_get_by_id,
+        mock_get_template_ids,
         mock_query_get_by_id,
         mock_get_local_data_source,
         mock_get_query_prepared,
@@ -163,7 +164,7 @@ class TestSuggestionsKeywordSearchViewPost(TestCase):
         """test_get_query_prepared_fails_returns_400"""
         mock_keyword_form.return_value = MagicMock()
         mock_sanitize_value.return_value = None
-        mock_template_get_by_id.return_value = []
+        mock_get_template_ids.return_value = []
         mock_query_get_by_id.return_value = MagicMock()
         mock_get_local_data_source.return_value = {
             "query_options": {},
@@ -185,16 +186,14 @@ class TestSuggestionsKeywordSearchViewPost(TestCase):
     )
     @patch("core_explore_keyword_app.views.user.ajax._get_local_data_source")
     @patch("core_explore_keyword_app.views.user.ajax.query_api.get_by_id")
-    @patch(
-        "core_explore_keyword_app.views.user.ajax.template_version_manager_api.get_by_id_list"
-    )
+    @patch("core_explore_keyword_app.views.user.ajax.get_template_ids")
     @patch("core_explore_keyword_app.views.user.ajax.sanitize_value")
     @patch("core_explore_keyword_app.views.user.ajax.KeywordForm")
     def test_extract_suggestions_fails_returns_400(
         self,
         mock_keyword_form,
         mock_sanitize_value,
-        mock_template_get_by_id,
+        mock_get_template_ids,
         mock_query_get_by_id,
         mock_get_local_data_source,
         mock_get_query_prepared,
@@ -203,7 +202,7 @@ class TestSuggestionsKeywordSearchViewPost(TestCase):
         """test_extract_suggestions_fails_returns_400"""
         mock_keyword_form.return_value = MagicMock()
         mock_sanitize_value.return_value = None
-        mock_template_get_by_id.return_value = []
+        mock_get_template_ids.return_value = []
         mock_query_get_by_id.return_value = MagicMock()
         mock_get_local_data_source.return_value = {
             "query_options": {},
@@ -227,16 +226,14 @@ class TestSuggestionsKeywordSearchViewPost(TestCase):
     )
     @patch("core_explore_keyword_app.views.user.ajax._get_local_data_source")
     @patch("core_explore_keyword_app.views.user.ajax.query_api.get_by_id")
-    @patch(
-        "core_explore_keyword_app.views.user.ajax.template_version_manager_api.get_by_id_list"
-    )
+    @patch("core_explore_keyword_app.views.user.ajax.get_template_ids")
     @patch("core_explore_keyword_app.views.user.ajax.sanitize_value")
     @patch("core_explore_keyword_app.views.user.ajax.KeywordForm")
     def test_empty_dict_results_returns_200(
         self,
         mock_keyword_form,
         mock_sanitize_value,
-        mock_template_get_by_id,
+        mock_get_template_ids,
         mock_query_get_by_id,
         mock_get_local_data_source,
         mock_get_query_prepared,
@@ -246,7 +243,7 @@ class TestSuggestionsKeywordSearchViewPost(TestCase):
         """test_empty_dict_results_returns_200"""
         mock_keyword_form.return_value = MagicMock()
         mock_sanitize_value.return_value = None
-        mock_template_get_by_id.return_value = []
+        mock_get_template_ids.return_value = []
         mock_query_get_by_id.return_value = MagicMock()
         mock_get_local_data_source.return_value = {
             "query_options": {},
@@ -269,16 +266,14 @@ class TestSuggestionsKeywordSearchViewPost(TestCase):
     )
     @patch("core_explore_keyword_app.views.user.ajax._get_local_data_source")
     @patch("core_explore_keyword_app.views.user.ajax.query_api.get_by_id")
-    @patch(
-        "core_explore_keyword_app.views.user.ajax.template_version_manager_api.get_by_id_list"
-    )
+    @patch("core_explore_keyword_app.views.user.ajax.get_template_ids")
     @patch("core_explore_keyword_app.views.user.ajax.sanitize_value")
     @patch("core_explore_keyword_app.views.user.ajax.KeywordForm")
     def test_dict_results_returns_suggestions(
         self,
         mock_keyword_form,
         mock_sanitize_value,
-        mock_template_get_by_id,
+        mock_get_template_ids,
         mock_query_get_by_id,
         mock_get_local_data_source,
         mock_get_query_prepared,
@@ -288,7 +283,7 @@ class TestSuggestionsKeywordSearchViewPost(TestCase):
         """test_dict_results_returns_suggestions"""
         mock_keyword_form.return_value = MagicMock()
         mock_sanitize_value.return_value = None
-        mock_template_get_by_id.return_value = []
+        mock_get_template_ids.return_value = []
         mock_query_get_by_id.return_value = MagicMock()
         mock_get_local_data_source.return_value = {
             "query_options": {},
@@ -302,6 +297,507 @@ class TestSuggestionsKeywordSearchViewPost(TestCase):
 
         self.assertEquals(json.loads(response.content), {"suggestions": []})
 
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.SuggestionsKeywordSearchView._get_suggestions_from_query"
+    )
+    @patch("core_explore_common_app.components.query.api.upsert")
+    @patch("core_explore_keyword_app.views.user.ajax.query_api.get_by_id")
+    @patch("core_explore_keyword_app.views.user.ajax.get_template_ids")
+    @patch("core_explore_keyword_app.views.user.ajax.sanitize_value")
+    @patch("core_explore_keyword_app.views.user.ajax.KeywordForm")
+    def test_suggestions_without_query_do_not_create_query(
+        self,
+        mock_keyword_form,
+        mock_sanitize_value,
+        mock_get_template_ids,
+        mock_query_get_by_id,
+        mock_upsert,
+        mock_get_suggestions_from_query,
+    ):
+        """test_suggestions_without_query_do_not_create_query"""
+        mock_keyword_form.return_value.cleaned_data = {"query_id": ""}
+        mock_sanitize_value.return_value = None
+        mock_get_template_ids.return_value = []
+        mock_get_suggestions_from_query.return_value = ["mock_suggestion"]
+
+        response = self._send_post_request()
+
+        self.assertEqual(
+            json.loads(response.content), {"suggestions": ["mock_suggestion"]}
+        )
+        self.assertFalse(mock_query_get_by_id.called)
+        self.assertFalse(mock_upsert.called)
+        local_data_source = mock_get_suggestions_from_query.call_args.args[2]
+        self.assertEqual(local_data_source["name"], LOCAL_QUERY_NAME)
+        self.assertEqual(local_data_source["url_query"], SERVER_URI)
+
+    @patch("core_explore_keyword_app.views.user.ajax.get_term_dictionary")
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.EXPLORE_KEYWORD_TERM_DICTIONARY_ENABLED",
+        True,
+    )
+    @patch("core_explore_keyword_app.views.user.ajax.query_api.get_by_id")
+    @patch("core_explore_keyword_app.views.user.ajax.get_template_ids")
+    @patch("core_explore_keyword_app.views.user.ajax.sanitize_value")
+    @patch("core_explore_keyword_app.views.user.ajax.KeywordForm")
+    def test_term_dictionary_returns_suggestions_without_query(
+        self,
+        mock_keyword_form,
+        mock_sanitize_value,
+        mock_get_template_ids,
+        mock_query_get_by_id,
+        mock_get_term_dictionary,
+    ):
+        """test_term_dictionary_returns_suggestions_without_query"""
+        mock_keyword_form.return_value = MagicMock()
+        mock_sanitize_value.return_value = None
+        mock_get_template_ids.return_value = []
+        mock_get_term_dictionary.return_value = TermDictionary(
+            [("mock_term", 1, 1), ("mock_terms", 1, 3), ("other", 1, 5)]
+        )
+
+        response = self._send_post_request()
+
+        self.assertFalse(mock_query_get_by_id.called)
+        self.assertEquals(
+            json.loads(response.content),
+            {
+                "suggestions": [
+                    {"label": "mock_terms", "value": "mock_terms"},
+                    {"label": "mock_term", "value": "mock_term"},
+                ]
+            },
+        )
+
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.get_term_dictionary_generation"
+    )
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.SuggestionsKeywordSearchView._get_suggestions_from_term_dictionary"
+    )
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.EXPLORE_KEYWORD_TERM_DICTIONARY_ENABLED",
+        True,
+    )
+    @patch("core_explore_keyword_app.views.user.ajax.get_template_ids")
+    @patch("core_explore_keyword_app.views.user.ajax.sanitize_value")
+    @patch("core_explore_keyword_app.views.user.ajax.KeywordForm")
+    def test_reloaded_term_dictionary_is_not_served_from_cache(
+        self,
+        mock_keyword_form,
+        mock_sanitize_value,
+        mock_get_template_ids,
+        mock_get_suggestions_from_term_dictionary,
+        mock_get_term_dictionary_generation,
+    ):
+        """test_reloaded_term_dictionary_is_not_served_from_cache"""
+        mock_keyword_form.return_value = MagicMock()
+        mock_sanitize_value.return_value = None
+        mock_get_template_ids.return_value = []
+        mock_get_term_dictionary_generation.return_value = "generation_1"
+        mock_get_suggestions_from_term_dictionary.return_value = [
+            {"label": "old_term", "value": "old_term"}
+        ]
+        self._send_post_request()
+        self._send_post_request()
+        self.assertEqual(
+            mock_get_suggestions_from_term_dictionary.call_count, 1
+        )
+
+        mock_get_term_dictionary_generation.return_value = "generation_2"
+        mock_get_suggestions_from_term_dictionary.return_value = [
+            {"label": "new_term", "value": "new_term"}
+        ]
+        response = self._send_post_request()
+
+        self.assertEqual(
+            mock_get_suggestions_from_term_dictionary.call_count, 2
+        )
+        self.assertEquals(
+            json.loads(response.content),
+            {"suggestions": [{"label": "new_term", "value": "new_term"}]},
+        )
+
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.SuggestionsKeywordSearchView._get_suggestions_from_query"
+    )
+    @patch("core_explore_keyword_app.views.user.ajax._get_local_data_source")
+    @patch("core_explore_keyword_app.views.user.ajax.query_api.get_by_id")
+    @patch("core_explore_keyword_app.views.user.ajax.get_template_ids")
+    @patch("core_explore_keyword_app.views.user.ajax.sanitize_value")
+    @patch("core_explore_keyword_app.views.user.ajax.KeywordForm")
+    def test_same_request_is_served_from_cache(
+        self,
+        mock_keyword_form,
+        mock_sanitize_value,
+        mock_get_template_ids,
+        mock_query_get_by_id,
+        mock_get_local_data_source,
+        mock_get_suggestions_from_query,
+    ):
+        """test_same_request_is_served_from_cache"""
+        mock_keyword_form.return_value = MagicMock()
+        mock_sanitize_value.return_value = None
+        mock_get_template_ids.return_value = []
+        mock_query_get_by_id.return_value = MagicMock()
+        mock_get_local_data_source.return_value = {
+            "query_options": {},
+            "order_by_field": "title",
+        }
+        mock_get_suggestions_from_query.return_value = [
+            {"label": "mock_term", "value": "mock_term"}
+        ]
+
+        self._send_post_request()
+        response = self._send_post_request()
+
+        self.assertEqual(mock_get_suggestions_from_query.call_count, 1)
+        self.assertEquals(
+            json.loads(response.content),
+            {"suggestions": [{"label": "mock_term", "value": "mock_term"}]},
+        )
+
+    @patch("core_explore_keyword_app.views.user.ajax.get_term_dictionary")
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.EXPLORE_KEYWORD_SUGGESTIONS_FUZZY_DISTANCE",
+        1,
+    )
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.EXPLORE_KEYWORD_TERM_DICTIONARY_ENABLED",
+        True,
+    )
+    @patch("core_explore_keyword_app.views.user.ajax.get_template_ids")
+    @patch("core_explore_keyword_app.views.user.ajax.sanitize_value")
+    @patch("core_explore_keyword_app.views.user.ajax.KeywordForm")
+    def test_fuzzy_suggestions_follow_prefix_suggestions(
+        self,
+        mock_keyword_form,
+        mock_sanitize_value,
+        mock_get_template_ids,
+        mock_get_term_dictionary,
+    ):
+        """test_fuzzy_suggestions_follow_prefix_suggestions"""
+        mock_keyword_form.return_value = MagicMock()
+        mock_sanitize_value.return_value = None
+        mock_get_template_ids.return_value = []
+        mock_get_term_dictionary.return_value = TermDictionary(
+            [("mock_terms", 1, 1), ("mock_tern", 1, 3)]
+        )
+
+        response = self._send_post_request()
+
+        self.assertEquals(
+            json.loads(response.content),
+            {
+                "suggestions": [
+                    {"label": "mock_terms", "value": "mock_terms"},
+                    {"label": "mock_tern", "value": "mock_tern"},
+                ]
+            },
+        )
+
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.get_search_operator_value_dictionary"
+    )
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.get_search_operator_registry"
+    )
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.EXPLORE_KEYWORD_TERM_DICTIONARY_ENABLED",
+        True,
+    )
+    @patch("core_explore_keyword_app.views.user.ajax.get_template_ids")
+    @patch("core_explore_keyword_app.views.user.ajax.sanitize_value")
+    @patch("core_explore_keyword_app.views.user.ajax.KeywordForm")
+    def test_search_operator_returns_value_suggestions(
+        self,
+        mock_keyword_form,
+        mock_sanitize_value,
+        mock_get_template_ids,
+        mock_get_search_operator_registry,
+        mock_get_search_operator_value_dictionary,
+    ):
+        """test_search_operator_returns_value_suggestions"""
+        self.data = dict(self.data, term="material:st")
+        mock_keyword_form.return_value = MagicMock()
+        mock_sanitize_value.return_value = None
+        mock_get_template_ids.return_value = []
+        mock_operator = MagicMock(id=1, dot_notation_list=["root.material"])
+        mock_operator.name = "material"
+        mock_get_search_operator_registry.return_value = (
+            SearchOperatorRegistry([mock_operator])
+        )
+        mock_get_search_operator_value_dictionary.return_value = (
+            TermDictionary(
+                [("Stone", 1, 1), ("Steel 316", 1, 3), ("Alloy", 1, 5)]
+            )
+        )
+
+        response = self._send_post_request()
+
+        mock_get_search_operator_value_dictionary.assert_called_with(1)
+        self.assertEquals(
+            json.loads(response.content),
+            {
+                "suggestions": [
+                    {
+                        "label": "material:Steel 316",
+                        "value": "material:Steel 316",
+                    },
+                    {"label": "material:Stone", "value": "material:Stone"},
+                ]
+            },
+        )
+
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.get_search_operator_registry"
+    )
+    @patch("core_explore_keyword_app.views.user.ajax.get_term_dictionary")
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.EXPLORE_KEYWORD_TERM_DICTIONARY_ENABLED",
+        True,
+    )
+    @patch("core_explore_keyword_app.views.user.ajax.get_template_ids")
+    @patch("core_explore_keyword_app.views.user.ajax.sanitize_value")
+    @patch("core_explore_keyword_app.views.user.ajax.KeywordForm")
+    def test_search_operator_names_precede_suggestions(
+        self,
+        mock_keyword_form,
+        mock_sanitize_value,
+        mock_get_template_ids,
+        mock_get_term_dictionary,
+        mock_get_search_operator_registry,
+    ):
+        """test_search_operator_names_precede_suggestions"""
+        mock_keyword_form.return_value = MagicMock()
+        mock_sanitize_value.return_value = None
+        mock_get_template_ids.return_value = []
+        mock_get_term_dictionary.return_value = TermDictionary(
+            [("mock_terms", 1, 1)]
+        )
+        mock_operator = MagicMock(dot_notation_list=["root.mock"])
+        mock_operator.name = "Mock_Term_Operator"
+        mock_other_operator = MagicMock(dot_notation_list=["root.other"])
+        mock_other_operator.name = "other"
+        mock_get_search_operator_registry.return_value = (
+            SearchOperatorRegistry([mock_operator, mock_other_operator])
+        )
+
+        response = self._send_post_request()
+
+        self.assertEquals(
+            json.loads(response.content),
+            {
+                "suggestions": [
+                    {
+                        "label": "Mock_Term_Operator:",
+                        "value": "Mock_Term_Operator:",
+                    },
+                    {"label": "mock_terms", "value": "mock_terms"},
+                ]
+            },
+        )
+
+
+class TestSearchKeywordViewPost(TestCase):
+    """Test SearchKeywordView post method"""
+
+    def setUp(self) -> None:
+        """setUp"""
+        self.user = create_mock_user(user_id=1)
+        self.user.has_perm = MagicMock()
+        self.user.has_perm.return_value = True
+        self.query = MagicMock()
+        self.query.id = 1
+        self.query.data_sources = [{"name": "Local"}, {"name": "Remote"}]
+
+    def _send_post_request(self):
+        """_send_post_request"""
+        request = RequestFactory().post(
+            "core_explore_keyword_search",
+            data={"query_id": 1, "user_id": 1, "keywords": "alloy"},
+        )
+        request.user = self.user
+
+        return SearchKeywordView().post(request)
+
+    @patch("core_explore_keyword_app.views.user.ajax.save_keyword_search")
+    def test_search_error_returns_400(self, mock_save_keyword_search):
+        """test_search_error_returns_400"""
+        mock_save_keyword_search.return_value = (None, "mock_error", None)
+
+        response = self._send_post_request()
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(json.loads(response.content)["error"], "mock_error")
+        self.assertIsNone(json.loads(response.content)["query_id"])
+
+    @patch("core_explore_keyword_app.views.user.ajax.save_keyword_search")
+    def test_search_warning_returns_400(self, mock_save_keyword_search):
+        """test_search_warning_returns_400"""
+        mock_save_keyword_search.return_value = (
+            self.query,
+            None,
+            "mock_warning",
+        )
+
+        response = self._send_post_request()
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            json.loads(response.content)["warning"], "mock_warning"
+        )
+        # the query created by the search is reused by the next one
+        self.assertEqual(json.loads(response.content)["query_id"], "1")
+
+    @patch("core_explore_keyword_app.views.user.ajax.reverse")
+    @patch("core_explore_keyword_app.views.user.ajax.get_data_source_results")
+    @patch("core_explore_keyword_app.views.user.ajax.get_data_sources_html")
+    @patch("core_explore_keyword_app.views.user.ajax.save_keyword_search")
+    def test_search_returns_first_page_of_results(
+        self,
+        mock_save_keyword_search,
+        mock_get_data_sources_html,
+        mock_get_data_source_results,
+        mock_reverse,
+    ):
+        """test_search_returns_first_page_of_results"""
+        mock_reverse.side_effect = lambda name, args: "/results/%s/%s" % tuple(
+            args
+        )
+        mock_save_keyword_search.return_value = (self.query, None, None)
+        mock_get_data_sources_html.return_value = HttpResponse(
+            json.dumps({"results": "mock_holders"})
+        )
+        mock_get_data_source_results.side_effect = [
+            HttpResponse(
+                json.dumps({"results": "mock_page", "nb_results": 1}),
+                content_type="application/json",
+            ),
+            HttpResponseBadRequest("mock_error"),
+        ]
+
+        response = self._send_post_request()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertDictEqual(
+            json.loads(response.content),
+            {
+                "query_id": "1",
+                "results": "mock_holders",
+                "data_sources": [
+                    {
+                        "url": "/results/1/0",
+                        "status": 200,
+                        "content_type": "application/json",
+                        "content": json.dumps(
+                            {"results": "mock_page", "nb_results": 1}
+                        ),
+                    },
+                    {
+                        "url": "/results/1/1",
+                        "status": 400,
+                        "content_type": "text/html; charset=utf-8",
+                        "content": "mock_error",
+                    },
+                ],
+            },
+        )
+        request = mock_get_data_sources_html.call_args.args[0]
+        self.assertEqual(request.POST["query_id"], "1")
+        self.assertListEqual(
+            [
+                call_args.args[1:] + (call_args.kwargs["page"],)
+                for call_args in mock_get_data_source_results.call_args_list
+            ],
+            [("1", 0, 1), ("1", 1, 1)],
+        )
+
+    @patch("core_explore_keyword_app.views.user.ajax.get_data_sources_html")
+    @patch("core_explore_keyword_app.views.user.ajax.save_keyword_search")
+    def test_results_error_returns_400(
+        self, mock_save_keyword_search, mock_get_data_sources_html
+    ):
+        """test_results_error_returns_400"""
+        mock_save_keyword_search.return_value = (self.query, None, None)
+        mock_get_data_sources_html.return_value = HttpResponseBadRequest(
+            "The query does not exist."
+        )
+
+        response = self._send_post_request()
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class TestCreatePersistentQueryUrlKeywordViewCreatePersistentQuery(TestCase):
+    """Test CreatePersistentQueryUrlKeywordView _create_persistent_query"""
+
+    def setUp(self) -> None:
+        """setUp"""
+
+        self.query = MagicMock(
+            user_id="1", content=json.dumps({"$text": {"$search": "x"}})
+        )
+        self.query.templates.values_list.return_value = [1]
+
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.PersistentQueryKeyword.get_unnamed_by_content"
+    )
+    def test_reuses_persistent_query_with_same_content(
+        self, get_unnamed_by_content
+    ):
+        """test_reuses_persistent_query_with_same_content"""
+
+        persistent_query = MagicMock()
+        get_unnamed_by_content.return_value = persistent_query
+
+        self.assertEqual(
+            CreatePersistentQueryUrlKeywordView._create_persistent_query(
+                self.query
+            ),
+            persistent_query,
+        )
+        get_unnamed_by_content.assert_called_once_with(
+            "1", {"$text": {"$search": "x"}}, [1]
+        )
+
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.PersistentQueryKeyword.get_unnamed_by_content"
+    )
+    def test_creates_persistent_query_for_new_content(
+        self, get_unnamed_by_content
+    ):
+        """test_creates_persistent_query_for_new_content"""
+
+        get_unnamed_by_content.return_value = None
+
+        persistent_query = (
+            CreatePersistentQueryUrlKeywordView._create_persistent_query(
+                self.query
+            )
+        )
+
+        self.assertIsNone(persistent_query.id)
+        self.assertEqual(persistent_query.user_id, "1")
+        self.assertEqual(persistent_query.content, self.query.content)
+
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.PersistentQueryKeyword.get_unnamed_by_content"
+    )
+    def test_anonymous_query_is_not_reused(self, get_unnamed_by_content):
+        """test_anonymous_query_is_not_reused"""
+
+        self.query.user_id = None
+
+        persistent_query = (
+            CreatePersistentQueryUrlKeywordView._create_persistent_query(
+                self.query
+            )
+        )
+
+        self.assertIsNone(persistent_query.id)
+        get_unnamed_by_content.assert_not_called()
+
 
 class TestGetLocalDataSource(TestCase):
     """TestGetLocalDataSource"""
@@ -329,3 +825,79 @@ class TestGetLocalDataSource(TestCase):
         mock_query.data_sources = [{"name": "test", "url_query": SERVER_URI}]
         data_source = _get_local_data_source(mock_query)
         self.assertIsNone(data_source)
+
+
+class TestSuggestionsKeywordSearchViewGetQueryPrepared(TestCase):
+    """Test SuggestionsKeywordSearchView _get_query_prepared method"""
+
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.template_api.get_all_accessible_by_id_list"
+    )
+    def test_returns_json_query_without_saving(
+        self, mock_get_all_accessible_by_id_list
+    ):
+        """test_returns_json_query_without_saving"""
+        mock_template = MagicMock(id=1, hash="mock_hash")
+        mock_get_all_accessible_by_id_list.return_value = [mock_template]
+        local_data_source = {
+            "query_options": {"visibility": "public"},
+            "order_by_field": "title",
+        }
+
+        json_query = SuggestionsKeywordSearchView._get_query_prepared(
+            "mock_term", local_data_source, MagicMock(), ["1"]
+        )
+
+        self.assertEqual(
+            json.loads(json_query["templates"]),
+            [{"id": 1, "hash": "mock_hash"}],
+        )
+        self.assertEqual(
+            json.loads(json_query["options"]), {"visibility": "public"}
+        )
+        self.assertEqual(json_query["order_by_field"], "title")
+        self.assertIn("mock_term", json_query["query"])
+
+
+class TestSuggestionsKeywordSearchViewExtractSuggestion(TestCase):
+    """Test SuggestionsKeywordSearchView _extract_suggestion_from_results method"""
+
+    def test_returns_ranked_suggestions(self):
+        """test_returns_ranked_suggestions"""
+        results = [
+            MagicMock(content="<a>alloy</a><b>steel</b>"),
+            MagicMock(content="<a>Steel</a><b>unrelated</b>"),
+        ]
+        suggestions = []
+
+        SuggestionsKeywordSearchView._extract_suggestion_from_results(
+            results, "st, al", suggestions
+        )
+
+        self.assertListEqual(
+            suggestions,
+            [
+                {"label": "steel", "value": "steel"},
+                {"label": "alloy", "value": "alloy"},
+            ],
+        )
+
+    @patch(
+        "core_explore_keyword_app.views.user.ajax.EXPLORE_KEYWORD_SUGGESTIONS_LIMIT",
+        1,
+    )
+    def test_suggestions_are_limited(self):
+        """test_suggestions_are_limited"""
+        results = [
+            MagicMock(content="<a>alloy</a><b>steel</b>"),
+            MagicMock(content="<a>Steel</a><b>unrelated</b>"),
+        ]
+        suggestions = []
+
+        SuggestionsKeywordSearchView._extract_suggestion_from_results(
+            results, "st, al", suggestions
+        )
+
+        self.assertListEqual(
+            suggestions, [{"label": "steel", "value": "steel"}]
+        )
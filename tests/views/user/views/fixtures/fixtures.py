@@ -0,0 +1,79 @@
+""" Fixtures files for user views
+"""
+from core_main_app.components.template.models import Template
+from core_main_app.components.template_version_manager.models import (
+    TemplateVersionManager,
+)
+from core_main_app.utils.integration_tests.fixture_interface import (
+    FixtureInterface,
+)
+from core_explore_common_app.components.query.models import Query
+from core_explore_keyword_app.components.query_access import (
+    api as query_access_api,
+)
+
+
+class QueryFixtures(FixtureInterface):
+    """Query fixtures, with many versions of a few templates"""
+
+    version_manager_collection = None
+    template_collection = None
+    query = None
+
+    def insert_data(self, version_manager_count=10, version_count=10):
+        """Insert a query and its templates.
+
+        Args:
+            version_manager_count:
+            version_count:
+
+        Returns:
+
+        """
+        self.generate_template_collection(version_manager_count, version_count)
+        self.generate_query()
+
+    def generate_template_collection(
+        self, version_manager_count, version_count
+    ):
+        """Generate template version managers and their templates.
+
+        Args:
+            version_manager_count:
+            version_count:
+
+        Returns:
+
+        """
+        self.version_manager_collection = []
+        self.template_collection = []
+        for version_manager_index in range(version_manager_count):
+            version_manager = TemplateVersionManager(
+                title="template_%d" % version_manager_index,
+                user="1",
+                _cls=TemplateVersionManager._class_name,
+            )
+            version_manager.save()
+            self.version_manager_collection.append(version_manager)
+            for version_index in range(version_count):
+                template = Template(
+                    filename="template_%d_%d.xsd"
+                    % (version_manager_index, version_index),
+                    user="1",
+                    _hash="hash_%d_%d"
+                    % (version_manager_index, version_index),
+                    version_manager=version_manager,
+                )
+                template.save()
+                self.template_collection.append(template)
+
+    def generate_query(self):
+        """Generate a query on all the templates.
+
+        Returns:
+
+        """
+        self.query = Query(user_id="1", content="{}")
+        self.query.save()
+        self.query.templates.set(self.template_collection)
+        query_access_api.record_access(self.query)
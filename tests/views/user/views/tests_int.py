@@ -0,0 +1,310 @@
+""" Integration tests for user views
+"""
+import json
+
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import RequestFactory
+from django.test.utils import CaptureQueriesContext
+
+from core_main_app.utils.integration_tests.integration_base_test_case import (
+    IntegrationBaseTestCase,
+)
+from core_main_app.utils.query.constants import VISIBILITY_OPTION
+from core_main_app.utils.tests_tools.MockUser import create_mock_user
+from core_explore_common_app.settings import QUERY_VISIBILITY
+from core_explore_keyword_app.components.query_access.models import (
+    QueryAccess,
+)
+from core_explore_keyword_app.views.user.views import KeywordSearchView
+from tests.components.search_operator.fixtures.fixtures import (
+    SearchOperatorFixtures,
+)
+from tests.views.user.views.fixtures.fixtures import QueryFixtures
+
+
+class TestKeywordSearchViewBuildQuery(IntegrationBaseTestCase):
+    """Test Keyword Search View Build Query"""
+
+    fixture = SearchOperatorFixtures()
+
+    def test_search_operators_are_resolved_with_one_query(self):
+        """test_search_operators_are_resolved_with_one_query"""
+
+        keyword_list = [
+            "operator%d:value%d" % (index, index) for index in range(10)
+        ]
+
+        with self.assertNumQueries(1):
+            query = json.loads(KeywordSearchView._build_query(keyword_list))
+
+        self.assertEqual(len(query["$and"]), 10)
+        self.assertDictEqual(
+            query["$and"][0],
+            {
+                "$or": [
+                    {"root.element0": "value0"},
+                    {"root.element0.#text": "value0"},
+                ]
+            },
+        )
+
+    def test_unknown_search_operator_is_a_keyword(self):
+        """test_unknown_search_operator_is_a_keyword"""
+
+        query = json.loads(
+            KeywordSearchView._build_query(
+                ["operator0:value", "unknown:value"]
+            )
+        )
+
+        self.assertDictEqual(
+            query["$and"][1], {"$text": {"$search": '"unknown:value"'}}
+        )
+
+
+class TestKeywordSearchViewGet(IntegrationBaseTestCase):
+    """Test Keyword Search View Get"""
+
+    fixture = QueryFixtures()
+
+    def test_version_manager_ids_are_fetched_with_one_query(self):
+        """test_version_manager_ids_are_fetched_with_one_query"""
+
+        with self.assertNumQueries(1):
+            version_manager_ids = KeywordSearchView._get_version_manager_ids(
+                self.fixture.query
+            )
+
+        self.assertListEqual(
+            sorted(version_manager_ids),
+            sorted(
+                str(version_manager.id)
+                for version_manager in self.fixture.version_manager_collection
+            ),
+        )
+
+    def test_reopen_query_query_count_does_not_depend_on_templates(self):
+        """test_reopen_query_query_count_does_not_depend_on_templates"""
+
+        request = RequestFactory().get("/")
+        request.user = create_mock_user("1")
+
+        # query, query access, version manager ids, global and user version
+        # managers
+        with self.assertNumQueries(5):
+            context = KeywordSearchView()._get(
+                request, str(self.fixture.query.id)
+            )
+
+        self.assertIsNone(context["error"])
+        self.assertEqual(
+            len(context["search_form"].data["global_templates"]), 10
+        )
+
+    def test_reopen_query_uses_cached_template_choices(self):
+        """test_reopen_query_uses_cached_template_choices"""
+
+        request = RequestFactory().get("/")
+        request.user = create_mock_user("1")
+        KeywordSearchView()._get(request, str(self.fixture.query.id))
+
+        # query, query access, version manager ids
+        with self.assertNumQueries(3):
+            KeywordSearchView()._get(request, str(self.fixture.query.id))
+
+    def test_search_page_without_query_does_not_write(self):
+        """test_search_page_without_query_does_not_write"""
+
+        request = RequestFactory().get("/")
+        request.user = create_mock_user("1")
+        with CaptureQueriesContext(connection) as context:
+            result = KeywordSearchView()._get(request, None)
+
+        self.assertIsNone(result["error"])
+        self.assertEqual(result["query_id"], "")
+        self.assertListEqual(
+            _get_write_statements(context.captured_queries), []
+        )
+
+    @patch(
+        "core_explore_keyword_app.views.user.views.DATA_SOURCES_EXPLORE_APPS",
+        ["core_explore_federated_search_app"],
+    )
+    def test_search_page_with_data_sources_selector_creates_query(self):
+        """test_search_page_with_data_sources_selector_creates_query"""
+
+        request = RequestFactory().get("/")
+        request.user = create_mock_user("1")
+        result = KeywordSearchView()._get(request, None)
+
+        self.assertIsNone(result["error"])
+        self.assertTrue(
+            self.fixture.query.__class__.objects.filter(
+                pk=result["query_id"]
+            ).exists()
+        )
+
+
+def _get_write_statements(captured_queries):
+    """Return the write statements of a list of captured queries
+
+    Args:
+        captured_queries:
+
+    Returns:
+    """
+    return [
+        captured_query["sql"]
+        for captured_query in captured_queries
+        if captured_query["sql"].startswith(("INSERT", "UPDATE", "DELETE"))
+    ]
+
+
+class TestKeywordSearchViewPost(IntegrationBaseTestCase):
+    """Test Keyword Search View Post"""
+
+    fixture = QueryFixtures()
+
+    def setUp(self):
+        """setUp"""
+
+        super().setUp()
+        self.fixture.query.content = KeywordSearchView._build_query(["alloy"])
+        self.fixture.query.data_sources = [
+            {"name": "Local", "order_by_field": "title"}
+        ]
+        self.fixture.query.save()
+        self.data = {
+            "query_id": str(self.fixture.query.id),
+            "user_id": "1",
+            "keywords": "alloy",
+            "user_templates": [
+                str(version_manager.id)
+                for version_manager in self.fixture.version_manager_collection
+            ],
+            "order_by_field": "title",
+        }
+
+    def _post(self, data):
+        """Send a search request to the view
+
+        Args:
+            data:
+
+        Returns:
+        """
+        request = RequestFactory().post("/", data=data)
+        request.user = create_mock_user("1")
+        with CaptureQueriesContext(connection) as context:
+            result = KeywordSearchView()._post(request)
+        self.assertIsNone(result["error"])
+        self.assertIsNone(result["warning"])
+        return _get_write_statements(context.captured_queries)
+
+    def test_unchanged_search_does_not_write(self):
+        """test_unchanged_search_does_not_write"""
+
+        self.assertListEqual(self._post(self.data), [])
+
+    def test_changed_keywords_only_update_query(self):
+        """test_changed_keywords_only_update_query"""
+
+        write_statements = self._post(dict(self.data, keywords="iron"))
+
+        self.assertEqual(len(write_statements), 1)
+        self.assertTrue(write_statements[0].startswith("UPDATE"))
+        self.assertEqual(
+            self.fixture.query.__class__.objects.get(
+                pk=self.fixture.query.pk
+            ).content,
+            KeywordSearchView._build_query(["iron"]),
+        )
+
+    def test_changed_ordering_updates_query(self):
+        """test_changed_ordering_updates_query"""
+
+        write_statements = self._post(dict(self.data, order_by_field="-title"))
+
+        self.assertEqual(len(write_statements), 1)
+        self.assertTrue(write_statements[0].startswith("UPDATE"))
+
+    def test_removed_template_only_deletes_its_links(self):
+        """test_removed_template_only_deletes_its_links"""
+
+        write_statements = self._post(
+            dict(self.data, user_templates=self.data["user_templates"][1:])
+        )
+
+        self.assertEqual(len(write_statements), 1)
+        self.assertTrue(write_statements[0].startswith("DELETE"))
+        self.assertEqual(self.fixture.query.templates.count(), 90)
+
+    def test_search_without_query_creates_query(self):
+        """test_search_without_query_creates_query"""
+
+        request = RequestFactory().post(
+            "/", data=dict(self.data, query_id="", user_templates=[])
+        )
+        request.user = create_mock_user("1")
+        result = KeywordSearchView()._post(request)
+
+        self.assertIsNone(result["error"])
+        query = self.fixture.query.__class__.objects.get(pk=result["query_id"])
+        self.assertNotEqual(query.pk, self.fixture.query.pk)
+        self.assertEqual(
+            query.content, KeywordSearchView._build_query(["alloy"])
+        )
+        self.assertEqual(len(query.data_sources), 1)
+        self.assertIsNotNone(QueryAccess.get_last_access_date(query.pk))
+
+    def test_search_without_query_saves_default_query_options(self):
+        """test_search_without_query_saves_default_query_options"""
+
+        request = RequestFactory().post(
+            "/", data=dict(self.data, query_id="", user_templates=[])
+        )
+        request.user = create_mock_user("1")
+        result = KeywordSearchView()._post(request)
+
+        query = self.fixture.query.__class__.objects.get(pk=result["query_id"])
+        self.assertDictEqual(query.data_sources[0]["query_options"], {})
+
+    def test_embedded_search_without_query_saves_visibility(self):
+        """test_embedded_search_without_query_saves_visibility"""
+
+        request = RequestFactory().post(
+            "/",
+            data=dict(
+                self.data, query_id="", user_templates=[], embedded="True"
+            ),
+        )
+        request.user = create_mock_user("1")
+        result = KeywordSearchView()._post(request)
+
+        query = self.fixture.query.__class__.objects.get(pk=result["query_id"])
+        self.assertDictEqual(
+            query.data_sources[0]["query_options"],
+            {VISIBILITY_OPTION: QUERY_VISIBILITY},
+        )
+
+    @patch(
+        "core_explore_keyword_app.views.user.views."
+        "EXPLORE_ADD_DEFAULT_LOCAL_DATA_SOURCE_TO_QUERY",
+        False,
+    )
+    def test_search_without_query_follows_default_local_data_source_setting(
+        self,
+    ):
+        """test_search_without_query_follows_default_local_data_source_setting"""
+
+        request = RequestFactory().post(
+            "/", data=dict(self.data, query_id="", user_templates=[])
+        )
+        request.user = create_mock_user("1")
+        result = KeywordSearchView()._post(request)
+
+        self.assertEqual(
+            result["warning"], "Please select at least 1 data source."
+        )